@@ -0,0 +1,84 @@
+from __future__ import annotations
+import argparse
+from datetime import date
+
+from ..db.base import engine
+from ..db.money import check_money_storage
+from ..db.sharding import session_for
+from ..services import export, reports
+
+
+def _date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _report_rows(s, args: argparse.Namespace):
+    today = date.today()
+    year, month = args.year or today.year, args.month or today.month
+    start = args.date_from or reports.month_bounds(year, month)[0]
+    end = args.date_to or reports.month_bounds(year, month)[1]
+
+    user = args.user_id
+    if args.name == "balances":
+        return reports.account_balances(s, as_of=args.date_to, user_id=user)
+    if args.name == "spend":
+        return reports.monthly_spend_by_category(s, year, month, user_id=user)
+    if args.name == "cashflow":
+        return reports.cashflow(s, start, end, user_id=user)
+    if args.name == "budgets":
+        return reports.budget_utilization(s, year, month, user_id=user)
+    if args.name == "spend-series":
+        return reports.spend_by_category_series(s, start, end, args.granularity, user_id=user)
+    if args.name == "balance-series":
+        return reports.account_balance_series(s, start, end, args.granularity, user_id=user)
+    if args.name == "cashflow-series":
+        return reports.cashflow_series(s, start, end, args.granularity, user_id=user)
+    raise SystemExit(f"Unknown report {args.name!r}")
+
+
+REPORT_NAMES = ("balances", "spend", "cashflow", "budgets", "spend-series", "balance-series", "cashflow-series")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Finance Tracker Export")
+    parser.add_argument("--format", choices=export.FORMATS, help="Output format (default: from file suffix)")
+    parser.add_argument("--user", dest="user_id", help="Only this user's data (default: all users)")
+    sub = parser.add_subparsers(dest="what", required=True)
+
+    tx = sub.add_parser("transactions", help="Stream the ledger to a file")
+    tx.add_argument("output", help="Output path, or - for stdout")
+    tx.add_argument("--from", dest="date_from", type=_date)
+    tx.add_argument("--to", dest="date_to", type=_date)
+    tx.add_argument("--account", dest="account_id")
+    tx.add_argument("--category", dest="category_id")
+    tx.add_argument("--chunk-size", type=int, default=export.DEFAULT_CHUNK_SIZE)
+
+    rp = sub.add_parser("report", help="Export one report's rows")
+    rp.add_argument("name", choices=REPORT_NAMES)
+    rp.add_argument("output", help="Output path, or - for stdout")
+    rp.add_argument("--year", type=int)
+    rp.add_argument("--month", type=int)
+    rp.add_argument("--from", dest="date_from", type=_date)
+    rp.add_argument("--to", dest="date_to", type=_date)
+    rp.add_argument("--granularity", choices=reports.GRANULARITIES, default="month")
+
+    args = parser.parse_args()
+    check_money_storage(engine)
+
+    with session_for(args.user_id) as s:
+        if args.what == "transactions":
+            n = export.export_transactions(
+                s, args.output, args.format,
+                start=args.date_from, end=args.date_to,
+                account_id=args.account_id, category_id=args.category_id,
+                chunk_size=args.chunk_size, user_id=args.user_id,
+            )
+        else:
+            n = export.export_report(_report_rows(s, args), args.output, args.format)
+
+    if args.output != "-":
+        print(f"Wrote {n} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,64 @@
 from __future__ import annotations
 import argparse
+import sys
 from datetime import date
 
-from ..services import reports
+from ..db.base import engine
+from ..db.money import check_money_storage
+from ..db.sharding import factory_for
+from ..services import report_batch
+
+
+def _months(args: argparse.Namespace) -> list[tuple[int, int]]:
+    months = [report_batch.parse_month(value) for value in args.months]
+    for value in args.ranges:
+        first, sep, last = value.partition(":")
+        if not sep:
+            raise ValueError(f"Expected a range as YYYY-MM:YYYY-MM, got {value!r}")
+        months.extend(report_batch.month_range(report_batch.parse_month(first), report_batch.parse_month(last)))
+    for year in args.years:
+        months.extend((year, m) for m in range(1, 13))
+    if not months:
+        today = date.today()
+        months.append((args.year or today.year, args.month or today.month))
+    return months
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Finance Tracker Reports")
-    parser.add_argument("year", type=int, nargs="?", default=date.today().year)
-    parser.add_argument("month", type=int, nargs="?", default=date.today().month)
+    parser.add_argument("year", type=int, nargs="?", help="Single month to report (default: the current one)")
+    parser.add_argument("month", type=int, nargs="?")
+    parser.add_argument("--month", dest="months", action="append", default=[], metavar="YYYY-MM",
+                        help="A month to report; repeatable")
+    parser.add_argument("--range", dest="ranges", action="append", default=[], metavar="YYYY-MM:YYYY-MM",
+                        help="Every month in an inclusive range; repeatable")
+    parser.add_argument("--all-months", dest="years", type=int, action="append", default=[], metavar="YEAR",
+                        help="Every month of a year; repeatable")
+    parser.add_argument("--report", dest="reports", action="append", choices=report_batch.REPORTS,
+                        help="Report to run; repeatable (default: all)")
+    parser.add_argument("--format", choices=report_batch.OUTPUT_FORMATS, default="json")
+    parser.add_argument("--output", "-o", default="-", help="Output path, or - for stdout")
+    parser.add_argument("--user", dest="user_id", help="Only this user's data (default: all users)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the report result cache")
     args = parser.parse_args()
+    check_money_storage(engine)
+
+    try:
+        jobs = report_batch.jobs_for(args.reports or report_batch.REPORTS, _months(args))
+    except ValueError as e:
+        parser.error(str(e))
 
-    reports.demo_print(args.year, args.month)
+    results = report_batch.run_reports(
+        jobs, cached=not args.no_cache, user_id=args.user_id, session_factory=factory_for(args.user_id),
+    )
+    write = report_batch.WRITERS[args.format]
+    if args.output == "-":
+        write(results, sys.stdout)
+    else:
+        with open(args.output, "w", newline="" if args.format == "csv" else None, encoding="utf-8") as fp:
+            write(results, fp)
+        print(f"Wrote {len(results)} reports to {args.output}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+import argparse
+
+from ..db.base import engine
+from ..db.money import check_money_storage
+from ..services import api
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Finance Tracker headless JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    check_money_storage(engine)
+
+    api.serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
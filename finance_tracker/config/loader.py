@@ -15,6 +15,7 @@ except ModuleNotFoundError:
 class DatabaseCfg:
     url: str
     echo: bool = False
+    money_storage: str = "numeric"  # "numeric" | "cents" (integer cents for transaction amounts)
 
 
 @dataclass(frozen=True)
@@ -28,11 +29,33 @@ class LoggingCfg:
     file: str | None = None  # fine thanks to __future__ annotations
 
 
+@dataclass(frozen=True)
+class CacheCfg:
+    ttl_seconds: float = 300.0
+    max_entries: int = 256
+    disk_dir: str | None = None  # optional on-disk tier for report results
+
+
+@dataclass(frozen=True)
+class ArchiveCfg:
+    path: str | None = None  # SQLite file for archived transactions; None disables archiving
+
+
+@dataclass(frozen=True)
+class ShardingCfg:
+    enabled: bool = False
+    directory: str = "shards"  # one SQLite file per user (or per bucket) lives here
+    buckets: int = 0  # 0 = one shard per user; N = users hashed into N shard files
+
+
 @dataclass(frozen=True)
 class Cfg:
     app: AppCfg
     database: DatabaseCfg
     logging: LoggingCfg
+    cache: CacheCfg = CacheCfg()
+    sharding: ShardingCfg = ShardingCfg()
+    archive: ArchiveCfg = ArchiveCfg()
 
 
 def _project_root() -> Path:
@@ -72,6 +95,9 @@ def get_config() -> Cfg:
     app = data.get("app", {})
     db = data.get("database", {})
     lg = data.get("logging", {})
+    ch = data.get("cache", {})
+    sh = data.get("sharding", {})
+    ar = data.get("archive", {})
 
     # Allow an env override for the DB URL for testing
     raw_db_url = os.getenv("FINANCE_DB_URL", db.get("url", "sqlite:///./finance.db"))
@@ -81,11 +107,25 @@ def get_config() -> Cfg:
         database=DatabaseCfg(
             url=_abs_sqlite_url(raw_db_url),
             echo=bool(db.get("echo", False)),
+            money_storage=db.get("money_storage", "numeric"),
         ),
         logging=LoggingCfg(
             level=lg.get("level", "INFO"),
             file=lg.get("file"),
         ),
+        cache=CacheCfg(
+            ttl_seconds=float(ch.get("ttl_seconds", 300.0)),
+            max_entries=int(ch.get("max_entries", 256)),
+            disk_dir=str(_project_root() / ch["disk_dir"]) if ch.get("disk_dir") else None,
+        ),
+        sharding=ShardingCfg(
+            enabled=bool(sh.get("enabled", False)),
+            directory=str(_project_root() / sh.get("directory", "shards")),
+            buckets=int(sh.get("buckets", 0)),
+        ),
+        archive=ArchiveCfg(
+            path=str(_project_root() / ar["path"]) if ar.get("path") else None,
+        ),
     )
 
 
@@ -98,5 +138,9 @@ def db_echo() -> bool:
     return get_config().database.echo
 
 
+def archive_path() -> str | None:
+    return get_config().archive.path
+
+
 def log_level() -> str:
     return get_config().logging.level
@@ -0,0 +1,23 @@
+from __future__ import annotations
+import argparse
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.base import engine as app_engine
+from finance_tracker.db.sharding import require_main_database
+from finance_tracker.services.archive import archive_before
+from finance_tracker.services.snapshots import roll_forward
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move closed years of transactions to the archive database")
+    parser.add_argument("--before-year", type=int, required=True,
+                        help="archive every transaction dated before Jan 1 of this year")
+    args = parser.parse_args()
+    require_main_database("archive")
+
+    # Snapshots first, so balance queries keep reading only hot rows afterwards
+    with Session(app_engine) as s, s.begin():
+        roll_forward(s)
+    n = archive_before(app_engine, date(args.before_year, 1, 1))
+    print(f"Archived {n} transactions dated before {args.before_year}" if n else "Nothing to archive")
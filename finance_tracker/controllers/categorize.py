@@ -0,0 +1,21 @@
+from __future__ import annotations
+import argparse
+import time
+
+from finance_tracker.db.sharding import require_main_database, session_for
+from finance_tracker.services.categorize import DEFAULT_BATCH_SIZE, recategorize
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply category rules to the ledger")
+    parser.add_argument("--all", dest="overwrite", action="store_true",
+                        help="re-evaluate categorized transactions too (default: only uncategorized)")
+    parser.add_argument("--user", dest="user_id", help="only this user's transactions")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.user_id is None:
+        require_main_database("categorize without --user")
+    started = time.perf_counter()
+    with session_for(args.user_id) as s, s.begin():
+        n = recategorize(s, overwrite=args.overwrite, user_id=args.user_id, batch_size=args.batch_size)
+    print(f"Recategorized {n} transactions in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,27 @@
+from __future__ import annotations
+import argparse
+
+from finance_tracker.db.money import from_cents
+from finance_tracker.db.sharding import require_main_database, session_for
+from finance_tracker.services.duplicates import DEFAULT_THRESHOLD, DEFAULT_WINDOW_DAYS, find_duplicates, merge_duplicates
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report (and optionally merge) duplicate transactions")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW_DAYS, help="max days between duplicates")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="min description similarity (0-1)")
+    parser.add_argument("--user", dest="user_id", help="only this user's transactions")
+    parser.add_argument("--merge", action="store_true", help="delete the duplicates, keeping one row per group")
+    args = parser.parse_args()
+
+    if args.user_id is None:
+        require_main_database("duplicates without --user")
+    with session_for(args.user_id) as s, s.begin():
+        groups = find_duplicates(s, args.window, args.threshold, args.user_id)
+        for g in groups:
+            print(f"{g.date}  {from_cents(g.amount_cents):>12}  {g.description[:40]:<40}  "
+                  f"keep {g.keep_id}  drop {len(g.duplicate_ids)}  score {g.score}")
+        dupes = sum(len(g.duplicate_ids) for g in groups)
+        if args.merge:
+            print(f"Merged {merge_duplicates(s, groups)} duplicates in {len(groups)} groups")
+        else:
+            print(f"Found {dupes} duplicates in {len(groups)} groups (use --merge to remove them)")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import argparse
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.archive import ARCHIVE_SCHEMA, is_attached
+from finance_tracker.db.base import engine as app_engine
+from finance_tracker.db.money import stored_money_storage
+from finance_tracker.models import AppMeta
+
+STORAGES = ("numeric", "cents")
+
+# Converts every money_type() column in place, the attached archive included, in one
+# transaction. Run it, then set [database] money_storage to match; until both agree the
+# app refuses to start (db.money.check_money_storage).
+# This is a script rather than an Alembic revision because it is data-only, goes either way,
+# and is chosen per install: a revision runs once, at a fixed point in the history.
+# A new money_type() column must be added to MONEY_COLUMNS.
+MONEY_COLUMNS = (
+    (None, "transactions", "amount"),
+    (ARCHIVE_SCHEMA, "transactions", "amount"),
+    (None, "balance_snapshots", "cumulative"),
+    (None, "balance_checkpoints", "amount"),
+    (None, "category_rules", "min_amount"),
+    (None, "category_rules", "max_amount"),
+)
+
+_CONVERT = {
+    "cents": "UPDATE {table} SET {column} = CAST(ROUND({column} * 100) AS INTEGER)",
+    "numeric": "UPDATE {table} SET {column} = ROUND({column} / 100.0, 2)",
+}
+
+
+def current_storage(s: Session) -> str:
+    return stored_money_storage(s.connection())
+
+
+def migrate(engine: Engine, to: str) -> int:
+    """Convert stored amounts to `to` storage in one transaction. Returns row updates (0 if already there)."""
+    if to not in STORAGES:
+        raise ValueError(f"Unknown money storage {to!r}; expected one of {STORAGES}")
+    AppMeta.__table__.create(engine, checkfirst=True)
+    with Session(engine) as s, s.begin():
+        if current_storage(s) == to:
+            return 0
+        conn = s.connection()
+        n = 0
+        for schema, table, column in MONEY_COLUMNS:
+            if schema is not None and not is_attached(conn):
+                continue
+            if not inspect(conn).has_table(table, schema=schema):
+                continue  # e.g. balance_snapshots before controllers/snapshots first ran
+            name = f"{schema}.{table}" if schema else table
+            n += conn.execute(text(_CONVERT[to].format(table=name, column=column))).rowcount
+        s.merge(AppMeta(key="money_storage", value=to))
+    return n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Switch money column storage")
+    parser.add_argument("--to", choices=STORAGES, required=True)
+    args = parser.parse_args()
+
+    n = migrate(app_engine, args.to)
+    print(f"Converted {n} rows to {args.to} storage" if n else f"Already using {args.to} storage")
+    print(f'Now set [database] money_storage = "{args.to}" in config.toml')
@@ -0,0 +1,34 @@
+from __future__ import annotations
+import argparse
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.base import engine as app_engine
+from finance_tracker.db.sharding import require_main_database
+from finance_tracker.models import Account
+from finance_tracker.services.reconcile import DEFAULT_TOLERANCE_DAYS, read_statement_csv, reconcile
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile an account against a statement CSV (date,amount,description)")
+    parser.add_argument("account", help="account name or id")
+    parser.add_argument("statement", help="statement CSV path")
+    parser.add_argument("--tolerance", type=int, default=DEFAULT_TOLERANCE_DAYS, help="max days between statement and ledger dates")
+    parser.add_argument("--dry-run", action="store_true", help="report only; do not mark matches cleared")
+    args = parser.parse_args()
+    require_main_database("reconcile")
+
+    with open(args.statement, newline="", encoding="utf-8") as fp:
+        lines = read_statement_csv(fp)
+    with Session(app_engine) as s, s.begin():
+        account_id = s.scalar(select(Account.id).where(or_(Account.id == args.account, Account.name == args.account)))
+        if account_id is None:
+            raise SystemExit(f"Unknown account {args.account!r}")
+        result = reconcile(s, account_id, lines, args.tolerance, apply=not args.dry_run)
+        for line in result.unmatched_statement:
+            print(f"statement only  {line.date}  {line.amount:>12}  {line.description}")
+        for item in result.unmatched_ledger:
+            print(f"ledger only     {item.date}  {item.amount:>12}  {item.description}  ({item.id})")
+        verb = "would clear" if args.dry_run else "cleared"
+        print(f"{len(result.matched)} matched ({verb}), {len(result.unmatched_statement)} statement-only, "
+              f"{len(result.unmatched_ledger)} ledger-only")
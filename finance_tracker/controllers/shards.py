@@ -0,0 +1,136 @@
+from __future__ import annotations
+import argparse
+from collections import defaultdict
+from decimal import Decimal
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from finance_tracker.config.loader import get_config
+from finance_tracker.db.base import Base, engine as app_engine
+from finance_tracker.db.migrate import upgrade
+from finance_tracker.db.sharding import SHARED_TABLES, ShardRouter
+from finance_tracker.models import Account, User
+from finance_tracker.models.archive import archived_transactions
+from finance_tracker.services import reports
+from finance_tracker.services.archive import BOUNDARY_KEY, archive_boundary
+
+# Tables whose rows belong to a user through account_id. Rows with no account
+# (e.g. an unlinked goal) are copied to every shard.
+ACCOUNT_OWNED = ("transactions", "recurring_transactions", "goals", "alerts", "balance_snapshots")
+# Tables whose rows belong to a user through user_id; rows with no user apply to everyone.
+USER_OWNED = ("category_rules",)
+# Shards have no archive attached: archived transactions go back into each shard's hot
+# table, so the checkpoints standing in for them are not copied. Snapshots already count
+# archived rows, so they stay valid as they are.
+NOT_COPIED = ("balance_checkpoints",)
+
+
+def _transactions(src: Connection):
+    """The source's transactions, hot and archived alike."""
+    hot = Base.metadata.tables["transactions"]
+    if archive_boundary(Session(bind=src)) is None:
+        return hot
+    archived = select(*(archived_transactions.c[c.name] for c in hot.c))
+    return select(*hot.c).union_all(archived).subquery("transactions")
+
+
+def split(source: Engine, router: ShardRouter) -> dict[str, int]:
+    """Copy the single database into shards (idempotent). Returns rows written per shard."""
+    tables = Base.metadata.tables
+    placed = {"users", "accounts", *SHARED_TABLES, *ACCOUNT_OWNED, *USER_OWNED, *NOT_COPIED}
+    unplaced = set(tables) - placed
+    if unplaced:
+        raise RuntimeError(f"split() does not know where to copy {sorted(unplaced)}")
+
+    written: dict[str, int] = defaultdict(int)
+    with source.connect() as src:
+        sources = {name: tables[name] for name in ACCOUNT_OWNED}
+        sources["transactions"] = _transactions(src)
+        shared = {name: select(tables[name]) for name in SHARED_TABLES}
+        shared["app_meta"] = shared["app_meta"].where(tables["app_meta"].c.key != BOUNDARY_KEY)
+        shared = {name: src.execute(stmt).mappings().all() for name, stmt in shared.items()}
+
+        for uid in src.execute(select(User.id)).scalars():
+            acct_ids = select(Account.id).where(Account.user_id == uid)
+            owned = {
+                "users": select(tables["users"]).where(tables["users"].c.id == uid),
+                "accounts": select(tables["accounts"]).where(tables["accounts"].c.user_id == uid),
+            }
+            for name, t in sources.items():
+                owned[name] = select(t).where(or_(t.c.account_id.in_(acct_ids), t.c.account_id.is_(None)))
+            for name in USER_OWNED:
+                t = tables[name]
+                owned[name] = select(t).where(
+                    or_(t.c.user_id == uid, t.c.user_id.is_(None)),
+                    or_(t.c.account_id.in_(acct_ids), t.c.account_id.is_(None)),
+                )
+
+            key = router.key_for(uid)
+            with router.engine(key).begin() as dst:
+                for table in Base.metadata.sorted_tables:
+                    if table.name in shared:
+                        rows = shared[table.name]
+                    elif table.name in owned:
+                        rows = src.execute(owned[table.name]).mappings().all()
+                    else:
+                        continue
+                    if rows:
+                        dst.execute(table.insert().prefix_with("OR REPLACE"), [dict(r) for r in rows])
+                        written[key] += len(rows)
+    return dict(written)
+
+
+def migrate(router: ShardRouter, sql: str | None = None) -> list[str]:
+    """Bring every shard to the latest migration, then run optional SQL on each."""
+    done = []
+    for key, eng in router.iter_shards():
+        upgrade(eng)
+        if sql:
+            with eng.begin() as conn:
+                conn.execute(text(sql))
+        done.append(key)
+    return done
+
+
+def stats(router: ShardRouter) -> dict[str, dict[str, int]]:
+    def counts(s):
+        return {
+            name: s.execute(select(func.count()).select_from(Base.metadata.tables[name])).scalar_one()
+            for name in ("users", "accounts", "transactions")
+        }
+    return router.for_each_shard(counts)
+
+
+def total_balances(router: ShardRouter) -> dict[str, Decimal]:
+    """Cross-shard aggregate: summed account balance per shard."""
+    return router.for_each_shard(lambda s: sum((r.balance for r in reports.account_balances(s)), Decimal("0")))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shard admin tools")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("split", help="copy the main database into per-user shards")
+    m = sub.add_parser("migrate", help="apply the latest migrations (and optional SQL) to every shard")
+    m.add_argument("--sql")
+    sub.add_parser("stats", help="row counts per shard")
+    sub.add_parser("balances", help="total account balance per shard and overall")
+    args = parser.parse_args()
+
+    cfg = get_config().sharding
+    r = ShardRouter(cfg.directory, cfg.buckets)
+    if args.cmd == "split":
+        for key, n in split(app_engine, r).items():
+            print(f"{key}: {n} rows")
+        print('Now set [sharding] enabled = true in config.toml')
+    elif args.cmd == "migrate":
+        print(f"Migrated {len(migrate(r, args.sql))} shards")
+    elif args.cmd == "stats":
+        for key, c in stats(r).items():
+            print(key, c)
+    elif args.cmd == "balances":
+        totals = total_balances(r)
+        for key, bal in totals.items():
+            print(f"{key:<44} {bal:>14}")
+        print(f"{'TOTAL':<44} {sum(totals.values(), Decimal('0')):>14}")
@@ -0,0 +1,20 @@
+from __future__ import annotations
+import argparse
+
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.base import engine as app_engine
+from finance_tracker.db.sharding import require_main_database
+from finance_tracker.models import BalanceSnapshot
+from finance_tracker.services.snapshots import rebuild, roll_forward
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain month-end balance snapshots")
+    parser.add_argument("--rebuild", action="store_true", help="drop and recompute every snapshot")
+    args = parser.parse_args()
+    require_main_database("snapshots")
+
+    BalanceSnapshot.__table__.create(app_engine, checkfirst=True)
+    with Session(app_engine) as s, s.begin():
+        n = rebuild(s) if args.rebuild else roll_forward(s)
+    print(f"Wrote {n} snapshots")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from pathlib import Path
+from weakref import WeakSet
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Cold history lives in a second SQLite file ATTACHed to every connection under this
+# schema name, so one statement can read hot and archived rows together.
+ARCHIVE_SCHEMA = "archive"
+
+_attached: WeakSet[Engine] = WeakSet()
+
+
+def attach_archive(engine: Engine, path: str | Path) -> None:
+    """ATTACH the archive database (created on first use) to every new connection of engine."""
+    target = Path(path).resolve().as_posix()
+
+    @event.listens_for(engine, "connect")
+    def _attach(dbapi_conn, _record) -> None:
+        cur = dbapi_conn.cursor()
+        cur.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (target,))
+        cur.close()
+
+    _attached.add(engine)
+
+
+def is_attached(bind) -> bool:
+    """True if bind (an Engine or Connection) has the archive attached."""
+    return getattr(bind, "engine", bind) in _attached
@@ -3,7 +3,8 @@ from datetime import datetime
 import uuid
 from sqlalchemy.orm import DeclarativeBase, sessionmaker, Mapped, mapped_column
 from sqlalchemy import create_engine, String, DateTime, text
-from ..config.loader import db_url, db_echo
+from ..config.loader import db_url, db_echo, archive_path
+from .archive import attach_archive
 
 
 class Base(DeclarativeBase):
@@ -26,4 +27,6 @@ def uuid_pk():
 
 # Engine & Session
 engine = create_engine(db_url(), echo=db_echo(), future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
\ No newline at end of file
+SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+if archive_path():
+    attach_archive(engine, archive_path())
\ No newline at end of file
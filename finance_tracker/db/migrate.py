@@ -0,0 +1,25 @@
+from __future__ import annotations
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.engine import Engine
+
+# Programmatic `alembic upgrade` for databases the app creates itself (e.g. a new shard),
+# so they get the same schema and revision stamp as one built from the command line.
+
+MIGRATIONS = Path(__file__).resolve().parent.parent / "migrations"
+
+
+def alembic_config() -> Config:
+    cfg = Config()
+    cfg.set_main_option("script_location", MIGRATIONS.as_posix())
+    return cfg
+
+
+def upgrade(engine: Engine, revision: str = "head") -> None:
+    """Run the migrations up to `revision` on engine's database."""
+    cfg = alembic_config()
+    with engine.begin() as conn:
+        cfg.attributes["connection"] = conn  # picked up by migrations/env.py
+        command.upgrade(cfg, revision)
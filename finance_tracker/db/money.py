@@ -0,0 +1,76 @@
+from __future__ import annotations
+from decimal import Decimal, ROUND_HALF_UP
+
+from sqlalchemy import Integer, Numeric, cast, func, inspect, text, type_coerce
+from sqlalchemy.types import TypeDecorator
+
+from ..config.loader import get_config
+
+# Money is exact to the cent. Aggregation happens on integer cents in SQL and
+# Decimal is only created at the presentation boundary via from_cents().
+
+
+def to_cents(value) -> int:
+    return int(Decimal(str(value)).scaleb(2).quantize(Decimal(1), ROUND_HALF_UP))
+
+
+def from_cents(cents) -> Decimal:
+    return Decimal(int(cents or 0)).scaleb(-2)
+
+
+class Cents(TypeDecorator):
+    """Integer-cents storage that still reads and writes Decimal in Python."""
+    impl = Integer
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return Decimal
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else from_cents(value)
+
+
+def money_storage() -> str:
+    """'numeric' (default) or 'cents', from [database] money_storage."""
+    return get_config().database.money_storage
+
+
+def stored_money_storage(conn) -> str:
+    """What the database's amounts are stored as: app_meta.money_storage, 'numeric' when unset."""
+    if not inspect(conn).has_table("app_meta"):
+        return "numeric"
+    value = conn.execute(text("SELECT value FROM app_meta WHERE key = 'money_storage'")).scalar_one_or_none()
+    return value or "numeric"
+
+
+def check_money_storage(engine) -> None:
+    """Refuse to run against a database whose stored amounts do not match the configured storage."""
+    with engine.connect() as conn:
+        stored = stored_money_storage(conn)
+    configured = money_storage()
+    if stored != configured:
+        raise RuntimeError(
+            f"The database stores money as {stored!r} but [database] money_storage is {configured!r}; "
+            f"run controllers/migrate_money --to {configured} or set money_storage = \"{stored}\""
+        )
+
+
+def money_type():
+    """Column type for opt-in money columns, following the configured storage."""
+    return Cents() if money_storage() == "cents" else Numeric(18, 2)
+
+
+def cents_expr(col):
+    """SQL integer-cents expression for a money column, whatever its storage."""
+    if isinstance(col.type, Cents):
+        return type_coerce(col, Integer)
+    return cast(func.round(col * 100), Integer)
+
+
+def sum_cents(expr):
+    """coalesce(sum(expr), 0) typed as a plain integer; pass a cents expression."""
+    return func.coalesce(func.sum(type_coerce(expr, Integer)), 0)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Iterator, Optional, TypeVar
+from zlib import crc32
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..config.loader import get_config
+from .base import SessionLocal
+from .migrate import upgrade
+
+T = TypeVar("T")
+
+# Shared reference data (categories, budgets) is copied into every shard; everything
+# owned by a user (accounts and what hangs off them) lives only in that user's shard.
+SHARED_TABLES = ("app_meta", "categories", "budgets", "budget_items")
+
+
+def shard_key(user_id: str, buckets: int = 0) -> str:
+    """Shard name for a user: one file per user, or one per crc32 bucket when buckets > 0."""
+    if buckets > 0:
+        return f"bucket-{crc32(user_id.encode()) % buckets:03d}"
+    return f"user-{user_id}"
+
+
+def _wal(dbapi_conn, _record) -> None:
+    dbapi_conn.execute("PRAGMA journal_mode=WAL")
+
+
+class ShardRouter:
+    """
+    Resolves sessions by user id onto per-user (or per-bucket) SQLite files.
+    Engines are created on first use, and each shard is brought to the latest
+    migration when first opened, so each shard has its own write lock and only
+    holds its users' rows.
+    """
+    def __init__(self, directory: str | Path, buckets: int = 0, echo: bool = False) -> None:
+        self.directory = Path(directory)
+        self.buckets = buckets
+        self.echo = echo
+        self._engines: dict[str, Engine] = {}
+        self._factories: dict[str, sessionmaker] = {}
+        self._lock = Lock()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.db"
+
+    def key_for(self, user_id: str) -> str:
+        return shard_key(user_id, self.buckets)
+
+    def engine(self, key: str) -> Engine:
+        with self._lock:
+            eng = self._engines.get(key)
+            if eng is None:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                eng = create_engine(f"sqlite:///{self.path_for(key).as_posix()}", echo=self.echo)
+                event.listen(eng, "connect", _wal)
+                upgrade(eng)
+                self._engines[key] = eng
+                self._factories[key] = sessionmaker(bind=eng, autoflush=False)
+            return eng
+
+    def engine_for(self, user_id: str) -> Engine:
+        return self.engine(self.key_for(user_id))
+
+    def factory_for(self, user_id: str) -> sessionmaker:
+        key = self.key_for(user_id)
+        self.engine(key)
+        return self._factories[key]
+
+    def session_for(self, user_id: str) -> Session:
+        return self.factory_for(user_id)()
+
+    def shard_keys(self) -> list[str]:
+        """Every shard on disk (not only the ones opened by this process)."""
+        return sorted(p.stem for p in self.directory.glob("*.db"))
+
+    def iter_shards(self) -> Iterator[tuple[str, Engine]]:
+        for key in self.shard_keys():
+            yield key, self.engine(key)
+
+    def for_each_shard(self, fn: Callable[[Session], T], commit: bool = False) -> dict[str, T]:
+        """Run fn on a session per shard; returns {shard_key: result}. Used by the admin tools."""
+        results: dict[str, T] = {}
+        for key, _ in self.iter_shards():
+            with self._factories[key]() as s:
+                results[key] = fn(s)
+                if commit:
+                    s.commit()
+        return results
+
+    def dispose(self) -> None:
+        with self._lock:
+            for eng in self._engines.values():
+                eng.dispose()
+            self._engines.clear()
+            self._factories.clear()
+
+
+@lru_cache
+def router() -> Optional[ShardRouter]:
+    """The configured router, or None when [sharding] is disabled (single database)."""
+    cfg = get_config()
+    if not cfg.sharding.enabled:
+        return None
+    return ShardRouter(cfg.sharding.directory, cfg.sharding.buckets, cfg.database.echo)
+
+
+def factory_for(user_id: Optional[str] = None) -> sessionmaker:
+    """Session factory for user_id's data: their shard when sharding is on, else the main database."""
+    r = router()
+    if r is None or user_id is None:
+        return SessionLocal
+    return r.factory_for(user_id)
+
+
+def session_for(user_id: Optional[str] = None) -> Session:
+    return factory_for(user_id)()
+
+
+def require_main_database(what: str) -> None:
+    """
+    Refuse to write to the main database while sharding is on: the shards would not see
+    the change. Writers without a user to route by (the desktop app, the maintenance
+    controllers) call this before they open a session.
+    """
+    if router() is not None:
+        raise RuntimeError(
+            f"{what} writes to the main database, but [sharding] is enabled; "
+            f"run it per user (--user) or disable sharding"
+        )
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import os
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .base import engine as default_engine
+
+# ----- In-process write counter -----
+# Bumped after every commit of a session that wrote something (flush or ORM bulk DML).
+_counter_lock = Lock()
+_write_count = 0
+
+
+def bump() -> None:
+    """Record a write that did not go through an ORM Session (e.g. raw Core DML)."""
+    global _write_count
+    with _counter_lock:
+        _write_count += 1
+
+
+def write_count() -> int:
+    return _write_count
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info["_ft_wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_dml(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["_ft_wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    if session.info.pop("_ft_wrote", False):
+        bump()
+
+
+@event.listens_for(Session, "after_rollback")
+def _clear_on_rollback(session: Session) -> None:
+    session.info.pop("_ft_wrote", None)
+
+
+def has_pending_writes(session: Session) -> bool:
+    """True when the session holds flushed-but-uncommitted or unflushed changes."""
+    return bool(session.info.get("_ft_wrote") or session.new or session.dirty or session.deleted)
+
+
+# ----- Per-engine data version -----
+class DataVersion:
+    """
+    Cheap "has anything changed?" token for one engine.
+
+    token() combines the in-process write counter with SQLite's PRAGMA data_version,
+    read on a dedicated probe connection so that commits from any other connection
+    (pooled siblings or other processes) change it. Tokens are only comparable
+    within this process; fingerprint() is the cross-process variant based on the
+    database file's size and mtime, used for on-disk caches.
+    """
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self._lock = Lock()
+        self._probe = None
+        db = engine.url.database if engine.dialect.name == "sqlite" else None
+        self._path: Optional[str] = db if db and db != ":memory:" and not db.startswith("file:") else None
+
+    def __repr__(self) -> str:
+        return f"DataVersion({self.engine.url!r})"
+
+    def token(self) -> tuple[int, int]:
+        if self._path is None:
+            return write_count(), 0
+        with self._lock:
+            if self._probe is None:
+                self._probe = self.engine.raw_connection()
+            (pragma,) = self._probe.cursor().execute("PRAGMA data_version").fetchone()
+        return write_count(), pragma
+
+    def fingerprint(self) -> Optional[tuple]:
+        if self._path is None:
+            return None
+        parts = []
+        for path in (self._path, self._path + "-wal"):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                parts.append(None)
+            else:
+                parts.append((st.st_size, st.st_mtime_ns))
+        return tuple(parts)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._probe is not None:
+                self._probe.close()
+                self._probe = None
+
+
+_versions: dict[int, DataVersion] = {}
+_versions_lock = Lock()
+
+
+def data_version(bind=None) -> DataVersion:
+    """Shared DataVersion for an engine or connection (defaults to the app engine)."""
+    eng = getattr(bind, "engine", None) or default_engine
+    with _versions_lock:
+        dv = _versions.get(id(eng))
+        if dv is None or dv.engine is not eng:
+            dv = _versions[id(eng)] = DataVersion(eng)
+        return dv
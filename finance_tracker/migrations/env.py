@@ -0,0 +1,51 @@
+from __future__ import annotations
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+
+from finance_tracker import models  # noqa: F401  (registers every table on Base.metadata)
+from finance_tracker.config.loader import db_url
+from finance_tracker.db.base import Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    context.configure(
+        url=db_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_on(connection) -> None:
+    # batch mode: SQLite can only change most constraints by copying the table
+    context.configure(connection=connection, target_metadata=target_metadata, render_as_batch=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:  # handed over by db.migrate.upgrade (e.g. a new shard)
+        _run_on(connection)
+        return
+    engine = create_engine(db_url())
+    with engine.connect() as connection:
+        _run_on(connection)
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,157 @@
+"""Baseline schema
+
+Tables as they existed before migrations were introduced. Tables already present
+(databases created with metadata.create_all) are left alone, so `alembic upgrade head`
+adopts an existing database without a separate stamp step.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY = sa.Numeric(18, 2)
+
+
+def _timestamps() -> list[sa.Column]:
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("username", sa.String(64), nullable=False, unique=True),
+            sa.Column("password_hash", sa.String(128), nullable=False),
+        )
+        op.create_index("ix_users_username", "users", ["username"], unique=True)
+
+    if "budgets" not in existing:
+        op.create_table(
+            "budgets",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("name", sa.String(120), nullable=False, unique=True),
+            sa.Column("currency", sa.String(3), nullable=False),
+            *_timestamps(),
+        )
+
+    if "categories" not in existing:
+        op.create_table(
+            "categories",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("name", sa.String(80), nullable=False, unique=True),
+            sa.Column("type", sa.Enum("INCOME", "EXPENSE", name="categorytype"), nullable=False),
+            *_timestamps(),
+        )
+        op.create_index("ix_categories_name", "categories", ["name"])
+
+    if "accounts" not in existing:
+        op.create_table(
+            "accounts",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("name", sa.String(120), nullable=False, unique=True),
+            sa.Column("type", sa.Enum("CHECKING", "SAVINGS", "CREDIT", "CASH", "BROKERAGE", name="accounttype"),
+                      nullable=False),
+            sa.Column("currency", sa.String(3), nullable=False),
+            sa.Column("starting_balance", MONEY, nullable=False),
+            sa.Column("balance", MONEY, nullable=False),
+            *_timestamps(),
+        )
+        op.create_index("ix_accounts_name", "accounts", ["name"])
+
+    if "budget_items" not in existing:
+        op.create_table(
+            "budget_items",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("budget_id", sa.String(36), sa.ForeignKey("budgets.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("category_id", sa.String(36), sa.ForeignKey("categories.id"), nullable=False),
+            sa.Column("monthly_limit", MONEY, nullable=False),
+            *_timestamps(),
+            sa.UniqueConstraint("budget_id", "category_id", name="uq_budgetitem_budget_category"),
+        )
+
+    if "goals" not in existing:
+        op.create_table(
+            "goals",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="SET NULL")),
+            sa.Column("name", sa.String(120), nullable=False),
+            sa.Column("target_amount", MONEY, nullable=False),
+            sa.Column("target_date", sa.Date),
+            *_timestamps(),
+        )
+
+    if "recurring_transactions" not in existing:
+        op.create_table(
+            "recurring_transactions",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("category_id", sa.String(36), sa.ForeignKey("categories.id")),
+            sa.Column("next_date", sa.Date, nullable=False),
+            sa.Column("frequency", sa.Enum("DAILY", "WEEKLY", "BIWEEKLY", "MONTHLY", "QUARTERLY", "YEARLY",
+                                           name="frequency"), nullable=False),
+            sa.Column("amount", MONEY, nullable=False),
+            sa.Column("description", sa.String(240), nullable=False),
+            sa.Column("active", sa.Boolean, nullable=False),
+            *_timestamps(),
+        )
+
+    if "transactions" not in existing:
+        op.create_table(
+            "transactions",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("category_id", sa.String(36), sa.ForeignKey("categories.id")),
+            sa.Column("budget_item_id", sa.String(36), sa.ForeignKey("budget_items.id")),
+            sa.Column("date", sa.Date, nullable=False),
+            sa.Column("type", sa.Enum("DEBIT", "CREDIT", name="transactiontype"), nullable=False),
+            sa.Column("amount", MONEY, nullable=False),
+            sa.Column("description", sa.String(240), nullable=False),
+            sa.Column("external_ref", sa.String(120)),
+            *_timestamps(),
+        )
+        op.create_index("ix_transactions_date", "transactions", ["date"])
+        op.create_index("ix_transactions_account_date", "transactions", ["account_id", "date"])
+        op.create_index("ix_transactions_category_id", "transactions", ["category_id"])
+        op.create_index("ix_transactions_account_id", "transactions", ["account_id"])
+
+    if "alerts" not in existing:
+        op.create_table(
+            "alerts",
+            sa.Column("id", sa.String(36), primary_key=True),
+            sa.Column("kind", sa.Enum("BALANCE_BELOW", "CATEGORY_OVERSPEND", "GOAL_PROGRESS", name="alertkind"),
+                      nullable=False),
+            sa.Column("is_active", sa.Boolean, nullable=False),
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE")),
+            sa.Column("category_id", sa.String(36), sa.ForeignKey("categories.id", ondelete="CASCADE")),
+            sa.Column("goal_id", sa.String(36), sa.ForeignKey("goals.id", ondelete="CASCADE")),
+            sa.Column("threshold_amount", MONEY),
+            sa.Column("note", sa.String(240), nullable=False),
+            *_timestamps(),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("alerts", "transactions", "recurring_transactions", "goals", "budget_items",
+                  "accounts", "categories", "budgets", "users"):
+        op.drop_table(table)
@@ -0,0 +1,86 @@
+"""User scope, app_meta, archive checkpoints and balance snapshots
+
+Adds transactions.user_id (backfilled from accounts) with its indexes, and the tables
+behind money storage metadata, archiving and month-end balance snapshots.
+
+The user_id part supersedes controllers/backfill_user_id, the script that first shipped
+the column: same column, backfill and indexes (ANALYZE now runs in 0003), tracked by Alembic.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Matches the baseline; databases on [database] money_storage = "cents" are converted by
+# controllers/migrate_money, not here.
+MONEY = sa.Numeric(18, 2)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    insp = sa.inspect(op.get_bind())
+    existing = set(insp.get_table_names())
+
+    if "app_meta" not in existing:
+        op.create_table(
+            "app_meta",
+            sa.Column("key", sa.String(64), primary_key=True),
+            sa.Column("value", sa.String(255), nullable=False),
+        )
+
+    if "user_id" not in {c["name"] for c in insp.get_columns("transactions")}:
+        # SQLite cannot ALTER in a foreign key; batch mode rebuilds the table around it
+        with op.batch_alter_table("transactions") as batch:
+            batch.add_column(sa.Column("user_id", sa.String(36), nullable=True))
+            batch.create_foreign_key("fk_transactions_user_id", "users", ["user_id"], ["id"], ondelete="CASCADE")
+    op.execute(
+        "UPDATE transactions SET user_id = "
+        "(SELECT accounts.user_id FROM accounts WHERE accounts.id = transactions.account_id) "
+        "WHERE user_id IS NULL"
+    )
+    insp = sa.inspect(op.get_bind())
+    indexes = {ix["name"] for ix in insp.get_indexes("transactions")}
+    if "ix_transactions_user_date" not in indexes:
+        op.create_index("ix_transactions_user_date", "transactions", ["user_id", "date"])
+    if "ix_transactions_user_category_date" not in indexes:
+        op.create_index("ix_transactions_user_category_date", "transactions", ["user_id", "category_id", "date"])
+
+    if "balance_checkpoints" not in existing:
+        op.create_table(
+            "balance_checkpoints",
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("archived_before", sa.Date, nullable=False),
+            sa.Column("amount", MONEY, nullable=False),
+        )
+
+    if "balance_snapshots" not in existing:
+        op.create_table(
+            "balance_snapshots",
+            sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("month_end", sa.Date, primary_key=True),
+            sa.Column("cumulative", MONEY, nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("balance_snapshots")
+    op.drop_table("balance_checkpoints")
+    op.drop_index("ix_transactions_user_category_date", table_name="transactions")
+    op.drop_index("ix_transactions_user_date", table_name="transactions")
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_constraint("fk_transactions_user_id", type_="foreignkey")
+        batch.drop_column("user_id")
+    op.drop_table("app_meta")
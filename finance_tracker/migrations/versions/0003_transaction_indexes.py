@@ -0,0 +1,63 @@
+"""Reshape transaction indexes
+
+Drops single-column indexes that are prefixes of composite ones, adds (date, id) for
+keyset paging, (category_id, date) for category/month reads and (account_id, external_ref)
+for import de-duplication, then ANALYZEs so the planner picks them up immediately.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name -> columns
+ADDED = {
+    "ix_transactions_date_id": ["date", "id"],
+    "ix_transactions_category_date": ["category_id", "date"],
+    "ix_transactions_account_external_ref": ["account_id", "external_ref"],
+}
+# name -> columns; each is a prefix of an index above or of ix_transactions_account_date
+DROPPED = {
+    "ix_transactions_date": ["date"],
+    "ix_transactions_account_id": ["account_id"],
+    "ix_transactions_category_id": ["category_id"],
+}
+
+
+def _indexes() -> set[str]:
+    return {ix["name"] for ix in sa.inspect(op.get_bind()).get_indexes("transactions")}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    present = _indexes()
+    for name, cols in ADDED.items():
+        if name not in present:
+            op.create_index(name, "transactions", cols)
+    for name in DROPPED:
+        if name in present:
+            op.drop_index(name, table_name="transactions")
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    present = _indexes()
+    for name, cols in DROPPED.items():
+        if name not in present:
+            op.create_index(name, "transactions", cols)
+    for name in ADDED:
+        if name in present:
+            op.drop_index(name, table_name="transactions")
+    op.execute("ANALYZE")
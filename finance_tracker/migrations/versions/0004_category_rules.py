@@ -0,0 +1,48 @@
+"""Category rules for auto-categorization
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONEY = sa.Numeric(18, 2)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "category_rules" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    op.create_table(
+        "category_rules",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("user_id", sa.String(36), sa.ForeignKey("users.id", ondelete="CASCADE")),
+        sa.Column("category_id", sa.String(36), sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("kind", sa.Enum("SUBSTRING", "REGEX", name="rulekind"), nullable=False),
+        sa.Column("pattern", sa.String(240), nullable=False),
+        sa.Column("min_amount", MONEY),
+        sa.Column("max_amount", MONEY),
+        sa.Column("account_id", sa.String(36), sa.ForeignKey("accounts.id", ondelete="CASCADE")),
+        sa.Column("priority", sa.Integer, nullable=False),
+        sa.Column("active", sa.Boolean, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("CURRENT_TIMESTAMP"), nullable=False),
+    )
+    op.create_index("ix_category_rules_user_id", "category_rules", ["user_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_category_rules_user_id", table_name="category_rules")
+    op.drop_table("category_rules")
@@ -0,0 +1,60 @@
+"""Transaction cleared flag for statement reconciliation
+
+The archive database copies the transactions columns, so a configured archive file
+gets the column too.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+
+"""
+from pathlib import Path
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from finance_tracker.config.loader import archive_path
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _archive_engine():
+    path = archive_path()
+    if not path or not Path(path).exists():
+        return None
+    return sa.create_engine(f"sqlite:///{path}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "cleared" not in {c["name"] for c in sa.inspect(op.get_bind()).get_columns("transactions")}:
+        op.add_column("transactions", sa.Column("cleared", sa.Boolean, nullable=False, server_default=sa.false()))
+
+    eng = _archive_engine()
+    if eng is not None:
+        insp = sa.inspect(eng)
+        if "transactions" in insp.get_table_names() and \
+                "cleared" not in {c["name"] for c in insp.get_columns("transactions")}:
+            with eng.begin() as conn:
+                conn.exec_driver_sql("ALTER TABLE transactions ADD COLUMN cleared BOOLEAN NOT NULL DEFAULT 0")
+        eng.dispose()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_column("cleared")
+    eng = _archive_engine()
+    if eng is not None:
+        insp = sa.inspect(eng)
+        if "transactions" in insp.get_table_names() and \
+                "cleared" in {c["name"] for c in insp.get_columns("transactions")}:
+            with eng.begin() as conn:
+                conn.exec_driver_sql("ALTER TABLE transactions DROP COLUMN cleared")
+        eng.dispose()
@@ -6,9 +6,14 @@ from .category import Category, CategoryType
 from .recurring import RecurringTransaction, Frequency
 from .transaction import Transaction, TransactionType
 from .user import User
+from .meta import AppMeta
+from .archive import BalanceCheckpoint
+from .snapshot import BalanceSnapshot
+from .rule import CategoryRule, RuleKind
 
 __all__ = [
     "User", "Account", "AccountType", "Goal", "Alert", "AlertKind",
     "Budget", "BudgetItem", "Category", "CategoryType",
-    "RecurringTransaction", "Frequency", "Transaction", "TransactionType",
+    "RecurringTransaction", "Frequency", "Transaction", "TransactionType", "AppMeta", "BalanceCheckpoint", "BalanceSnapshot",
+    "CategoryRule", "RuleKind",
 ]
\ No newline at end of file
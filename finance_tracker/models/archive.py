@@ -0,0 +1,37 @@
+from __future__ import annotations
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Column, Date, ForeignKey, Index, MetaData, Table
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.archive import ARCHIVE_SCHEMA
+from ..db.base import Base
+from ..db.money import money_type
+from .transaction import Transaction
+
+
+class BalanceCheckpoint(Base):
+    """Per-account sum of the transactions moved to the archive (all dated before archived_before)."""
+    __tablename__ = "balance_checkpoints"
+
+    account_id: Mapped[str] = mapped_column(ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True)
+    archived_before: Mapped[date] = mapped_column(Date, nullable=False)
+    amount: Mapped[Decimal] = mapped_column(money_type(), nullable=False)  # converted by controllers/migrate_money
+
+
+# The archived copy of transactions: same columns, no foreign keys (the parents stay in
+# the main file) and only the indexes the date-range reads need; its money_type() amount
+# is converted with the hot one by controllers/migrate_money. Kept on its own
+# MetaData so create_all() on the main database never creates it.
+archive_metadata = MetaData()
+
+archived_transactions = Table(
+    "transactions",
+    archive_metadata,
+    *(Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable) for c in Transaction.__table__.c),
+    Index("ix_archive_transactions_date", "date"),
+    Index("ix_archive_transactions_account_date", "account_id", "date"),
+    Index("ix_archive_transactions_user_date", "user_id", "date"),
+    schema=ARCHIVE_SCHEMA,
+)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from ..db.base import Base
+
+
+class AppMeta(Base):
+    """Key/value facts about the database itself (e.g. money_storage)."""
+    __tablename__ = "app_meta"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from decimal import Decimal
+import enum
+
+from sqlalchemy import String, ForeignKey, Enum as SAEnum, Integer, Boolean, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from ..db.base import Base, TimestampMixin, uuid_pk
+from ..db.money import money_type
+
+
+class RuleKind(enum.Enum):
+    SUBSTRING = "substring"  # case-insensitive substring of the description
+    REGEX = "regex"          # case-insensitive re.search on the description
+
+
+class CategoryRule(Base, TimestampMixin):
+    """
+    Auto-categorization rule: every condition that is set must hold (pattern, signed amount
+    range, account). The lowest priority wins when several match. user_id None applies to all users.
+
+    min_amount/max_amount bound the signed transaction amount, inclusive, and debits are
+    negative: "debits of $500 or more" is max_amount=-500, not 500. Both are money_type()
+    columns, converted by controllers/migrate_money.
+    """
+    __tablename__ = "category_rules"
+    __table_args__ = (Index("ix_category_rules_user_id", "user_id"),)
+
+    id = uuid_pk()
+    user_id: Mapped[str | None] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    category_id: Mapped[str] = mapped_column(ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    kind: Mapped[RuleKind] = mapped_column(SAEnum(RuleKind, name="rulekind"), default=RuleKind.SUBSTRING, nullable=False)
+    pattern: Mapped[str] = mapped_column(String(240), default="", nullable=False)
+    min_amount: Mapped[Decimal | None] = mapped_column(money_type())
+    max_amount: Mapped[Decimal | None] = mapped_column(money_type())
+    account_id: Mapped[str | None] = mapped_column(ForeignKey("accounts.id", ondelete="CASCADE"))
+    priority: Mapped[int] = mapped_column(Integer, default=100, nullable=False)
+    active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+
+    category = relationship("Category")
+    account = relationship("Account", passive_deletes=True)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, ForeignKey, event, inspect, update
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..db.base import Base
+from ..db.money import money_type
+from .transaction import Transaction
+
+
+class BalanceSnapshot(Base):
+    """
+    Sum of an account's transaction amounts through month_end (closing balance minus
+    starting_balance), one row per account per month. Kept current by the listeners
+    below and rebuilt/extended by services.snapshots.
+    """
+    __tablename__ = "balance_snapshots"
+
+    account_id: Mapped[str] = mapped_column(ForeignKey("accounts.id", ondelete="CASCADE"), primary_key=True)
+    month_end: Mapped[date] = mapped_column(Date, primary_key=True)
+    cumulative: Mapped[Decimal] = mapped_column(money_type(), nullable=False)  # converted by controllers/migrate_money
+
+
+def apply_delta(connection, account_id: str, on: date, amount: Decimal) -> None:
+    """A transaction of `amount` dated `on` moves every snapshot from that month end onward."""
+    if amount:
+        connection.execute(
+            update(BalanceSnapshot)
+            .where(BalanceSnapshot.account_id == account_id, BalanceSnapshot.month_end >= on)
+            .values(cumulative=BalanceSnapshot.cumulative + amount)
+        )
+
+
+@event.listens_for(Transaction, "after_insert")
+def _snapshot_on_insert(mapper, connection, target: Transaction) -> None:
+    apply_delta(connection, target.account_id, target.date, target.amount)
+
+
+@event.listens_for(Transaction, "after_delete")
+def _snapshot_on_delete(mapper, connection, target: Transaction) -> None:
+    apply_delta(connection, target.account_id, target.date, -target.amount)
+
+
+@event.listens_for(Transaction, "after_update")
+def _snapshot_on_update(mapper, connection, target: Transaction) -> None:
+    attrs = inspect(target).attrs
+    changed = [attrs[k].history for k in ("account_id", "date", "amount")]
+    if not any(h.has_changes() for h in changed):
+        return
+    old = [h.deleted[0] if h.deleted else getattr(target, k) for h, k in zip(changed, ("account_id", "date", "amount"))]
+    apply_delta(connection, old[0], old[1], -old[2])
+    apply_delta(connection, target.account_id, target.date, target.amount)
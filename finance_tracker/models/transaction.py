@@ -3,10 +3,12 @@ from datetime import date
 from decimal import Decimal
 import enum
 
-from sqlalchemy import String, Numeric, ForeignKey, Date, Enum as SAEnum, Index
+from sqlalchemy import Boolean, String, ForeignKey, Date, Enum as SAEnum, Index, event, inspect, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.base import Base, TimestampMixin, uuid_pk
+from ..db.money import money_type
+from .account import Account
 
 
 class TransactionType(enum.Enum):
@@ -17,25 +19,54 @@ class TransactionType(enum.Enum):
 class Transaction(Base, TimestampMixin):
     __tablename__ = "transactions"
 
+    # active_history on the columns totals are keyed by: an update loads the value it replaces
+    # even when the attribute was expired, so after_update listeners (snapshots, dashboard
+    # aggregates) can take the old row out of their totals
     id = uuid_pk()
-    account_id: Mapped[str] = mapped_column(ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
-    category_id: Mapped[str | None] = mapped_column(ForeignKey("categories.id"), nullable=True)
+    account_id: Mapped[str] = mapped_column(
+        ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False, active_history=True
+    )
+    # Denormalized from accounts.user_id (set on flush) so per-user queries need no join
+    user_id: Mapped[str | None] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    category_id: Mapped[str | None] = mapped_column(ForeignKey("categories.id"), nullable=True, active_history=True)
     budget_item_id: Mapped[str | None] = mapped_column(ForeignKey("budget_items.id"), nullable=True)
 
-    date: Mapped[date] = mapped_column(Date, nullable=False)
-    type: Mapped[TransactionType] = mapped_column(SAEnum(TransactionType, name="transactiontype"), nullable=False)
-    amount: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False, active_history=True)
+    type: Mapped[TransactionType] = mapped_column(
+        SAEnum(TransactionType, name="transactiontype"), nullable=False, active_history=True
+    )
+    amount: Mapped[Decimal] = mapped_column(money_type(), nullable=False, active_history=True)  # Numeric or integer cents, see db.money
     description: Mapped[str] = mapped_column(String(240), default="", nullable=False)
     external_ref: Mapped[str | None] = mapped_column(String(120))
+    cleared: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)  # matched to a bank statement
 
     account = relationship("Account", back_populates="transactions", passive_deletes=True)
     category = relationship("Category", back_populates="transactions")
     budget_item = relationship("BudgetItem")
 
     __table_args__ = (
-        Index("ix_transactions_date", "date"),
+        # Composite indexes only; each also serves lookups on its leading column(s).
+        # Keep in step with migrations/versions (0003 reshaped these).
+        Index("ix_transactions_date_id", "date", "id"),
         Index("ix_transactions_account_date", "account_id", "date"),
-        # These helper indexes were added in a later migration; keep them if present
-        Index("ix_transactions_category_id", "category_id"),
-        Index("ix_transactions_account_id", "account_id"),
-    )
\ No newline at end of file
+        Index("ix_transactions_category_date", "category_id", "date"),
+        Index("ix_transactions_user_date", "user_id", "date"),
+        Index("ix_transactions_user_category_date", "user_id", "category_id", "date"),
+        Index("ix_transactions_account_external_ref", "account_id", "external_ref"),
+    )
+
+
+@event.listens_for(Transaction, "before_insert")
+@event.listens_for(Transaction, "before_update")
+def _set_user_id(mapper, connection, target: Transaction) -> None:
+    """Keep user_id in step with the owning account."""
+    hist = inspect(target).attrs.account_id.history
+    if target.user_id is not None and not hist.has_changes():
+        return
+    account = target.__dict__.get("account")  # only if already loaded; no lazy load mid-flush
+    if account is not None and account.id == target.account_id and account.user_id:
+        target.user_id = account.user_id
+    else:
+        target.user_id = connection.scalar(
+            select(Account.user_id).where(Account.id == target.account_id)
+        )
@@ -0,0 +1,191 @@
+from __future__ import annotations
+from dataclasses import asdict, is_dataclass
+from datetime import date
+from hashlib import sha1
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+from urllib.parse import parse_qs, urlsplit
+import json
+import secrets
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..db import sharding
+from ..db.version import data_version
+from ..logging import get_logger
+from ..ui.models.filters import TransactionFilters
+from . import reports
+from .cache import ReportCache
+from .export import jsonable
+from .transactions import transactions_page
+
+log = get_logger(__name__)
+
+MAX_PAGE_SIZE = 1000
+
+
+# Parameter helpers
+class BadRequest(ValueError):
+    pass
+
+
+def _param(q: dict[str, list[str]], name: str, conv: Callable[[str], Any] = str, default: Any = None) -> Any:
+    values = q.get(name)
+    if not values or values[0] == "":
+        return default
+    try:
+        return conv(values[0])
+    except ValueError as e:
+        raise BadRequest(f"Invalid {name}: {values[0]!r}") from e
+
+
+def _year_month(q: dict[str, list[str]]) -> tuple[int, int]:
+    today = date.today()
+    year = _param(q, "year", int, today.year)
+    month = _param(q, "month", int, today.month)
+    if not 1 <= month <= 12:
+        raise BadRequest(f"Invalid month: {month}")
+    return year, month
+
+
+# Routes: each takes (session, query) and returns a JSON-able result; all accept ?user_id=
+def _balances(s: Session, q):
+    return reports.account_balances(s, _param(q, "as_of", date.fromisoformat), _param(q, "user_id"))
+
+
+def _spend(s: Session, q):
+    return reports.monthly_spend_by_category(s, *_year_month(q), _param(q, "user_id"))
+
+
+def _cashflow(s: Session, q):
+    start, end = reports.month_bounds(*_year_month(q))
+    return reports.cashflow(
+        s, _param(q, "start", date.fromisoformat, start), _param(q, "end", date.fromisoformat, end),
+        _param(q, "user_id"),
+    )
+
+
+def _budgets(s: Session, q):
+    return reports.budget_utilization(s, *_year_month(q), _param(q, "user_id"))
+
+
+def _transactions(s: Session, q):
+    flt = TransactionFilters(
+        account_id=_param(q, "account_id"),
+        category_id=_param(q, "category_id"),
+        date_from=_param(q, "from", date.fromisoformat),
+        date_to=_param(q, "to", date.fromisoformat),
+        type=_param(q, "type"),
+        txt=_param(q, "q"),
+        user_id=_param(q, "user_id"),
+    )
+    limit = min(max(_param(q, "limit", int, 100), 1), MAX_PAGE_SIZE)
+    return transactions_page(s, flt, limit=limit, after=_param(q, "after"))
+
+
+ROUTES: dict[str, Callable[[Session, dict[str, list[str]]], Any]] = {
+    "/balances": _balances,
+    "/spend": _spend,
+    "/cashflow": _cashflow,
+    "/budgets": _budgets,
+    "/transactions": _transactions,
+}
+
+
+def to_json(result: Any) -> bytes:
+    if is_dataclass(result):
+        result = asdict(result)
+    elif isinstance(result, list):
+        result = [asdict(r) if is_dataclass(r) else r for r in result]
+    return json.dumps(result, default=jsonable, separators=(",", ":")).encode()
+
+
+# Server
+class ApiServer(ThreadingHTTPServer):
+    """
+    Read-only JSON API over the report and transaction services.
+    One thread per request, each with its own pooled session. Encoded responses are
+    cached per URL and tagged with an ETag derived from the database data version,
+    so unchanged data is answered from memory (or with 304 Not Modified). Data
+    versions restart with the process, so ETags are also salted per server instance:
+    a tag issued before a restart never matches after it.
+    Without an explicit session_factory, a request with ?user_id= reads that user's
+    shard when [sharding] is enabled (see db.sharding.factory_for).
+    """
+    daemon_threads = True
+
+    def __init__(
+            self,
+            address: tuple[str, int],
+            session_factory: Optional[sessionmaker] = None,
+            cache: Optional[ReportCache] = None,
+    ) -> None:
+        super().__init__(address, ApiHandler)
+        self.session_factory = session_factory
+        self.cache = cache or ReportCache(maxsize=1024)
+        self.etag_salt = secrets.token_hex(8)
+
+    def factory_for(self, user_id: Optional[str]) -> sessionmaker:
+        return self.session_factory or sharding.factory_for(user_id)
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    server: ApiServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            return self._send(HTTPStatus.OK, b'{"status":"ok"}')
+        route = ROUTES.get(url.path)
+        if route is None:
+            return self._error(HTTPStatus.NOT_FOUND, f"Unknown endpoint {url.path}")
+
+        query = parse_qs(url.query)
+        key = (url.path, tuple(sorted((k, tuple(v)) for k, v in query.items())))
+        factory = self.server.factory_for(_param(query, "user_id"))
+        version = data_version(factory.kw.get("bind")).token()
+        etag = '"%s"' % sha1(repr((self.server.etag_salt, key, version)).encode()).hexdigest()[:20]
+        if etag in (t.strip() for t in self.headers.get("If-None-Match", "").split(",")):
+            return self._send(HTTPStatus.NOT_MODIFIED, b"", etag)
+
+        def compute() -> bytes:
+            with factory() as s:
+                return to_json(route(s, query))
+
+        try:
+            body = self.server.cache.get_or_compute(key, compute, version)
+        except ValueError as e:  # bad parameters or cursor
+            return self._error(HTTPStatus.BAD_REQUEST, str(e))
+        except Exception:
+            log.exception("Request failed: %s", self.path)
+            return self._error(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal error")
+        self._send(HTTPStatus.OK, body, etag)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send(status, json.dumps({"error": message}).encode())
+
+    def _send(self, status: HTTPStatus, body: bytes, etag: Optional[str] = None) -> None:
+        self.send_response(status)
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug("%s - %s", self.address_string(), format % args)
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, **kwargs: Any) -> None:
+    with ApiServer((host, port), **kwargs) as httpd:
+        log.info("Serving Finance Tracker API on http://%s:%d", host, port)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,96 @@
+from __future__ import annotations
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, aliased
+
+from ..db.archive import is_attached
+from ..db.money import cents_expr, from_cents, sum_cents
+from ..models.archive import BalanceCheckpoint, archive_metadata, archived_transactions
+from ..models.meta import AppMeta
+from ..models.transaction import Transaction
+
+# app_meta key holding the first date still in the hot table (everything earlier is archived)
+BOUNDARY_KEY = "archive_before"
+
+
+def archive_boundary(s: Session) -> Optional[date]:
+    """First hot date, or None when nothing has been archived (or no archive is attached)."""
+    if not is_attached(s.get_bind()):
+        return None
+    value = s.execute(select(AppMeta.value).where(AppMeta.key == BOUNDARY_KEY)).scalar_one_or_none()
+    return date.fromisoformat(value) if value else None
+
+
+def all_transactions():
+    """Transaction aliased over hot UNION ALL archived rows; usable anywhere Transaction is."""
+    hot = Transaction.__table__
+    union = select(*hot.c).union_all(select(*(archived_transactions.c[c.name] for c in hot.c)))
+    return aliased(Transaction, union.subquery("all_transactions"), adapt_on_names=True)
+
+
+def transaction_source(s: Session, start: Optional[date] = None):
+    """
+    What to select transactions from for a range starting at `start` (None = from the beginning):
+    the plain table when the range is all hot, the hot+archive union only when it reaches back
+    past the archive boundary.
+    """
+    boundary = archive_boundary(s)
+    if boundary is None or (start is not None and start >= boundary):
+        return Transaction
+    return all_transactions()
+
+
+def archived_ids(s: Session, ids: Iterable[str]) -> set[str]:
+    """The ids among `ids` that live in the archive. Archived rows are read-only."""
+    ids = list(ids)
+    if not ids or archive_boundary(s) is None:
+        return set()
+    return set(s.scalars(select(archived_transactions.c.id).where(archived_transactions.c.id.in_(ids))))
+
+
+def checkpoint_cents(s: Session) -> dict[str, int]:
+    """Archived amount per account, in cents (empty when nothing is archived)."""
+    if archive_boundary(s) is None:
+        return {}
+    rows = s.execute(select(BalanceCheckpoint.account_id, cents_expr(BalanceCheckpoint.amount))).all()
+    return {a: int(c) for a, c in rows}
+
+
+def archive_before(engine: Engine, before: date) -> int:
+    """
+    Move every transaction dated before `before` into the attached archive and fold its
+    amount into per-account balance checkpoints, in one transaction. Returns rows moved.
+    """
+    if not is_attached(engine):
+        raise RuntimeError("No archive database attached; set [archive] path in config.toml")
+    hot = Transaction.__table__
+    with Session(engine) as s, s.begin():
+        current = archive_boundary(s)
+        if current is not None and before <= current:
+            return 0
+        archive_metadata.create_all(s.connection())
+        BalanceCheckpoint.__table__.create(s.connection(), checkfirst=True)
+
+        moved = (
+            select(hot.c.account_id, sum_cents(cents_expr(hot.c.amount)))
+            .where(hot.c.date < before)
+            .group_by(hot.c.account_id)
+        )
+        for account_id, cents in s.execute(moved).all():
+            cp = s.get(BalanceCheckpoint, account_id)
+            if cp is None:
+                s.add(BalanceCheckpoint(account_id=account_id, archived_before=before, amount=from_cents(cents)))
+            else:
+                cp.amount += from_cents(cents)
+        s.flush()
+        s.execute(update(BalanceCheckpoint).values(archived_before=before))
+
+        cols = [c.name for c in hot.c]
+        s.execute(archived_transactions.insert().from_select(cols, select(*hot.c).where(hot.c.date < before)))
+        n = s.execute(delete(hot).where(hot.c.date < before)).rowcount
+        s.merge(AppMeta(key=BOUNDARY_KEY, value=before.isoformat()))
+    return n
+
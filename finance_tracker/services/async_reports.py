@@ -0,0 +1,125 @@
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from ..config.loader import archive_path, db_url, db_echo
+from ..db.archive import attach_archive
+from . import reports
+from .reports import (
+    BalanceRow, CategorySpendRow, Cashflow, BudgetUtilizationRow,
+    CategorySpendSeries, AccountSeries, CashflowPoint, Granularity,
+)
+
+T = TypeVar("T")
+
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+
+def async_db_url(url: str) -> str:
+    """Swap the sync driver in a database URL for its asyncio counterpart."""
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+# Engine & Session (created on first use so importing this module needs no driver)
+@lru_cache
+def async_engine() -> AsyncEngine:
+    eng = create_async_engine(async_db_url(db_url()), echo=db_echo())
+    if archive_path():
+        attach_archive(eng.sync_engine, archive_path())
+    return eng
+
+
+@lru_cache
+def async_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=async_engine(), autoflush=False, expire_on_commit=False)
+
+
+# Reports: the sync report functions run unchanged on the AsyncSession's connection via run_sync
+async def account_balances(
+        s: AsyncSession, as_of: Optional[date] = None, user_id: Optional[str] = None
+) -> list[BalanceRow]:
+    return await s.run_sync(reports.account_balances, as_of, user_id)
+
+
+async def monthly_spend_by_category(
+        s: AsyncSession, year: int, month: int, user_id: Optional[str] = None
+) -> list[CategorySpendRow]:
+    return await s.run_sync(reports.monthly_spend_by_category, year, month, user_id)
+
+
+async def cashflow(s: AsyncSession, start: date, end: date, user_id: Optional[str] = None) -> Cashflow:
+    return await s.run_sync(reports.cashflow, start, end, user_id)
+
+
+async def budget_utilization(
+        s: AsyncSession, year: int, month: int, user_id: Optional[str] = None
+) -> list[BudgetUtilizationRow]:
+    return await s.run_sync(reports.budget_utilization, year, month, user_id)
+
+
+async def spend_by_category_series(
+        s: AsyncSession, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[CategorySpendSeries]:
+    return await s.run_sync(reports.spend_by_category_series, start, end, granularity, user_id)
+
+
+async def account_balance_series(
+        s: AsyncSession, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[AccountSeries]:
+    return await s.run_sync(reports.account_balance_series, start, end, granularity, user_id)
+
+
+async def cashflow_series(
+        s: AsyncSession, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[CashflowPoint]:
+    return await s.run_sync(reports.cashflow_series, start, end, granularity, user_id)
+
+
+# Concurrent execution
+async def run_report(
+        fn: Callable[..., Any],
+        *args: Any,
+        factory: Optional[async_sessionmaker[AsyncSession]] = None,
+) -> Any:
+    """Run one async report on its own session, so several can run at once under gather()."""
+    async with (factory or async_session_factory())() as s:
+        return await fn(s, *args)
+
+
+@dataclass(frozen=True)
+class MonthSummary:
+    balances: list[BalanceRow]
+    spend: list[CategorySpendRow]
+    cashflow: Cashflow
+    budgets: list[BudgetUtilizationRow]
+
+
+async def month_summary(
+        year: int,
+        month: int,
+        factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        user_id: Optional[str] = None,
+) -> MonthSummary:
+    """Balances, category spend, cashflow and budgets for a month, queried concurrently."""
+    start, end = reports.month_bounds(year, month)
+    balances, spend, cf, budgets = await asyncio.gather(
+        run_report(account_balances, None, user_id, factory=factory),
+        run_report(monthly_spend_by_category, year, month, user_id, factory=factory),
+        run_report(cashflow, start, end, user_id, factory=factory),
+        run_report(budget_utilization, year, month, user_id, factory=factory),
+    )
+    return MonthSummary(balances=balances, spend=spend, cashflow=cf, budgets=budgets)
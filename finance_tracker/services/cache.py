@@ -0,0 +1,169 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from hashlib import sha1
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional, TypeVar
+import os
+import pickle
+import time
+
+from sqlalchemy.orm import Session
+
+from ..config.loader import get_config
+from ..db.version import data_version, has_pending_writes
+from . import reports
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry:
+    version: Hashable
+    expires: float
+    value: Any
+
+
+class ReportCache:
+    """
+    Two-tier result cache keyed by (key, data version).
+
+    Memory tier: size-bounded LRU with a TTL; an entry only hits while the data
+    version it was computed under is still current.
+    Disk tier (optional): one pickle per key under disk_dir, validated by the
+    database file fingerprint so results survive across CLI runs.
+    """
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, disk_dir: str | os.PathLike | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: Hashable) -> tuple[bool, Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.version == version and entry.expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, entry.value
+                del self._entries[key]
+            self.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, version: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(version, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(
+            self,
+            key: Hashable,
+            compute: Callable[[], T],
+            version: Hashable,
+            fingerprint: Callable[[], Optional[Hashable]] | None = None,
+    ) -> T:
+        found, value = self.get(key, version)
+        if found:
+            return value
+
+        fingerprint = fingerprint() if fingerprint is not None and self.disk_dir is not None else None
+        if fingerprint is not None:
+            found, value = self._disk_get(key, fingerprint)
+            if found:
+                self.put(key, version, value)
+                return value
+
+        value = compute()
+        self.put(key, version, value)
+        if fingerprint is not None:
+            self._disk_put(key, fingerprint, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir and self.disk_dir.exists():
+            for p in self.disk_dir.glob("*.pkl"):
+                p.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----- disk tier -----
+    def _disk_path(self, key: Hashable) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        return self.disk_dir / (sha1(repr(key).encode()).hexdigest() + ".pkl")
+
+    def _disk_get(self, key: Hashable, fingerprint: Hashable) -> tuple[bool, Any]:
+        path = self._disk_path(key)
+        if path is None:
+            return False, None
+        try:
+            with path.open("rb") as f:
+                stored_key, stored_fp, written_at, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            return False, None
+        if stored_key != repr(key) or stored_fp != fingerprint or time.time() - written_at > self.ttl:
+            return False, None
+        return True, value
+
+    def _disk_put(self, key: Hashable, fingerprint: Hashable, value: Any) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump((repr(key), fingerprint, time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # the disk tier is best-effort
+
+
+@lru_cache
+def report_cache() -> ReportCache:
+    cfg = get_config().cache
+    return ReportCache(maxsize=cfg.max_entries, ttl=cfg.ttl_seconds, disk_dir=cfg.disk_dir)
+
+
+def cached_report(fn: Callable[..., T], cache: ReportCache | None = None) -> Callable[..., T]:
+    """
+    Wrap a report function taking (session, *args) so results are reused until the
+    database changes. Sessions with uncommitted writes bypass the cache.
+    """
+    @wraps(fn)
+    def wrapper(s: Session, *args, **kwargs) -> T:
+        if has_pending_writes(s):
+            return fn(s, *args, **kwargs)
+        dv = data_version(s.get_bind())
+        # Keyed on the engine's DataVersion, not its URL: every in-memory engine is "sqlite://".
+        # Its repr is the URL, so the disk tier's file names stay stable across processes.
+        key = (dv, fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+        return (cache or report_cache()).get_or_compute(
+            key, lambda: fn(s, *args, **kwargs), dv.token(), dv.fingerprint
+        )
+
+    return wrapper
+
+
+# Cached variants of services.reports
+account_balances = cached_report(reports.account_balances)
+monthly_spend_by_category = cached_report(reports.monthly_spend_by_category)
+cashflow = cached_report(reports.cashflow)
+budget_utilization = cached_report(reports.budget_utilization)
+month_totals = cached_report(reports.month_totals)
+spend_by_category_series = cached_report(reports.spend_by_category_series)
+account_flow_series = cached_report(reports.account_flow_series)
+account_balance_series = cached_report(reports.account_balance_series)
+cashflow_series = cached_report(reports.cashflow_series)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+import re
+from collections import deque
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional, Sequence
+
+from sqlalchemy import bindparam, literal_column, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr, to_cents
+from ..models.account import Account
+from ..models.rule import CategoryRule, RuleKind
+from ..models.transaction import Transaction
+
+# Rules are compiled once into a RuleMatcher: every substring pattern, and the literal
+# each regex requires, go into one Aho-Corasick automaton, so a description is scanned
+# once whatever the number of rules. Only the (few) rules whose literal hit are then
+# confirmed (regex) and checked for amount/account, in priority order.
+
+try:  # the regex parser moved in 3.11; it is only used to pull literals out of rule patterns
+    from re import _parser
+except ImportError:  # pragma: no cover
+    import sre_parse as _parser
+
+DEFAULT_BATCH_SIZE = 5000
+_TEXT_CACHE_LIMIT = 100_000  # bank descriptions repeat a lot; remember pattern hits per text
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton: one pass over a text reports every pattern it contains."""
+    def __init__(self, patterns: Iterable[tuple[str, int]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        for text, value in patterns:
+            node = 0
+            for ch in text:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] += (value,)
+
+        # Breadth-first: a node's fail link is the longest proper suffix that is also a prefix
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> set[int]:
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hits.update(out[node])
+        return hits
+
+
+@dataclass(frozen=True)
+class _Check:
+    category_id: str
+    min_cents: Optional[int]
+    max_cents: Optional[int]
+    account_id: Optional[str]
+
+    def accepts(self, cents: int, account_id: Optional[str]) -> bool:
+        return ((self.min_cents is None or cents >= self.min_cents)
+                and (self.max_cents is None or cents <= self.max_cents)
+                and (self.account_id is None or account_id == self.account_id))
+
+
+class RuleMatcher:
+    """
+    Compiled rule set. match() returns the category of the best-priority rule whose
+    conditions all hold, or None. Rule ranks are positions in (priority, id) order.
+    """
+    def __init__(self, rules: Sequence[CategoryRule]) -> None:
+        ordered = sorted((r for r in rules if r.active), key=lambda r: (r.priority, r.id))
+        self._checks = [
+            _Check(r.category_id,
+                   None if r.min_amount is None else to_cents(r.min_amount),
+                   None if r.max_amount is None else to_cents(r.max_amount),
+                   r.account_id)
+            for r in ordered
+        ]
+        substrings, self._always = [], []
+        self._regex: dict[int, re.Pattern] = {}    # rank -> regex verified after its literal hit
+        self._unfiltered: list[tuple[re.Pattern, int]] = []  # regexes with no required literal
+        for rank, r in enumerate(ordered):
+            if not r.pattern:
+                self._always.append(rank)
+            elif r.kind == RuleKind.REGEX:
+                try:
+                    rx = re.compile(r.pattern, re.IGNORECASE | re.DOTALL)
+                except re.error as e:
+                    raise ValueError(f"Rule {r.id}: invalid regex {r.pattern!r}: {e}") from e
+                literal = _required_literal(r.pattern)
+                if literal:
+                    substrings.append((literal, rank))
+                    self._regex[rank] = rx
+                else:
+                    self._unfiltered.append((rx, rank))
+            else:
+                substrings.append((r.pattern.lower(), rank))
+        self._automaton = AhoCorasick(substrings) if substrings else None
+        self._hits: dict[str, tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._checks)
+
+    def _pattern_hits(self, text: str) -> tuple[int, ...]:
+        hits = self._hits.get(text)
+        if hits is None:
+            found = set(self._always)
+            if self._automaton is not None:
+                regex = self._regex
+                for rank in self._automaton.search(text.lower()):
+                    rx = regex.get(rank)
+                    if rx is None or rx.search(text):
+                        found.add(rank)
+            found.update(rank for rx, rank in self._unfiltered if rx.search(text))
+            hits = tuple(sorted(found))
+            if len(self._hits) >= _TEXT_CACHE_LIMIT:
+                self._hits.clear()
+            self._hits[text] = hits
+        return hits
+
+    def match(self, description: str, cents: int, account_id: Optional[str] = None) -> Optional[str]:
+        """Category id for a transaction (amount in signed integer cents), or None."""
+        checks = self._checks
+        for rank in self._pattern_hits(description or ""):
+            if checks[rank].accepts(cents, account_id):
+                return checks[rank].category_id
+        return None
+
+
+def _required_literal(pattern: str, min_len: int = 3) -> Optional[str]:
+    """
+    Longest run of plain characters that every match of `pattern` must contain, lowercased,
+    or None. Regex rules go into the automaton under this literal, so a regex only runs on
+    descriptions that already contain it.
+    """
+    try:
+        parsed = _parser.parse(pattern)
+    except re.error:
+        return None
+    best, run = "", []
+    for op, arg in list(parsed) + [(None, None)]:
+        if op is _parser.LITERAL:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    return best.lower() if len(best) >= min_len else None
+
+
+# Loading and applying
+def load_rules(s: Session, user_id: Optional[str] = None) -> list[CategoryRule]:
+    """Active rules that apply to user_id: the shared ones plus the user's own."""
+    stmt = select(CategoryRule).where(CategoryRule.active.is_(True))
+    stmt = stmt.where(or_(CategoryRule.user_id.is_(None), CategoryRule.user_id == user_id))
+    return list(s.scalars(stmt))
+
+
+def matcher_for(s: Session, user_id: Optional[str] = None) -> RuleMatcher:
+    return RuleMatcher(load_rules(s, user_id))
+
+
+def suggest_category(
+        s: Session, description: str, amount: Decimal, account_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+) -> Optional[str]:
+    """Category the rules would give a single new transaction, or None. The user defaults to the account's owner."""
+    if user_id is None and account_id is not None:
+        user_id = s.scalar(select(Account.user_id).where(Account.id == account_id))
+    return matcher_for(s, user_id).match(description, to_cents(amount), account_id)
+
+
+def recategorize(
+        s: Session,
+        overwrite: bool = False,
+        user_id: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Run the rules over the ledger and write the changes with one executemany UPDATE per
+    batch. By default only uncategorized transactions are touched; overwrite=True
+    re-evaluates every row (rows no rule matches keep their category). Each user's rows
+    see the shared rules plus that user's own. Archived history is left alone.
+    Returns rows changed. Does not commit.
+    """
+    # Batches walk the table in rowid order (a plain b-tree range read). Filtering on
+    # category_id/user_id in SQL would pull the planner onto those indexes and re-sort
+    # every batch, so those filters run here instead.
+    rowid = literal_column("transactions.rowid")
+    stmt = select(
+        rowid, Transaction.id, Transaction.user_id, Transaction.account_id,
+        Transaction.description, cents_expr(Transaction.amount), Transaction.category_id,
+    ).order_by(rowid).limit(batch_size)
+    write = (
+        update(Transaction.__table__)
+        .where(Transaction.id == bindparam("tx_id"))
+        .values(category_id=bindparam("new_category_id"))
+    )
+
+    matchers: dict[Optional[str], RuleMatcher] = {}
+    changed, last = 0, 0
+    while True:
+        rows = s.execute(stmt.where(rowid > last)).all()
+        if not rows:
+            return changed
+        updates = []
+        for _, tx_id, owner, account_id, description, cents, current in rows:
+            if (current is not None and not overwrite) or (user_id is not None and owner != user_id):
+                continue
+            matcher = matchers.get(owner)
+            if matcher is None:
+                matcher = matchers[owner] = matcher_for(s, owner)
+            category_id = matcher.match(description, int(cents), account_id)
+            if category_id is not None and category_id != current:
+                updates.append({"tx_id": tx_id, "new_category_id": category_id})
+        if updates:
+            s.execute(write, updates)
+            changed += len(updates)
+        last = rows[-1][0]
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr
+from .archive import transaction_source
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    np = None
+
+EPOCH_JULIAN_DAY = 2440587.5  # julianday('1970-01-01')
+UNCATEGORIZED = -1
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("The columnar API requires numpy (pip install finance-tracker[analytics])")
+
+
+def _factorize(values: Sequence[Optional[str]], index: dict[str, int]) -> list[int]:
+    """Map ids to dense integer codes, growing index as new ids appear (None -> UNCATEGORIZED)."""
+    out = []
+    for v in values:
+        if v is None:
+            out.append(UNCATEGORIZED)
+        else:
+            code = index.get(v)
+            if code is None:
+                code = index[v] = len(index)
+            out.append(code)
+    return out
+
+
+@dataclass(frozen=True)
+class TransactionColumns:
+    """
+    The ledger as parallel NumPy arrays, one element per transaction.
+    account/category hold integer codes into account_ids/category_ids
+    (category is UNCATEGORIZED (-1) when a transaction has none).
+    """
+    date: Any          # datetime64[D]
+    account: Any       # int32 codes
+    category: Any      # int32 codes
+    amount_cents: Any  # int64, signed (+credit / -debit)
+    account_ids: tuple[str, ...]
+    category_ids: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    def to_arrow(self):
+        """pyarrow Table with dictionary-encoded account/category columns."""
+        try:
+            import pyarrow as pa
+        except ModuleNotFoundError as e:
+            raise RuntimeError("to_arrow() requires pyarrow (pip install finance-tracker[parquet])") from e
+
+        def dict_col(codes, labels):
+            mask = codes < 0
+            indices = pa.array(np.where(mask, 0, codes), mask=mask, type=pa.int32())
+            return pa.DictionaryArray.from_arrays(indices, pa.array(labels or [""], type=pa.string()))
+
+        return pa.table({
+            "date": pa.array(self.date),
+            "account_id": dict_col(self.account, list(self.account_ids)),
+            "category_id": dict_col(self.category, list(self.category_ids)),
+            "amount_cents": pa.array(self.amount_cents),
+        })
+
+
+def fetch_transactions(
+        s: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        account_id: Optional[str] = None,
+        chunk_size: int = 50_000,
+        user_id: Optional[str] = None,
+) -> TransactionColumns:
+    """
+    Fetch (date, account, category, amount in cents) straight into arrays, in storage order.
+    Day numbers and cents are computed in SQL and rows are read from the DBAPI cursor
+    in chunks, so no Decimal/date/Row objects are built per transaction.
+    """
+    _require_numpy()
+    tx = transaction_source(s, start)
+    day_expr = cast(func.julianday(tx.date) - EPOCH_JULIAN_DAY, Integer)
+    stmt = select(day_expr, tx.account_id, tx.category_id, cents_expr(tx.amount))
+    if start:
+        stmt = stmt.where(tx.date >= start)
+    if end:
+        stmt = stmt.where(tx.date <= end)
+    if account_id:
+        stmt = stmt.where(tx.account_id == account_id)
+    if user_id:
+        stmt = stmt.where(tx.user_id == user_id)
+
+    days, accts, cats, cents = [], [], [], []
+    acct_index: dict[str, int] = {}
+    cat_index: dict[str, int] = {}
+    result = s.connection().execute(stmt)
+    try:
+        cursor = result.cursor
+        while part := cursor.fetchmany(chunk_size):
+            d, a, c, amt = zip(*part)
+            days.append(np.fromiter(d, dtype=np.int64, count=len(d)))
+            accts.append(np.fromiter(_factorize(a, acct_index), dtype=np.int32, count=len(a)))
+            cats.append(np.fromiter(_factorize(c, cat_index), dtype=np.int32, count=len(c)))
+            cents.append(np.fromiter(amt, dtype=np.int64, count=len(amt)))
+    finally:
+        result.close()
+
+    def cat(parts, dtype):
+        return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+    return TransactionColumns(
+        date=cat(days, np.int64).astype("datetime64[D]"),
+        account=cat(accts, np.int32),
+        category=cat(cats, np.int32),
+        amount_cents=cat(cents, np.int64),
+        account_ids=tuple(acct_index),
+        category_ids=tuple(cat_index),
+    )
+
+
+# Vectorized helpers
+def group_sum(codes, values, n_groups: Optional[int] = None):
+    """Sum values per integer code (codes < 0 are dropped). Exact for int64 cents below 2**53."""
+    _require_numpy()
+    keep = codes >= 0
+    sums = np.bincount(codes[keep], weights=values[keep], minlength=n_groups or 0)
+    return np.rint(sums).astype(np.int64) if np.issubdtype(values.dtype, np.integer) else sums
+
+
+def sum_by_account(cols: TransactionColumns) -> dict[str, int]:
+    sums = group_sum(cols.account, cols.amount_cents, len(cols.account_ids))
+    return dict(zip(cols.account_ids, sums.tolist()))
+
+
+def sum_by_category(cols: TransactionColumns, expenses_only: bool = True) -> dict[Optional[str], int]:
+    """Cents per category id (None = uncategorized); expenses are returned as positive spend."""
+    amounts = cols.amount_cents
+    if expenses_only:
+        amounts = np.where(amounts < 0, -amounts, 0)
+    sums = group_sum(cols.category + 1, amounts, len(cols.category_ids) + 1)
+    return dict(zip((None, *cols.category_ids), sums.tolist()))
+
+
+def daily_totals(cols: TransactionColumns, start: date, end: date):
+    """(days, cents) with one entry per calendar day from start to end, zero-filled."""
+    _require_numpy()
+    first = np.datetime64(start, "D")
+    n = (np.datetime64(end, "D") - first).astype(int) + 1
+    offsets = (cols.date - first).astype(np.int64)
+    keep = (offsets >= 0) & (offsets < n)
+    totals = group_sum(offsets[keep], cols.amount_cents[keep], n)
+    return first + np.arange(n), totals
+
+
+def monthly_totals(cols: TransactionColumns):
+    """(months, cents) for every month that has transactions, as datetime64[M]."""
+    _require_numpy()
+    months = cols.date.astype("datetime64[M]")
+    labels, codes = np.unique(months, return_inverse=True)
+    return labels, group_sum(codes.astype(np.int64), cols.amount_cents, len(labels))
+
+
+def rolling_sum(values, window: int):
+    """Trailing window sums; the first window-1 entries cover the shorter prefix."""
+    _require_numpy()
+    if window < 1:
+        raise ValueError("window must be >= 1")
+    csum = np.cumsum(values)
+    out = csum.copy()
+    out[window:] = csum[window:] - csum[:-window]
+    return out
+
+
+def rolling_mean(values, window: int):
+    counts = np.minimum(np.arange(1, len(values) + 1), window)
+    return rolling_sum(values, window) / counts
+
+
+def percentiles(values, q: Sequence[float] = (50, 90, 99)) -> dict[float, float]:
+    _require_numpy()
+    if len(values) == 0:
+        return {p: float("nan") for p in q}
+    return dict(zip(q, np.percentile(values, q).tolist()))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+from datetime import date
+from typing import Sequence, TypeVar
+
+from .reports import GRANULARITIES, Granularity, period_starts
+
+# Chart data is reduced in two steps: the database buckets the visible range at the
+# finest granularity that stays within a few points per pixel, then LTTB picks the
+# points that best keep the shape of the line, down to one per pixel.
+
+OVERSAMPLE = 2  # buckets fetched per pixel before LTTB
+P = TypeVar("P")
+
+
+def pick_granularity(start: date, end: date, width: int, oversample: int = OVERSAMPLE) -> Granularity:
+    """Finest bucket size that yields at most width * oversample buckets over [start, end]."""
+    budget = max(width, 1) * oversample
+    for g in GRANULARITIES:
+        if len(period_starts(start, end, g)) <= budget:
+            return g
+    return GRANULARITIES[-1]
+
+
+def lttb_indices(xs: Sequence[float], ys: Sequence[float], threshold: int) -> list[int]:
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points to keep from a series
+    sorted by x. The first and last points are always kept; from each bucket in between
+    the point forming the largest triangle with the previous pick and the next bucket's
+    average is chosen, so peaks and troughs survive.
+    """
+    n = len(xs)
+    if threshold >= n:
+        return list(range(n))
+    if threshold < 3:
+        return [0, n - 1][:max(threshold, 0)]
+    every = (n - 2) / (threshold - 2)
+    picked = [0]
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        nlo, nhi = hi, min(int((i + 2) * every) + 1, n)
+        span = nhi - nlo
+        avg_x = sum(xs[nlo:nhi]) / span
+        avg_y = sum(ys[nlo:nhi]) / span
+        ax, ay = xs[a], ys[a]
+        best, best_area = lo, -1.0
+        for j in range(lo, hi):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        picked.append(best)
+        a = best
+    picked.append(n - 1)
+    return picked
+
+
+def lttb(points: Sequence[tuple[date, P]], threshold: int) -> list[tuple[date, P]]:
+    """Downsample (date, value) points to at most `threshold` with lttb_indices()."""
+    if len(points) <= threshold:
+        return list(points)
+    xs = [d.toordinal() for d, _ in points]
+    ys = [float(v) for _, v in points]
+    return [points[i] for i in lttb_indices(xs, ys, threshold)]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+import re
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr
+from ..models.transaction import Transaction
+from .transactions import bulk_delete
+
+# Candidates are blocked by (account_id, amount in cents, date bucket) in a hash index;
+# descriptions are only compared inside a block (and the neighbouring date bucket, so a
+# pair straddling a bucket edge is still seen). Rows are read in (account_id, date) order
+# off ix_transactions_account_date, so the index only ever holds one account's blocks.
+
+DEFAULT_WINDOW_DAYS = 2
+DEFAULT_THRESHOLD = 0.6
+_NOISE = re.compile(r"[^a-z]+")  # card suffixes, dates and reference numbers differ between sources
+
+
+@dataclass(frozen=True)
+class DuplicateGroup:
+    keep_id: str
+    duplicate_ids: tuple[str, ...]
+    account_id: str
+    date: date
+    amount_cents: int
+    description: str
+    score: float  # lowest pairwise similarity that joined the group
+
+
+@dataclass
+class _Row:
+    id: str
+    date: date
+    description: str
+    norm: str
+    grams: frozenset[str]
+    category_id: Optional[str]
+    external_ref: Optional[str]
+
+
+def _normalize(description: str) -> str:
+    return _NOISE.sub(" ", (description or "").lower()).strip()
+
+
+def _bigrams(norm: str) -> frozenset[str]:
+    return frozenset(norm[i:i + 2] for i in range(len(norm) - 1)) if len(norm) > 1 else frozenset((norm,))
+
+
+def similarity(a: _Row, b: _Row) -> float:
+    """
+    1.0 for the same import reference, 0.0 for two different ones, else the Dice coefficient
+    of the descriptions' character bigrams (set operations only, so cheap per pair).
+    """
+    if a.external_ref and b.external_ref:
+        return 1.0 if a.external_ref == b.external_ref else 0.0
+    if a.norm == b.norm:
+        return 1.0
+    return 2 * len(a.grams & b.grams) / (len(a.grams) + len(b.grams))
+
+
+def _keeper(rows: list[_Row]) -> _Row:
+    """Keep the most complete row: categorized, then with an import reference, then the earliest."""
+    return min(rows, key=lambda r: (r.category_id is None, r.external_ref is None, r.date, r.id))
+
+
+def find_duplicates(
+        s: Session,
+        window_days: int = DEFAULT_WINDOW_DAYS,
+        threshold: float = DEFAULT_THRESHOLD,
+        user_id: Optional[str] = None,
+        date_from: Optional[date] = None,
+) -> list[DuplicateGroup]:
+    """
+    Groups of likely duplicate transactions: same account and amount, dates at most
+    window_days apart, descriptions at least `threshold` similar. Pairs are joined
+    transitively into groups.
+    """
+    width = max(window_days, 1)
+    stmt = select(
+        Transaction.id, Transaction.account_id, Transaction.date, cents_expr(Transaction.amount),
+        Transaction.description, Transaction.category_id, Transaction.external_ref,
+    ).order_by(Transaction.account_id, Transaction.date)
+    if user_id is not None:
+        stmt = stmt.where(Transaction.user_id == user_id)
+    if date_from is not None:
+        stmt = stmt.where(Transaction.date >= date_from)
+
+    parent: dict[str, str] = {}
+    rows_by_id: dict[str, _Row] = {}
+    meta: dict[str, tuple[str, int]] = {}
+    scores: dict[str, float] = {}
+
+    def find(x: str) -> str:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    blocks: dict[tuple[int, int], list[_Row]] = {}
+    current_account = None
+    for tx_id, account_id, on, cents, description, category_id, external_ref in s.execute(stmt):
+        if account_id != current_account:
+            blocks.clear()
+            current_account = account_id
+        norm = _normalize(description)
+        row = _Row(tx_id, on, description or "", norm, _bigrams(norm), category_id, external_ref)
+        bucket = on.toordinal() // width
+        for key in ((cents, bucket - 1), (cents, bucket)):
+            for other in blocks.get(key, ()):
+                if (on - other.date).days > window_days:
+                    continue
+                score = similarity(row, other)
+                if score < threshold:
+                    continue
+                for r in (row, other):
+                    if r.id not in parent:
+                        parent[r.id] = r.id
+                        rows_by_id[r.id] = r
+                        meta[r.id] = (account_id, int(cents))
+                a, b = find(row.id), find(other.id)
+                if a != b:
+                    parent[b] = a
+                    scores[a] = min(scores.pop(b, 1.0), scores.get(a, 1.0), score)
+                else:
+                    scores[a] = min(scores.get(a, 1.0), score)
+        blocks.setdefault((cents, bucket), []).append(row)
+
+    members: dict[str, list[_Row]] = {}
+    for tx_id in parent:
+        members.setdefault(find(tx_id), []).append(rows_by_id[tx_id])
+    groups = []
+    for root, rows in members.items():
+        keep = _keeper(rows)
+        account_id, cents = meta[keep.id]
+        groups.append(DuplicateGroup(
+            keep_id=keep.id,
+            duplicate_ids=tuple(sorted(r.id for r in rows if r.id != keep.id)),
+            account_id=account_id, date=keep.date, amount_cents=cents,
+            description=keep.description, score=round(scores.get(root, 1.0), 3),
+        ))
+    return sorted(groups, key=lambda g: (g.account_id, g.date, g.keep_id))
+
+
+def merge_duplicates(s: Session, groups: Iterable[DuplicateGroup]) -> int:
+    """
+    Delete each group's duplicates (balances and snapshots follow via bulk_delete), first
+    copying a category or import reference onto the kept row where it has none.
+    Returns rows deleted. Does not commit.
+    """
+    groups = list(groups)
+    doomed = [tx_id for g in groups for tx_id in g.duplicate_ids]
+    if not doomed:
+        return 0
+    extra = {
+        r.id: r for r in s.execute(
+            select(Transaction.id, Transaction.category_id, Transaction.external_ref).where(Transaction.id.in_(doomed))
+        )
+    }
+    for g in groups:
+        keep = s.get(Transaction, g.keep_id)
+        for tx_id in g.duplicate_ids:
+            dup = extra.get(tx_id)
+            if keep is None or dup is None:
+                continue
+            if keep.category_id is None and dup.category_id is not None:
+                keep.category_id = dup.category_id
+            if keep.external_ref is None and dup.external_ref is not None:
+                keep.external_ref = dup.external_ref
+    s.flush()
+    return bulk_delete(s, doomed)
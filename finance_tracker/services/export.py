@@ -0,0 +1,196 @@
+from __future__ import annotations
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Sequence
+import csv
+import json
+import sys
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.account import Account
+from ..models.category import Category
+from .archive import transaction_source
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_SIZE = 5000
+
+TRANSACTION_COLUMNS: tuple[str, ...] = (
+    "id", "date", "account", "category", "type", "amount", "description", "external_ref",
+)
+
+
+# Helpers
+def jsonable(value: Any) -> Any:
+    """Plain JSON/CSV value for the types reports and rows carry."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def format_for(path: str | Path, fmt: Optional[str] = None) -> str:
+    """Explicit format, else inferred from the file suffix (default csv)."""
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        suffix = Path(str(path)).suffix.lower().lstrip(".")
+        fmt = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(suffix, suffix) or "csv"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format {fmt!r}; expected one of {FORMATS}")
+    return fmt
+
+
+# Sources
+def transaction_chunks(
+        s: Session,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        account_id: Optional[str] = None,
+        category_id: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        user_id: Optional[str] = None,
+) -> Iterator[Sequence[tuple]]:
+    """
+    Stream transactions as tuples in TRANSACTION_COLUMNS order, chunk_size rows at a time.
+    Uses yield_per so only one chunk is ever held in memory.
+    """
+    tx = transaction_source(s, start)
+    stmt = (
+        select(
+            tx.id, tx.date, Account.name, Category.name, tx.type,
+            tx.amount, tx.description, tx.external_ref,
+        )
+        .join(Account, Account.id == tx.account_id)
+        .join(Category, Category.id == tx.category_id, isouter=True)
+        .order_by(tx.date, tx.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    if start:
+        stmt = stmt.where(tx.date >= start)
+    if end:
+        stmt = stmt.where(tx.date <= end)
+    if account_id:
+        stmt = stmt.where(tx.account_id == account_id)
+    if category_id:
+        stmt = stmt.where(tx.category_id == category_id)
+    if user_id:
+        stmt = stmt.where(tx.user_id == user_id)
+
+    for part in s.execute(stmt).partitions():
+        yield [tuple(r) for r in part]
+
+
+def report_records(rows: Iterable[Any]) -> tuple[tuple[str, ...], list[tuple]]:
+    """
+    Flatten report DTOs into (columns, rows). Series DTOs (with a `points` field)
+    are expanded to long format: one row per (series, period_start).
+    """
+    columns: tuple[str, ...] = ()
+    out: list[tuple] = []
+    for row in ([rows] if is_dataclass(rows) else rows):
+        names = [f.name for f in fields(row)]
+        if "points" in names:
+            head = [n for n in names if n != "points"]
+            point_names = [f.name for f in fields(row.points[0])] if row.points else ["period_start", "value"]
+            columns = columns or tuple(head + point_names)
+            for p in row.points:
+                out.append(tuple(getattr(row, n) for n in head) + tuple(getattr(p, n) for n in point_names))
+        else:
+            columns = columns or tuple(names)
+            out.append(tuple(getattr(row, n) for n in names))
+    return columns, out
+
+
+# Writers
+def write_csv(chunks: Iterable[Sequence[tuple]], columns: Sequence[str], fp: IO[str]) -> int:
+    w = csv.writer(fp)
+    w.writerow(columns)
+    n = 0
+    for chunk in chunks:
+        w.writerows([jsonable(v) for v in r] for r in chunk)
+        n += len(chunk)
+    return n
+
+
+def write_jsonl(chunks: Iterable[Sequence[tuple]], columns: Sequence[str], fp: IO[str]) -> int:
+    n = 0
+    for chunk in chunks:
+        fp.write("".join(
+            json.dumps({c: jsonable(v) for c, v in zip(columns, r)}, ensure_ascii=False) + "\n"
+            for r in chunk
+        ))
+        n += len(chunk)
+    return n
+
+
+def write_parquet(chunks: Iterable[Sequence[tuple]], columns: Sequence[str], path: str | Path) -> int:
+    """One row group per chunk. Requires the optional pyarrow dependency."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError as e:
+        raise RuntimeError("Parquet export requires pyarrow (pip install finance-tracker[parquet])") from e
+
+    writer = None
+    n = 0
+    try:
+        for chunk in chunks:
+            cols = list(zip(*chunk)) if chunk else [() for _ in columns]
+            cols = [[v.value if isinstance(v, Enum) else v for v in col] for col in cols]
+            if writer is None:
+                # Fix the schema from the first chunk: widen decimals, type all-null columns as strings
+                fields_ = []
+                for name, col in zip(columns, cols):
+                    t = pa.array(col).type
+                    if pa.types.is_decimal(t):
+                        t = pa.decimal128(38, max(t.scale, 2))
+                    elif pa.types.is_null(t):
+                        t = pa.string()
+                    fields_.append(pa.field(name, t))
+                writer = pq.ParquetWriter(str(path), pa.schema(fields_))
+            arrays = [pa.array(col, type=f.type) for col, f in zip(cols, writer.schema)]
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=writer.schema))
+            n += len(chunk)
+        if writer is None:
+            writer = pq.ParquetWriter(str(path), pa.schema([(c, pa.string()) for c in columns]))
+    finally:
+        if writer is not None:
+            writer.close()
+    return n
+
+
+def write_chunks(
+        chunks: Iterable[Sequence[tuple]],
+        columns: Sequence[str],
+        path: str | Path,
+        fmt: Optional[str] = None,
+) -> int:
+    """Write chunks to path ('-' is stdout for csv/jsonl). Returns the number of rows written."""
+    fmt = format_for(path, fmt)
+    if fmt == "parquet":
+        if str(path) == "-":
+            raise ValueError("Parquet export needs a file path")
+        return write_parquet(chunks, columns, path)
+
+    writer = write_csv if fmt == "csv" else write_jsonl
+    if str(path) == "-":
+        return writer(chunks, columns, sys.stdout)
+    with open(path, "w", newline="" if fmt == "csv" else None, encoding="utf-8") as fp:
+        return writer(chunks, columns, fp)
+
+
+def export_transactions(s: Session, path: str | Path, fmt: Optional[str] = None, **filters) -> int:
+    return write_chunks(transaction_chunks(s, **filters), TRANSACTION_COLUMNS, path, fmt)
+
+
+def export_report(rows: Iterable[Any], path: str | Path, fmt: Optional[str] = None) -> int:
+    columns, records = report_records(rows)
+    return write_chunks([records], columns, path, fmt)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from threading import Lock
+from typing import Iterable, Optional
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from ..models.account import Account
+from ..models.goal import Goal
+
+CENT = Decimal("0.01")
+
+
+# Helpers
+def months_between(start: date, end: date) -> int:
+    """Whole calendar months from start to end, counting a partial month as one (never below 1)."""
+    months = (end.year - start.year) * 12 + (end.month - start.month)
+    if end.day > start.day:
+        months += 1
+    return max(months, 1)
+
+
+# DTOs
+@dataclass(frozen=True)
+class GoalProgressRow:
+    goal_id: str
+    goal_name: str
+    account_id: Optional[str]
+    account_name: Optional[str]
+    target_amount: Decimal
+    target_date: Optional[date]
+    current: Decimal
+    remaining: Decimal
+    progress: Optional[Decimal]          # 0..1+, None when the target is zero
+    required_monthly: Optional[Decimal]  # None without a target date
+    on_track: Optional[bool]             # None without a target date
+
+
+# Reports
+def _goal_row(
+        goal_id: str,
+        name: str,
+        account_id: Optional[str],
+        account_name: Optional[str],
+        target,
+        target_date: Optional[date],
+        balance,
+        created_at,
+        today: date,
+) -> GoalProgressRow:
+    target_d = Decimal(str(target)) if target is not None else Decimal("0")
+    current = Decimal(str(balance)) if balance is not None else Decimal("0")
+    remaining = max(target_d - current, Decimal("0"))
+    progress = (current / target_d) if target_d else None
+
+    required: Optional[Decimal] = None
+    on_track: Optional[bool] = None
+    if remaining == 0:
+        required, on_track = Decimal("0.00"), True
+    elif target_date is not None:
+        if target_date <= today:
+            required, on_track = remaining, False
+        else:
+            required = (remaining / months_between(today, target_date)).quantize(CENT, ROUND_HALF_UP)
+            # On track when saved at least the straight-line share of the target for the time elapsed
+            start = created_at.date() if created_at is not None else today
+            total_days = (target_date - start).days
+            if total_days > 0:
+                elapsed = min(max((today - start).days, 0), total_days)
+                on_track = current >= target_d * elapsed / total_days
+            else:
+                on_track = False
+
+    return GoalProgressRow(
+        goal_id=goal_id,
+        goal_name=name,
+        account_id=account_id,
+        account_name=account_name,
+        target_amount=target_d,
+        target_date=target_date,
+        current=current,
+        remaining=remaining,
+        progress=progress,
+        required_monthly=required,
+        on_track=on_track,
+    )
+
+
+def goal_progress(
+        s: Session,
+        today: Optional[date] = None,
+        account_ids: Optional[Iterable[Optional[str]]] = None,
+        user_id: Optional[str] = None,
+        goal_ids: Optional[Iterable[str]] = None,
+) -> list[GoalProgressRow]:
+    """
+    Progress for every goal (or the goals linked to account_ids, or listed in goal_ids) in one
+    query joined to account balances. With user_id, only goals on that user's accounts are returned.
+    """
+    today = today or date.today()
+    stmt = (
+        select(
+            Goal.id, Goal.name, Goal.account_id, Account.name,
+            Goal.target_amount, Goal.target_date, Account.balance, Goal.created_at,
+        )
+        .join(Account, Account.id == Goal.account_id, isouter=True)
+        .order_by(Goal.name, Goal.id)
+    )
+    if account_ids is not None:
+        ids = list(account_ids)
+        linked = [a for a in ids if a is not None]
+        cond = Goal.account_id.in_(linked)
+        if None in ids:
+            cond = cond | Goal.account_id.is_(None)
+        stmt = stmt.where(cond)
+    if goal_ids is not None:
+        stmt = stmt.where(Goal.id.in_(list(goal_ids)))
+    if user_id is not None:
+        stmt = stmt.where(Account.user_id == user_id)
+
+    return [_goal_row(*r, today=today) for r in s.execute(stmt).all()]
+
+
+# Cache
+class GoalProgressCache:
+    """
+    Process-wide cache of goal progress rows.
+    Rows are dropped once a commit changes their goal or their linked account's balance (see
+    the listeners below) and recomputed on the next get() with one query for just those rows.
+    """
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._rows: dict[str, GoalProgressRow] | None = None
+        self._as_of: date | None = None
+        self._stale_accounts: set[str | None] = set()
+        self._stale_goals: set[str] = set()
+
+    def get(self, s: Session, today: Optional[date] = None) -> list[GoalProgressRow]:
+        today = today or date.today()
+        with self._lock:
+            if self._rows is None or self._as_of != today:
+                rows = {r.goal_id: r for r in goal_progress(s, today)}
+            else:
+                rows = self._rows
+                if self._stale_accounts:
+                    stale = self._stale_accounts
+                    rows = {gid: r for gid, r in rows.items() if r.account_id not in stale}
+                    rows.update((r.goal_id, r) for r in goal_progress(s, today, account_ids=stale))
+                if self._stale_goals:
+                    stale = self._stale_goals
+                    rows = {gid: r for gid, r in rows.items() if gid not in stale}
+                    rows.update((r.goal_id, r) for r in goal_progress(s, today, goal_ids=stale))
+            self._rows, self._as_of = rows, today
+            self._stale_accounts, self._stale_goals = set(), set()
+            return sorted(rows.values(), key=lambda r: (r.goal_name, r.goal_id))
+
+    def invalidate_accounts(self, account_ids: Iterable[Optional[str]]) -> None:
+        with self._lock:
+            if self._rows is not None:
+                self._stale_accounts.update(account_ids)
+
+    def invalidate_goals(self, goal_ids: Iterable[str]) -> None:
+        with self._lock:
+            if self._rows is not None:
+                self._stale_goals.update(goal_ids)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows = None
+            self._stale_accounts, self._stale_goals = set(), set()
+
+
+goal_progress_cache = GoalProgressCache()
+
+
+# Invalidation: changed ids are collected per session and only applied once committed
+_PENDING_ACCOUNTS = "_ft_goal_accounts"
+_PENDING_GOALS = "_ft_goal_ids"
+_STALE = "_ft_goals_stale"
+
+
+def _note(target, key: str, value) -> None:
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault(key, set()).add(value)
+
+
+@event.listens_for(Account, "after_update")
+def _on_account_updated(mapper, connection, target: Account) -> None:
+    if inspect(target).attrs.balance.history.has_changes():
+        _note(target, _PENDING_ACCOUNTS, target.id)
+
+
+@event.listens_for(Goal, "after_insert")
+@event.listens_for(Goal, "after_update")
+@event.listens_for(Goal, "after_delete")
+def _on_goal_changed(mapper, connection, target: Goal) -> None:
+    _note(target, _PENDING_GOALS, target.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_dml(state) -> None:
+    # Set-based DML skips the mapper events above: refresh everything after the commit
+    if (state.is_insert or state.is_update or state.is_delete) and getattr(
+            getattr(state.statement, "table", None), "name", None) in (Account.__tablename__, Goal.__tablename__):
+        state.session.info[_STALE] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    accounts = session.info.pop(_PENDING_ACCOUNTS, None)
+    goals = session.info.pop(_PENDING_GOALS, None)
+    if session.info.pop(_STALE, False):
+        goal_progress_cache.invalidate()
+        return
+    if accounts:
+        goal_progress_cache.invalidate_accounts(accounts)
+    if goals:
+        goal_progress_cache.invalidate_goals(goals)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_on_rollback(session: Session, previous_transaction) -> None:
+    # A rolled-back SAVEPOINT keeps the collected ids: refreshing a row is harmless, a stale one is not
+    if previous_transaction.parent is None:
+        for key in (_PENDING_ACCOUNTS, _PENDING_GOALS, _STALE):
+            session.info.pop(key, None)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+import csv
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import IO, Iterable
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr, from_cents, to_cents
+from ..models.transaction import Transaction
+
+DEFAULT_TOLERANCE_DAYS = 3
+
+
+@dataclass(frozen=True)
+class StatementLine:
+    date: date
+    amount: Decimal  # signed like Transaction.amount: +credit / -debit
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class LedgerItem:
+    id: str
+    date: date
+    amount: Decimal
+    description: str
+
+
+@dataclass
+class ReconcileResult:
+    matched: list[tuple[StatementLine, LedgerItem]] = field(default_factory=list)
+    unmatched_statement: list[StatementLine] = field(default_factory=list)
+    unmatched_ledger: list[LedgerItem] = field(default_factory=list)
+
+    @property
+    def is_reconciled(self) -> bool:
+        return not self.unmatched_statement and not self.unmatched_ledger
+
+
+def read_statement_csv(fp: IO[str]) -> list[StatementLine]:
+    """Statement lines from a CSV with date (ISO), amount and optional description columns."""
+    return [
+        StatementLine(date.fromisoformat(row["date"].strip()), Decimal(row["amount"].strip()),
+                      (row.get("description") or "").strip())
+        for row in csv.DictReader(fp)
+    ]
+
+
+def match_lines(
+        lines: Iterable[StatementLine],
+        ledger: Iterable[tuple[str, date, int, str]],
+        tolerance_days: int = DEFAULT_TOLERANCE_DAYS,
+) -> ReconcileResult:
+    """
+    Merge-join statement lines with ledger rows (id, date, cents, description), both taken in
+    (date, amount) order: one pass over each side. Ledger rows within tolerance_days of the
+    current line wait in a per-amount queue; a line takes the oldest waiting row with its exact
+    amount (the one whose window closes first), and rows that fall out of the window unmatched
+    are reported as such.
+    """
+    tol = timedelta(days=tolerance_days)
+    result = ReconcileResult()
+    rows = iter(sorted(ledger, key=lambda r: (r[1], r[2])))
+    upcoming = next(rows, None)
+    window: deque[list] = deque()          # [item, cents, matched] in date order
+    by_cents: dict[int, deque[list]] = {}  # unmatched entries of the window per amount, oldest first
+
+    def expire(cutoff: date) -> None:
+        while window and window[0][0].date < cutoff:
+            entry = window.popleft()
+            if not entry[2]:
+                by_cents[entry[1]].popleft()  # unmatched entries leave their queue in date order too
+                result.unmatched_ledger.append(entry[0])
+
+    for line in sorted(lines, key=lambda l: (l.date, l.amount)):
+        cents = to_cents(line.amount)
+        while upcoming is not None and upcoming[1] <= line.date + tol:
+            tx_id, on, c, description = upcoming
+            entry = [LedgerItem(tx_id, on, from_cents(c), description or ""), c, False]
+            window.append(entry)
+            by_cents.setdefault(c, deque()).append(entry)
+            upcoming = next(rows, None)
+        expire(line.date - tol)
+
+        waiting = by_cents.get(cents)
+        if waiting:
+            entry = waiting.popleft()
+            entry[2] = True
+            result.matched.append((line, entry[0]))
+        else:
+            result.unmatched_statement.append(line)
+
+    expire(date.max)
+    while upcoming is not None:
+        tx_id, on, c, description = upcoming
+        result.unmatched_ledger.append(LedgerItem(tx_id, on, from_cents(c), description or ""))
+        upcoming = next(rows, None)
+    return result
+
+
+def reconcile(
+        s: Session,
+        account_id: str,
+        lines: list[StatementLine],
+        tolerance_days: int = DEFAULT_TOLERANCE_DAYS,
+        apply: bool = True,
+        include_cleared: bool = False,
+) -> ReconcileResult:
+    """
+    Reconcile one account against a statement: match the statement period's transactions
+    (uncleared ones unless include_cleared) and, with apply, mark the matched ones cleared
+    with one executemany UPDATE. Does not commit.
+    """
+    if not lines:
+        return ReconcileResult()
+    tol = timedelta(days=tolerance_days)
+    start = min(l.date for l in lines) - tol
+    end = max(l.date for l in lines) + tol
+    stmt = (
+        select(Transaction.id, Transaction.date, cents_expr(Transaction.amount), Transaction.description)
+        .where(Transaction.account_id == account_id, Transaction.date >= start, Transaction.date <= end)
+        .order_by(Transaction.date)
+    )
+    if not include_cleared:
+        stmt = stmt.where(Transaction.cleared.is_(False))
+    result = match_lines(lines, ((r[0], r[1], int(r[2]), r[3]) for r in s.execute(stmt)), tolerance_days)
+
+    if apply and result.matched:
+        s.execute(
+            update(Transaction.__table__).where(Transaction.id == bindparam("tx_id")).values(cleared=True),
+            [{"tx_id": item.id} for _, item in result.matched],
+        )
+    return result
@@ -1,17 +1,19 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Iterable, Optional
+from typing import Iterable, Literal, Optional
 
-from sqlalchemy import func, select, and_, or_, case
+from sqlalchemy import func, select, and_, case, cast, Integer
 from sqlalchemy.orm import Session
 
-from ..db.base import SessionLocal
+from ..db.money import cents_expr, from_cents, sum_cents
 from ..models.account import Account
 from ..models.category import Category, CategoryType
 from ..models.transaction import Transaction
 from ..models.budget import Budget, BudgetItem
+from .archive import transaction_source
+from .snapshots import anchors
 
 
 # Helpers
@@ -22,6 +24,79 @@ def month_bounds(year: int, month: int) -> tuple[date, date]:
     return start, end
 
 
+Granularity = Literal["day", "week", "month", "quarter", "year"]
+GRANULARITIES: tuple[str, ...] = ("day", "week", "month", "quarter", "year")
+
+
+def period_start(d: date, granularity: Granularity) -> date:
+    """First day of the bucket containing d (weeks start on Monday)."""
+    if granularity == "day":
+        return d
+    if granularity == "week":
+        return d - timedelta(days=d.weekday())
+    if granularity == "month":
+        return d.replace(day=1)
+    if granularity == "quarter":
+        return date(d.year, (d.month - 1) // 3 * 3 + 1, 1)
+    if granularity == "year":
+        return date(d.year, 1, 1)
+    raise ValueError(f"Unknown granularity {granularity!r}; expected one of {GRANULARITIES}")
+
+
+def period_starts(start: date, end: date, granularity: Granularity) -> list[date]:
+    """Every bucket start from the bucket containing start through the one containing end."""
+    out: list[date] = []
+    cur = period_start(start, granularity)
+    while cur <= end:
+        out.append(cur)
+        if granularity == "day":
+            cur += timedelta(days=1)
+        elif granularity == "week":
+            cur += timedelta(days=7)
+        else:
+            step = {"month": 1, "quarter": 3, "year": 12}[granularity]
+            m = cur.month - 1 + step
+            cur = date(cur.year + m // 12, m % 12 + 1, 1)
+    return out
+
+
+def bucket_expr(col, granularity: Granularity):
+    """SQL expression for period_start(col) as 'YYYY-MM-DD' text (SQLite date functions)."""
+    if granularity == "day":
+        return func.date(col)
+    if granularity == "week":
+        return func.date(col, "-6 days", "weekday 1")
+    if granularity == "month":
+        return func.strftime("%Y-%m-01", col)
+    if granularity == "quarter":
+        month = cast(func.strftime("%m", col), Integer)
+        return func.printf("%s-%02d-01", func.strftime("%Y", col), (month - 1) // 3 * 3 + 1)
+    if granularity == "year":
+        return func.strftime("%Y-01-01", col)
+    raise ValueError(f"Unknown granularity {granularity!r}; expected one of {GRANULARITIES}")
+
+
+# Money is aggregated as integer cents in SQL; Decimal is created by from_cents() only
+def _income_cents(tx=Transaction):
+    """Sum of positive amounts, in cents."""
+    return sum_cents(case((tx.amount > 0, cents_expr(tx.amount)), else_=0))
+
+
+def _spend_cents(tx=Transaction):
+    """Money out as a positive number of cents (-sum of negative amounts)."""
+    return -sum_cents(case((tx.amount < 0, cents_expr(tx.amount)), else_=0))
+
+
+# User scope: None means every user's data. Transactions carry a denormalized
+# user_id, so scoping them is a plain filter on the (user_id, ...) indexes.
+def _tx_scope(user_id: Optional[str], tx=Transaction) -> list:
+    return [tx.user_id == user_id] if user_id is not None else []
+
+
+def _account_scope(user_id: Optional[str]) -> list:
+    return [Account.user_id == user_id] if user_id is not None else []
+
+
 # DTOs
 @dataclass(frozen=True)
 class BalanceRow:
@@ -55,38 +130,95 @@ class BudgetUtilizationRow:
     utilization: Optional[Decimal]
 
 
+@dataclass(frozen=True)
+class SeriesPoint:
+    period_start: date
+    value: Decimal
+
+
+@dataclass(frozen=True)
+class CategorySpendSeries:
+    category_id: str
+    category_name: str
+    points: tuple[SeriesPoint, ...]  # one per bucket, zero-filled
+
+
+@dataclass(frozen=True)
+class AccountSeries:
+    account_id: str
+    account_name: str
+    points: tuple[SeriesPoint, ...]  # one per bucket, zero-filled
+
+
+@dataclass(frozen=True)
+class MonthTotals:
+    account_id: str
+    category_id: Optional[str]
+    month: date   # first day of the month
+    income: int   # cents
+    spend: int    # cents, positive number representing money out
+    net: int      # cents
+
+
+@dataclass(frozen=True)
+class CashflowPoint:
+    period_start: date
+    income: Decimal
+    expenses: Decimal
+    net: Decimal
+
+
 # Reports
-def account_balances(s: Session, as_of: Optional[date] = None) -> list[BalanceRow]:
-    """Compute balance per account as starting_balance + sum(transactions.amount up to as_of)."""
-    tx_filter = []
+def account_balances(s: Session, as_of: Optional[date] = None, user_id: Optional[str] = None) -> list[BalanceRow]:
+    """
+    Balance per account as of a date: starting_balance + the newest month-end snapshot on or
+    before as_of + the transactions after that snapshot (or every transaction up to as_of for
+    an account with no snapshot yet). The delta is at most a month of rows per account.
+    """
+    anchor = anchors(as_of or date.max)
+    scoped = _account_scope(user_id)
+
+    # Read from the first day any in-scope account lacks a snapshot for (archive only if needed)
+    earliest, n_anchored, n_accounts = s.execute(
+        select(func.min(anchor.c.month_end), func.count(anchor.c.account_id), func.count(Account.id))
+        .select_from(Account)
+        .join(anchor, anchor.c.account_id == Account.id, isouter=True)
+        .where(*scoped)
+    ).one()
+    start = earliest + timedelta(days=1) if earliest is not None and n_anchored == n_accounts else None
+    tx = transaction_source(s, start)
+
+    on = [tx.account_id == Account.id, tx.date > func.coalesce(anchor.c.month_end, date.min)]
     if as_of is not None:
-        tx_filter.append(Transaction.date <= as_of)
-
-    tx_sum = func.coalesce(func.sum(Transaction.amount), 0)
+        on.append(tx.date <= as_of)
 
-    # left join so accounts without tx still show up
+    # left joins (conditions in ON) so accounts without tx still show up
     stmt = (
         select(
             Account.id,
             Account.name,
-            (Account.starting_balance + tx_sum).label("balance"),
+            Account.starting_balance,
+            func.coalesce(anchor.c.cents, 0).label("snapshot_cents"),
+            sum_cents(cents_expr(tx.amount)).label("tx_cents"),
         )
-        .join(Transaction, Transaction.account_id == Account.id, isouter=True)
-        .where(and_(*tx_filter) if tx_filter else True)
-        .group_by(Account.id, Account.name, Account.starting_balance)
+        .join(anchor, anchor.c.account_id == Account.id, isouter=True)
+        .join(tx, and_(*on), isouter=True)
+        .where(*scoped)
+        .group_by(Account.id, Account.name, Account.starting_balance, anchor.c.cents)
         .order_by(Account.name)
     )
     rows = s.execute(stmt).all()
-    return [BalanceRow(r[0], r[1], Decimal(str(r[2]))) for r in rows]
+    return [BalanceRow(r[0], r[1], (r[2] or Decimal("0")) + from_cents(r[3] + r[4])) for r in rows]
 
 
-def monthly_spend_by_category(s: Session, year: int, month: int) -> list[CategorySpendRow]:
+def monthly_spend_by_category(
+        s: Session, year: int, month: int, user_id: Optional[str] = None
+) -> list[CategorySpendRow]:
     start, end = month_bounds(year, month)
+    tx = transaction_source(s, start)
 
     # Only expenses; treat spend as positive number = -sum(negative amounts)
-    spend_expr = -func.coalesce(func.sum(
-        case((Transaction.amount < 0, Transaction.amount), else_=0)
-    ), 0)
+    spend_expr = _spend_cents(tx)
 
     stmt = (
         select(
@@ -94,12 +226,13 @@ def monthly_spend_by_category(s: Session, year: int, month: int) -> list[Categor
             Category.name,
             spend_expr.label("spend")
         )
-        .join(Transaction, Transaction.category_id == Category.id)
+        .join(tx, tx.category_id == Category.id)
         .where(
             and_(
                 Category.type == CategoryType.EXPENSE,
-                Transaction.date >= start,
-                Transaction.date <= end,
+                tx.date >= start,
+                tx.date <= end,
+                *_tx_scope(user_id, tx),
                 )
         )
         .group_by(Category.id, Category.name)
@@ -107,31 +240,47 @@ def monthly_spend_by_category(s: Session, year: int, month: int) -> list[Categor
         .order_by(spend_expr.desc(), Category.name)
     )
     rows = s.execute(stmt).all()
-    return [CategorySpendRow(r[0], r[1], Decimal(str(r[2]))) for r in rows]
+    return [CategorySpendRow(r[0], r[1], from_cents(r[2])) for r in rows]
 
 
-def cashflow(s: Session, start: date, end: date) -> Cashflow:
+def cashflow(s: Session, start: date, end: date, user_id: Optional[str] = None) -> Cashflow:
+    tx = transaction_source(s, start)
     # Income = sum of positive amounts; Expenses = -sum of negative amounts
-    income_expr = func.coalesce(func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0)), 0)
-    out_expr = -func.coalesce(func.sum(case((Transaction.amount < 0, Transaction.amount), else_=0)), 0)
-
     stmt = (
-        select(income_expr.label("income"), out_expr.label("expenses"))
-        .where(and_(Transaction.date >= start, Transaction.date <= end))
+        select(_income_cents(tx).label("income"), _spend_cents(tx).label("expenses"))
+        .where(and_(tx.date >= start, tx.date <= end, *_tx_scope(user_id, tx)))
     )
     income, expenses = s.execute(stmt).one()
-    income = Decimal(str(income))
-    expenses = Decimal(str(expenses))
+    income = from_cents(income)
+    expenses = from_cents(expenses)
     return Cashflow(income=income, expenses=expenses, net=income - expenses)
 
 
-def budget_utilization(s: Session, year: int, month: int) -> list[BudgetUtilizationRow]:
+def budget_utilization(
+        s: Session, year: int, month: int, user_id: Optional[str] = None
+) -> list[BudgetUtilizationRow]:
     start, end = month_bounds(year, month)
+    tx = transaction_source(s, start)
 
-    # Sum of negative amounts in the month for each category under each budget item
-    spend_expr = -func.coalesce(func.sum(
-        case((Transaction.amount < 0, Transaction.amount), else_=0)
-    ), 0)
+    # Sum of negative amounts in the month per category, pre-aggregated so only
+    # the month's rows are read (served by ix_transactions_category_date)
+    spend_expr = _spend_cents(tx)
+    month_spend = (
+        select(
+            tx.category_id.label("category_id"),
+            spend_expr.label("spent"),
+        )
+        .where(
+            and_(
+                tx.category_id.in_(select(BudgetItem.category_id)),
+                tx.date >= start,
+                tx.date <= end,
+                *_tx_scope(user_id, tx),
+            )
+        )
+        .group_by(tx.category_id)
+        .subquery("month_spend")
+    )
 
     stmt = (
         select(
@@ -140,59 +289,160 @@ def budget_utilization(s: Session, year: int, month: int) -> list[BudgetUtilizat
             Category.id.label("category_id"),
             Category.name.label("category_name"),
             BudgetItem.monthly_limit.label("monthly_limit"),
-            spend_expr.label("spent"),
+            func.coalesce(month_spend.c.spent, 0).label("spent"),
         )
         .join(BudgetItem, BudgetItem.budget_id == Budget.id)
         .join(Category, Category.id == BudgetItem.category_id)
-        .join(Transaction, Transaction.category_id == Category.id, isouter=True)
+        .join(month_spend, month_spend.c.category_id == BudgetItem.category_id, isouter=True)
+        .where(Category.type == CategoryType.EXPENSE)
+        .order_by(Budget.name, Category.name)
+    )
+
+    return [budget_utilization_row(*r) for r in s.execute(stmt).all()]
+
+
+def budget_utilization_row(b_id, b_name, c_id, c_name, limit, spent_cents) -> BudgetUtilizationRow:
+    limit_d = Decimal(str(limit)) if limit is not None else Decimal("0")
+    spent_d = from_cents(spent_cents)
+    util = (spent_d / limit_d) if limit_d and spent_d is not None else None
+    return BudgetUtilizationRow(
+        budget_id=b_id,
+        budget_name=b_name,
+        category_id=c_id,
+        category_name=c_name,
+        monthly_limit=limit_d,
+        spent=spent_d,
+        utilization=util,
+    )
+
+
+# Time-series reports (one GROUP BY over a bucketed date, gaps zero-filled)
+def _dense(periods: list[date], values: dict[date, Decimal]) -> tuple[SeriesPoint, ...]:
+    zero = Decimal("0")
+    return tuple(SeriesPoint(p, values.get(p, zero)) for p in periods)
+
+
+def spend_by_category_series(
+        s: Session, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[CategorySpendSeries]:
+    """Expense spend per category per bucket; categories with no spend in the range are omitted."""
+    tx = transaction_source(s, start)
+    periods = period_starts(start, end, granularity)
+    bucket = bucket_expr(tx.date, granularity).label("bucket")
+    spend_expr = _spend_cents(tx)
+
+    stmt = (
+        select(Category.id, Category.name, bucket, spend_expr.label("spend"))
+        .join(tx, tx.category_id == Category.id)
         .where(
             and_(
-                or_(Transaction.id.is_(None), and_(Transaction.date >= start, Transaction.date <= end)),
                 Category.type == CategoryType.EXPENSE,
-                )
+                tx.date >= start,
+                tx.date <= end,
+                *_tx_scope(user_id, tx),
+            )
         )
-        .group_by(
-            Budget.id, Budget.name,
-            Category.id, Category.name,
-            BudgetItem.monthly_limit
-        )
-        .order_by(Budget.name, Category.name)
+        .group_by(Category.id, Category.name, bucket)
     )
 
-    rows = s.execute(stmt).all()
-    out: list[BudgetUtilizationRow] = []
-    for b_id, b_name, c_id, c_name, limit, spent in rows:
-        limit_d = Decimal(str(limit)) if limit is not None else Decimal("0")
-        spent_d = Decimal(str(spent))
-        util = (spent_d / limit_d) if limit_d and spent_d is not None else None
-        out.append(BudgetUtilizationRow(
-            budget_id=b_id,
-            budget_name=b_name,
-            category_id=c_id,
-            category_name=c_name,
-            monthly_limit=limit_d,
-            spent=spent_d,
-            utilization=util,
-        ))
+    by_cat: dict[tuple[str, str], dict[date, Decimal]] = {}
+    for c_id, c_name, b, spend in s.execute(stmt).all():
+        if spend:
+            by_cat.setdefault((c_id, c_name), {})[date.fromisoformat(b)] = from_cents(spend)
+
+    out = [CategorySpendSeries(c_id, c_name, _dense(periods, vals)) for (c_id, c_name), vals in by_cat.items()]
+    out.sort(key=lambda r: (-sum(p.value for p in r.points), r.category_name))
     return out
 
 
-# Convenience runner (optional)
-def demo_print(year: int, month: int) -> None:
-    with SessionLocal() as s:
-        print("Balances:")
-        for row in account_balances(s):
-            print(f"  {row.account_name}: {row.balance}")
+def account_flow_series(
+        s: Session, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[AccountSeries]:
+    """Net transaction amount per account per bucket; every account is listed."""
+    tx = transaction_source(s, start)
+    periods = period_starts(start, end, granularity)
+    bucket = bucket_expr(tx.date, granularity).label("bucket")
 
-        print("\nMonthly spend by category:")
-        for row in monthly_spend_by_category(s, year, month):
-            print(f"  {row.category_name}: {row.spend}")
+    stmt = (
+        select(tx.account_id, bucket, sum_cents(cents_expr(tx.amount)).label("net"))
+        .where(and_(tx.date >= start, tx.date <= end, *_tx_scope(user_id, tx)))
+        .group_by(tx.account_id, bucket)
+    )
+    flows: dict[str, dict[date, Decimal]] = {}
+    for a_id, b, net in s.execute(stmt).all():
+        flows.setdefault(a_id, {})[date.fromisoformat(b)] = from_cents(net)
+
+    accounts = s.execute(
+        select(Account.id, Account.name).where(*_account_scope(user_id)).order_by(Account.name)
+    ).all()
+    return [AccountSeries(a_id, a_name, _dense(periods, flows.get(a_id, {}))) for a_id, a_name in accounts]
+
+
+def account_balance_series(
+        s: Session, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[AccountSeries]:
+    """Closing balance per account at the end of each bucket (opening balance + cumulative flows)."""
+    opening = {r.account_id: r.balance for r in account_balances(s, start - timedelta(days=1), user_id)}
+    out: list[AccountSeries] = []
+    for series in account_flow_series(s, start, end, granularity, user_id):
+        running = opening.get(series.account_id, Decimal("0"))
+        points = []
+        for p in series.points:
+            running += p.value
+            points.append(SeriesPoint(p.period_start, running))
+        out.append(AccountSeries(series.account_id, series.account_name, tuple(points)))
+    return out
 
-        start, end = month_bounds(year, month)
-        cf = cashflow(s, start, end)
-        print(f"\nCashflow {start}..{end}: income={cf.income} expenses={cf.expenses} net={cf.net}")
 
-        print("\nBudget utilization:")
-        for row in budget_utilization(s, year, month):
-            util_str = f"{(row.utilization*100):.1f}%" if row.utilization is not None else "—"
-            print(f"  [{row.budget_name}] {row.category_name}: {row.spent}/{row.monthly_limit} ({util_str})")
\ No newline at end of file
+def month_totals(
+        s: Session, start: date, end: date, user_id: Optional[str] = None,
+) -> list[MonthTotals]:
+    """
+    Income, spend and net cents per (account, category, month) from start through end, in
+    one grouped pass over the transactions. Batch runs derive every monthly report from it.
+    """
+    tx = transaction_source(s, start)
+    bucket = bucket_expr(tx.date, "month").label("bucket")
+    stmt = (
+        select(
+            tx.account_id,
+            tx.category_id,
+            bucket,
+            _income_cents(tx).label("income"),
+            _spend_cents(tx).label("spend"),
+            sum_cents(cents_expr(tx.amount)).label("net"),
+        )
+        .where(and_(tx.date >= start, tx.date <= end, *_tx_scope(user_id, tx)))
+        .group_by(tx.account_id, tx.category_id, bucket)
+    )
+    return [
+        MonthTotals(a_id, c_id, date.fromisoformat(b), int(income), int(spend), int(net))
+        for a_id, c_id, b, income, spend, net in s.execute(stmt).all()
+    ]
+
+
+def cashflow_series(
+        s: Session, start: date, end: date, granularity: Granularity = "month",
+        user_id: Optional[str] = None,
+) -> list[CashflowPoint]:
+    tx = transaction_source(s, start)
+    periods = period_starts(start, end, granularity)
+    bucket = bucket_expr(tx.date, granularity).label("bucket")
+    stmt = (
+        select(bucket, _income_cents(tx).label("income"), _spend_cents(tx).label("expenses"))
+        .where(and_(tx.date >= start, tx.date <= end, *_tx_scope(user_id, tx)))
+        .group_by(bucket)
+    )
+    totals = {
+        date.fromisoformat(b): (from_cents(inc), from_cents(exp))
+        for b, inc, exp in s.execute(stmt).all()
+    }
+    zero = (Decimal("0"), Decimal("0"))
+    out: list[CashflowPoint] = []
+    for p in periods:
+        income, expenses = totals.get(p, zero)
+        out.append(CashflowPoint(p, income, expenses, income - expenses))
+    return out
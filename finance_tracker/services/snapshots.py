@@ -0,0 +1,87 @@
+from __future__ import annotations
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr, from_cents, sum_cents
+from ..models.account import Account
+from ..models.snapshot import BalanceSnapshot
+from .archive import transaction_source
+
+
+def month_end(d: date) -> date:
+    return date(d.year, d.month, monthrange(d.year, d.month)[1])
+
+
+def last_closed_month_end(today: Optional[date] = None) -> date:
+    return (today or date.today()).replace(day=1) - timedelta(days=1)
+
+
+def anchors(as_of: date):
+    """Subquery of each account's newest snapshot on or before as_of: (account_id, month_end, cents)."""
+    newest = (
+        select(BalanceSnapshot.account_id, func.max(BalanceSnapshot.month_end).label("month_end"))
+        .where(BalanceSnapshot.month_end <= as_of)
+        .group_by(BalanceSnapshot.account_id)
+        .subquery()
+    )
+    return (
+        select(BalanceSnapshot.account_id, BalanceSnapshot.month_end, cents_expr(BalanceSnapshot.cumulative).label("cents"))
+        .join(newest, (newest.c.account_id == BalanceSnapshot.account_id)
+              & (newest.c.month_end == BalanceSnapshot.month_end))
+        .subquery("anchors")
+    )
+
+
+def roll_forward(s: Session, through: Optional[date] = None) -> int:
+    """
+    Add the missing month-end snapshots up to `through` (default: the last closed month)
+    for every account with transactions. Returns rows added. Does not commit.
+    """
+    through = month_end(through) if through else last_closed_month_end()
+    latest = _latest_snapshots(s)
+
+    # Accounts without any snapshot start from their first transaction, possibly archived
+    fresh = s.execute(select(Account.id).where(Account.id.not_in(select(BalanceSnapshot.account_id)))).scalars().all()
+    start = None if fresh or not latest else min(d for d, _ in latest.values()) + timedelta(days=1)
+    tx = transaction_source(s, start)
+
+    month = func.strftime("%Y-%m", tx.date)
+    stmt = select(tx.account_id, month, sum_cents(cents_expr(tx.amount))).where(tx.date <= through)
+    if start is not None:
+        stmt = stmt.where(tx.date >= start)
+    sums: dict[str, dict[str, int]] = {}
+    for account_id, ym, cents in s.execute(stmt.group_by(tx.account_id, month)).all():
+        sums.setdefault(account_id, {})[ym] = int(cents)
+
+    rows = []
+    for account_id in set(latest) | set(fresh):
+        if account_id in latest:
+            last, running = latest[account_id]
+            cur = month_end(last + timedelta(days=1))
+        else:
+            # from the first month with activity; an idle account just gets a zero at `through`
+            first = min(sums[account_id]) if account_id in sums else through.strftime("%Y-%m")
+            cur = month_end(date.fromisoformat(first + "-01"))
+            running = 0
+        while cur <= through:
+            running += sums.get(account_id, {}).get(cur.strftime("%Y-%m"), 0)
+            rows.append({"account_id": account_id, "month_end": cur, "cumulative": from_cents(running)})
+            cur = month_end(cur + timedelta(days=1))
+    if rows:
+        s.execute(insert(BalanceSnapshot), rows)
+    return len(rows)
+
+
+def _latest_snapshots(s: Session) -> dict[str, tuple[date, int]]:
+    """{account_id: (month_end, cents)} of each account's newest snapshot."""
+    return {a: (d, int(c)) for a, d, c in s.execute(select(anchors(date.max))).all()}
+
+
+def rebuild(s: Session, through: Optional[date] = None) -> int:
+    """Drop and recompute every snapshot from the transactions (archive included). Does not commit."""
+    s.execute(delete(BalanceSnapshot))
+    return roll_forward(s, through)
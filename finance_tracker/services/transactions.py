@@ -0,0 +1,187 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import Date, Select, and_, delete, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from ..db.money import cents_expr, from_cents, sum_cents
+from ..models.account import Account
+from ..models.category import Category
+from ..models.snapshot import apply_delta
+from ..models.transaction import Transaction, TransactionType
+from ..ui.models.filters import TransactionFilters
+from .archive import transaction_source
+
+
+# Helpers
+def transaction_type(value) -> Optional[TransactionType]:
+    """Accept a TransactionType or 'credit'/'debit' in any case; None for anything else."""
+    if isinstance(value, TransactionType):
+        return value
+    if isinstance(value, str):
+        try:
+            return TransactionType(value.lower())
+        except ValueError:
+            return None
+    return None
+
+
+def apply_filters(stmt: Select, flt: Optional[TransactionFilters], tx=Transaction) -> Select:
+    """
+    Add the TransactionFilters criteria to a statement selecting from transactions
+    (or from `tx`, e.g. the archive-aware source from services.archive).
+    """
+    if not flt:
+        return stmt
+    if flt.user_id:
+        stmt = stmt.where(tx.user_id == flt.user_id)
+    if flt.account_id:
+        stmt = stmt.where(tx.account_id == flt.account_id)
+    if flt.category_id:
+        stmt = stmt.where(tx.category_id == flt.category_id)
+    if flt.date_from:
+        stmt = stmt.where(tx.date >= flt.date_from)
+    if flt.date_to:
+        stmt = stmt.where(tx.date <= flt.date_to)
+    tval = transaction_type(flt.type)
+    if tval is not None:
+        stmt = stmt.where(tx.type == tval)
+    if flt.txt:
+        stmt = stmt.where(tx.description.ilike(f"%{flt.txt}%"))
+    return stmt
+
+
+# DTOs
+@dataclass(frozen=True)
+class TransactionRow:
+    id: str
+    date: date
+    account_id: str
+    account: str
+    category_id: Optional[str]
+    category: str
+    type: str
+    amount: Decimal
+    description: str
+
+
+@dataclass(frozen=True)
+class TransactionPage:
+    items: list[TransactionRow]
+    next_cursor: Optional[str]  # pass back as `after` for the next page; None on the last page
+
+
+def encode_cursor(d: date, tx_id: str) -> str:
+    return f"{d.isoformat()},{tx_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[date, str]:
+    d, _, tx_id = cursor.partition(",")
+    if not tx_id:
+        raise ValueError(f"Malformed cursor {cursor!r}")
+    return date.fromisoformat(d), tx_id
+
+
+# Queries
+def transactions_page(
+        s: Session,
+        flt: Optional[TransactionFilters] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+) -> TransactionPage:
+    """
+    Newest-first page of transactions using keyset paging on (date, id):
+    each page is an index seek from the cursor, not an OFFSET scan.
+    """
+    tx = transaction_source(s, flt.date_from if flt else None)
+    stmt = (
+        select(
+            tx.id, tx.date, tx.account_id, Account.name,
+            tx.category_id, Category.name, tx.type, tx.amount,
+            tx.description,
+        )
+        .join(Account, Account.id == tx.account_id)
+        .join(Category, Category.id == tx.category_id, isouter=True)
+    )
+    stmt = apply_filters(stmt, flt, tx)
+    if after:
+        d, tx_id = decode_cursor(after)
+        stmt = stmt.where(or_(tx.date < d, and_(tx.date == d, tx.id < tx_id)))
+    stmt = stmt.order_by(tx.date.desc(), tx.id.desc()).limit(limit + 1)
+
+    rows = s.execute(stmt).all()
+    items = [
+        TransactionRow(
+            id=r[0], date=r[1], account_id=r[2], account=r[3] or "",
+            category_id=r[4], category=r[5] or "",
+            type=r[6].value if hasattr(r[6], "value") else str(r[6]),
+            amount=r[7], description=r[8] or "",
+        )
+        for r in rows[:limit]
+    ]
+    next_cursor = encode_cursor(items[-1].date, items[-1].id) if len(rows) > limit else None
+    return TransactionPage(items=items, next_cursor=next_cursor)
+
+
+# Bulk edits
+# Each is one set-based statement over the selected ids. ORM bulk DML skips the mapper
+# events, so the balance and snapshot upkeep they would do runs here once per
+# (account, month) instead of once per row. None of these commit. They act on the hot
+# table only, so archived ids in a selection are skipped (see archive.archived_ids).
+def _month_sums(s: Session, ids: list[str], exclude_account: Optional[str] = None) -> list[tuple[str, date, int]]:
+    """(account_id, first day of month, cents) over the given transactions."""
+    month = func.date(Transaction.date, "start of month", type_=Date)
+    stmt = select(Transaction.account_id, month, sum_cents(cents_expr(Transaction.amount))).where(Transaction.id.in_(ids))
+    if exclude_account is not None:
+        stmt = stmt.where(Transaction.account_id != exclude_account)
+    return [(a, m, int(c)) for a, m, c in s.execute(stmt.group_by(Transaction.account_id, month)).all()]
+
+
+def _adjust_balances(s: Session, sums: Iterable[tuple[str, date, int]], sign: int) -> None:
+    """Move snapshots and Account.balance by sign * each sum (goal progress for them refreshes on commit)."""
+    per_account: dict[str, int] = {}
+    conn = s.connection()
+    for account_id, month, cents in sums:
+        apply_delta(conn, account_id, month, from_cents(sign * cents))
+        per_account[account_id] = per_account.get(account_id, 0) + sign * cents
+    for acct in s.scalars(select(Account).where(Account.id.in_(per_account))):
+        acct.balance = (acct.balance or Decimal("0")) + from_cents(per_account[acct.id])
+
+
+def bulk_recategorize(s: Session, ids: Iterable[str], category_id: Optional[str]) -> int:
+    """Set the category of every listed transaction. Returns rows updated."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    return s.execute(update(Transaction).where(Transaction.id.in_(ids)).values(category_id=category_id)).rowcount
+
+
+def bulk_delete(s: Session, ids: Iterable[str]) -> int:
+    """Delete the listed transactions and take them out of their accounts' balances. Returns rows deleted."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    sums = _month_sums(s, ids)
+    n = s.execute(delete(Transaction).where(Transaction.id.in_(ids))).rowcount
+    _adjust_balances(s, sums, -1)
+    return n
+
+
+def bulk_move(s: Session, ids: Iterable[str], account_id: str) -> int:
+    """Move the listed transactions to another account (and its owner). Returns rows moved."""
+    ids = list(ids)
+    owner = s.scalar(select(Account.user_id).where(Account.id == account_id))
+    if not ids or owner is None:
+        return 0
+    sums = _month_sums(s, ids, exclude_account=account_id)
+    n = s.execute(
+        update(Transaction)
+        .where(Transaction.id.in_(ids), Transaction.account_id != account_id)
+        .values(account_id=account_id, user_id=owner)
+    ).rowcount
+    _adjust_balances(s, sums, -1)
+    _adjust_balances(s, [(account_id, m, c) for _, m, c in sums], 1)
+    return n
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..db.base import SessionLocal
+from ..db.sharding import require_main_database
+
+# Group commit: every write submitted within `window` seconds of the first one in a batch
+# runs in the same transaction, and the batch pays for one flush and one COMMIT (one fsync)
+# instead of one per write. When a batch fails it is replayed with each write in its own
+# SAVEPOINT, so a failing write only loses its own changes and the others still commit.
+# A write's future resolves only after the COMMIT that made it durable, so callers see the
+# same guarantee as with their own session.commit().
+
+DEFAULT_WINDOW = 0.005   # seconds to wait for more writes after the first of a batch
+DEFAULT_MAX_BATCH = 500
+
+T = TypeVar("T")
+_STOP = object()
+
+
+class WriteQueue:
+    """
+    One background thread that applies submitted writes in group-committed batches.
+
+        with WriteQueue() as writes:
+            fut = writes.submit(lambda s: s.add(Transaction(...)))
+            fut.result()  # committed (or raises the write's own error)
+
+    A write is a callable taking the batch's Session; its return value becomes the future's
+    result. It must not commit or roll back the session itself, and should return plain
+    values rather than ORM objects: the session is closed after the batch. A write may run
+    twice (see above), so it should only act through the session.
+    """
+    def __init__(
+            self,
+            session_factory: Optional[sessionmaker] = None,
+            window: float = DEFAULT_WINDOW,
+            max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> None:
+        self.session_factory = session_factory or SessionLocal
+        if self.session_factory is SessionLocal:
+            require_main_database("WriteQueue")
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="write-queue", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "WriteQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(self, write: Callable[[Session], T], callback: Optional[Callable[[Future], None]] = None) -> "Future[T]":
+        """Queue a write; `callback(future)` runs once it is committed or has failed (on the queue's thread)."""
+        if self._closed:
+            raise RuntimeError("WriteQueue is closed")
+        fut: Future = Future()
+        if callback is not None:
+            fut.add_done_callback(callback)
+        self._queue.put((write, fut))
+        return fut
+
+    def close(self) -> None:
+        """Commit everything already submitted, then stop the thread."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    # Worker
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: list[tuple[Callable[[Session], object], Future]]) -> None:
+        batch = [(write, fut) for write, fut in batch if fut.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        # Optimistic pass: the whole batch in one flush. Only if something in it fails is the
+        # batch redone write by write, each in a SAVEPOINT, to find and drop the bad ones.
+        with self.session_factory() as s:
+            try:
+                results = [write(s) for write, _ in batch]
+                s.commit()
+            except Exception:
+                s.rollback()
+            else:
+                for (_, fut), result in zip(batch, results):
+                    fut.set_result(result)
+                return
+        self._commit_isolated(batch)
+
+    def _commit_isolated(self, batch: list[tuple[Callable[[Session], object], Future]]) -> None:
+        done: list[tuple[Future, object]] = []
+        with self.session_factory() as s:
+            try:
+                for write, fut in batch:
+                    try:
+                        with s.begin_nested():
+                            result = write(s)
+                            s.flush()
+                    except Exception as e:
+                        fut.set_exception(e)  # its savepoint is rolled back; the rest of the batch goes on
+                    else:
+                        done.append((fut, result))
+                s.commit()
+            except Exception as e:
+                s.rollback()
+                for fut, _ in done:
+                    fut.set_exception(e)
+                return
+        for fut, result in done:
+            fut.set_result(result)
@@ -4,17 +4,19 @@ import sys
 from PySide6.QtWidgets import QApplication
 
 from finance_tracker.ui.main_window import MainWindow
-from finance_tracker.ui.services.db import ensure_db, get_session
+from finance_tracker.services.snapshots import roll_forward
+from finance_tracker.ui.services.db import ensure_db, make_session_factory, session_scope
 
 
 def run() -> None:
     app = QApplication(sys.argv)
     ensure_db()
-    with get_session() as session:
-        w = MainWindow(session=session)
-        w.resize(1000, 700)
-        w.show()
-        sys.exit(app.exec())
+    with session_scope() as s:
+        roll_forward(s)  # snapshot any month closed since the last run
+    w = MainWindow(session_factory=make_session_factory())
+    w.resize(1000, 700)
+    w.show()
+    sys.exit(app.exec())
 
 
 if __name__ == "__main__":
@@ -1,29 +1,43 @@
 from __future__ import annotations
 
 from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QMessageBox
+from sqlalchemy.orm import sessionmaker
 
 from finance_tracker.ui.core.events import events
 from finance_tracker.ui.services import queries, ledger
+from finance_tracker.ui.services.db import read_scope, session_scope
 from finance_tracker.ui.views.accounts.accounts_panel import AccountsPanel
 
 
 class AccountsController(QObject):
-    def __init__(self, session, view: AccountsPanel, parent=None):
+    """
+    Lists accounts with their stored balances, which writes keep current. Recompute
+    balances rebuilds them from the ledger in one unit of work, for repairs only.
+    """
+    def __init__(self, session_factory: sessionmaker, view: AccountsPanel, parent=None):
         super().__init__(parent)
-        self.session = session
+        self.session_factory = session_factory
         self.view = view
 
         self.view.refreshRequested.connect(self.reload)
         events.refresh_requested.connect(self.reload)
+        self.view.recomputeRequested.connect(self.on_recompute_requested)
 
         self.reload()
 
     def reload(self) -> None:
-        accounts = queries.list_accounts(self.session)
-        for a in accounts:
-            try:
-                ledger.recompute_account_balance(self.session, a)
-            except Exception:
-                pass
-        self.session.commit()
-        self.view.set_accounts(accounts)
+        with read_scope(self.session_factory) as s:
+            rows = queries.account_rows(s)
+        self.view.set_accounts(rows)
+
+    def on_recompute_requested(self) -> None:
+        try:
+            with session_scope(self.session_factory) as s:
+                for a in queries.list_accounts(s):
+                    ledger.recompute_account_balance(s, a)
+        except Exception as exc:
+            QMessageBox.warning(self.view, "Recompute failed", f"Balances were left unchanged: {exc}")
+            return
+        self.reload()
+        events.accounts_changed.emit()
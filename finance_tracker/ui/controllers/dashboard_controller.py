@@ -2,23 +2,50 @@ from __future__ import annotations
 from datetime import date
 
 from PySide6.QtCore import QObject
+from sqlalchemy.orm import sessionmaker
 
 from finance_tracker.ui.core.events import events
-from finance_tracker.ui.services.ledger import month_to_date_spend_by_category
+from finance_tracker.ui.services.aggregates import aggregates
+from finance_tracker.ui.services.db import read_scope
+from finance_tracker.ui.services.ledger import chart_series, ledger_date_range
 from finance_tracker.ui.views.dashboard.dashboard import Dashboard
 
 
 class DashboardController(QObject):
-    def __init__(self, session, view: Dashboard, parent=None):
+    def __init__(self, session_factory: sessionmaker, view: Dashboard, parent=None):
         super().__init__(parent)
-        self.session = session
+        self.session_factory = session_factory
         self.view = view
 
         self.view.refreshRequested.connect(self.refresh)
         events.refresh_requested.connect(self.refresh)
+        self.view.chart.rangeRequested.connect(self.load_chart)
+        events.transactions_changed.connect(self.reset_chart)
 
         self.refresh()
+        self.reset_chart()
 
     def refresh(self) -> None:
-        items = month_to_date_spend_by_category(self.session, date.today())
-        self.view.set_spend_data(items)
+        # The aggregate store is loaded once and then kept current by transaction events;
+        # only a bulk edit (which bypasses them) makes it load again.
+        if not aggregates.loaded:
+            with read_scope(self.session_factory) as s:
+                aggregates.load(s)
+        self.view.set_spend_data(aggregates.month_spend_by_category(date.today()))
+        self.view.chart.reload()
+
+    def reset_chart(self) -> None:
+        """Re-read the ledger's date span and show all of it."""
+        with read_scope(self.session_factory) as s:
+            extent = ledger_date_range(s)
+        if extent is None:
+            self.view.chart.set_points([])
+            return
+        self.view.chart.set_extent(*extent)
+        self.view.chart.reset_zoom()
+
+    def load_chart(self, metric: str, start: date, end: date, width: int) -> None:
+        # Only the visible range is read, bucketed and downsampled to the chart's width
+        with read_scope(self.session_factory) as s:
+            granularity, points = chart_series(s, metric, start, end, width)
+        self.view.chart.set_points(points, granularity)
@@ -1,28 +1,60 @@
 from __future__ import annotations
+from concurrent.futures import Future
 from typing import Optional
-from decimal import Decimal
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtWidgets import QMessageBox
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, sessionmaker
 
 from finance_tracker.ui.core.events import events
 from finance_tracker.ui.models.transactions_table import TransactionsTableModel
 from finance_tracker.ui.models.filters import TransactionFilters
 from finance_tracker.ui.services import queries
+from finance_tracker.ui.services.db import read_scope, session_scope
+from finance_tracker.ui.services.reference import refs
 from finance_tracker.ui.views.transactions.transactions import TransactionsView
-from finance_tracker.ui.views.transactions.dialogs import TransactionDialog
-from finance_tracker.ui.services.ledger import recompute_account_balance
-from finance_tracker.models import Account, Category, Transaction, TransactionType
+from finance_tracker.ui.views.transactions.dialogs import TransactionDialog, choose
+from finance_tracker.ui.services.ledger import recompute_on_commit
+from finance_tracker.models import Transaction, TransactionType
+from finance_tracker.services.archive import archived_ids
+from finance_tracker.services.categorize import suggest_category
+from finance_tracker.services.transactions import bulk_delete, bulk_move, bulk_recategorize
+from finance_tracker.services.write_queue import WriteQueue
 
 
 class TransactionsController(QObject):
-    def __init__(self, session: Session, view: TransactionsView, parent: Optional[QObject] = None) -> None:
+    """
+    Every read opens a short-lived session and hands the view plain rows; every write is
+    its own unit of work (session_scope commits or rolls back, then closes). Nothing is
+    kept in an identity map between operations. Dialog saves go through the WriteQueue,
+    which group-commits writes arriving close together; each touched account's balance is
+    recomputed once per batch (recompute_on_commit) and the table reloads once they land.
+    The queue belongs to the caller, which also closes it. Archived rows are listed too but
+    are read-only: edits and bulk actions refuse or skip them and say so.
+    """
+    written = Signal(object)  # Future of a queued write, re-emitted on the GUI thread
+
+    def __init__(
+            self,
+            session_factory: sessionmaker,
+            view: TransactionsView,
+            writes: WriteQueue,
+            parent: Optional[QObject] = None,
+    ) -> None:
         super().__init__(parent)
-        self.session = session
+        self.session_factory = session_factory
+        self.writes = writes
         self.view = view
         self.model = TransactionsTableModel()
 
+        # One reload for a burst of committed writes
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(50)
+        self._reload_timer.timeout.connect(self.reload)
+        self.written.connect(self._on_written)
+
         # wire view to model
         self.view.set_model(self.model)
 
@@ -34,145 +66,153 @@ class TransactionsController(QObject):
         self.view.addRequested.connect(self.on_add_clicked)
         self.view.editRequested.connect(self.on_edit_requested)
         self.view.deleteRequested.connect(self.on_delete_requested)
+        self.view.recategorizeRequested.connect(self.on_recategorize_requested)
+        self.view.moveRequested.connect(self.on_move_requested)
 
         self.reload_choices()
         self.reload()
 
     # data loading
 
+    def _choices(self) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+        """(id, name) pairs of accounts and categories, from the reference cache."""
+        return refs.account_choices(self.session_factory), refs.category_choices(self.session_factory)
+
     def reload_choices(self) -> None:
-        accounts = queries.accounts_choices(self.session)
-        categories = queries.categories_choices(self.session)
-        self.view.set_choices(accounts, categories)
+        self.view.set_choices(*self._choices())
 
     def reload(self) -> None:
         flt: TransactionFilters = self.view.filters()
 
-        q = (
-            self.session.query(Transaction)
-            .options(joinedload(Transaction.account), joinedload(Transaction.category))
-        )
-        if flt.account_id:
-            q = q.filter(Transaction.account_id == flt.account_id)
-        if flt.category_id:
-            q = q.filter(Transaction.category_id == flt.category_id)
-        if flt.date_from:
-            q = q.filter(Transaction.date >= flt.date_from)
-        if flt.date_to:
-            q = q.filter(Transaction.date <= flt.date_to)
-        if flt.type:
-            tval = flt.type
-            if isinstance(tval, str):
-                tval = tval.lower()
-                if tval in ("credit", "debit"):
-                    tval = TransactionType.CREDIT if tval == "credit" else TransactionType.DEBIT
-            q = q.filter(Transaction.type == tval)
-        if flt.txt:
-            like = f"%{flt.txt}%"
-            q = q.filter(Transaction.description.ilike(like))
-
+        # Plain columns only; account and category names are resolved from the reference cache
+        accounts, categories = refs.accounts(self.session_factory), refs.categories(self.session_factory)
         rows = []
-        for t in q.order_by(Transaction.date.desc(), Transaction.id.desc()).all():
-            rows.append({
-                "id": t.id,
-                "date": t.date,
-                "account": t.account.name if t.account else "",
-                "category": t.category.name if t.category else "",
-                "type": t.type.value if hasattr(t.type, "value") else str(t.type),
-                "amount": t.amount,
-                "description": t.description or "",
-            })
+        with read_scope(self.session_factory) as s:
+            for tx_id, on, account_id, category_id, tx_type, amount, description in s.execute(
+                    queries.transaction_rows_query(s, flt)):
+                account, category = accounts.get(account_id), categories.get(category_id)
+                rows.append({  # keyed by TransactionsTableModel.HEADERS
+                    "id": tx_id,
+                    "Date": on,
+                    "Account": account.name if account else "",
+                    "Category": category.name if category else "",
+                    "Type": tx_type.value if hasattr(tx_type, "value") else str(tx_type),
+                    "Amount": amount,
+                    "Description": description or "",
+                })
+            # Same check as _editable, so a row is greyed out exactly when edits refuse it
+            archived = archived_ids(s, [r["id"] for r in rows])
+        for r in rows:
+            r["archived"] = r["id"] in archived
 
         self.model.set_rows(rows)
         self.view.table.resizeColumnsToContents()
 
-    def on_add_clicked(self) -> None:
-        accounts = self.session.query(Account).order_by(Account.name).all()
-        categories = self.session.query(Category).order_by(Category.name).all()
+    def _ask_transaction(self) -> dict | None:
+        accounts, categories = self._choices()
+        data = TransactionDialog(accounts=accounts, categories=categories, parent=self.view).get_data()
+        if data:
+            tval = data["type"]
+            if isinstance(tval, str):
+                tval = tval.lower()
+                data["type"] = TransactionType.CREDIT if tval == "credit" else TransactionType.DEBIT
+        return data
 
-        dlg = TransactionDialog(accounts=accounts, categories=categories, parent=self.view)
-        data = dlg.get_data()
+    def on_add_clicked(self) -> None:
+        data = self._ask_transaction()
         if not data:
             return
 
-        tval = data["type"]
-        if isinstance(tval, str):
-            tval = tval.lower()
-            data["type"] = TransactionType.CREDIT if tval == "credit" else TransactionType.DEBIT
-
-        tx = Transaction(
-            account_id=data["account_id"],
-            category_id=data["category_id"],
-            date=data["date"],
-            type=data["type"],
-            amount=data["amount"],
-            description=data["description"],
-        )
-        self.session.add(tx)
-        self.session.flush()
-
-        acct = self.session.get(Account, data["account_id"])
-        if acct:
-            recompute_account_balance(self.session, acct)
-
-        self.session.commit()
-        self.reload()
+        def write(s: Session) -> None:
+            if not data["category_id"]:
+                data["category_id"] = suggest_category(s, data["description"], data["amount"], data["account_id"])
+            s.add(Transaction(
+                account_id=data["account_id"],
+                category_id=data["category_id"],
+                date=data["date"],
+                type=data["type"],
+                amount=data["amount"],
+                description=data["description"],
+            ))
+            recompute_on_commit(s, data["account_id"])
+
+        self.writes.submit(write, self.written.emit)
 
     def on_edit_requested(self, tx_id: str) -> None:
-        if not tx_id:
+        if not tx_id or not self._editable([tx_id]):
             return
-        tx = self.session.get(Transaction, tx_id)
-        if not tx:
-            return
-
-        accounts = self.session.query(Account).order_by(Account.name).all()
-        categories = self.session.query(Category).order_by(Category.name).all()
-        dlg = TransactionDialog(self.view, accounts=accounts, categories=categories)
-
-        data = dlg.get_data()
+        data = self._ask_transaction()
         if not data:
             return
 
-        old_account_id = tx.account_id
-
-        tx.account_id = data["account_id"]
-        tx.category_id = data["category_id"]
-        tx.date = data["date"]
-        tval = data["type"]
-        if isinstance(tval, str):
-            tval = tval.lower()
-            tval = TransactionType.CREDIT if tval == "credit" else TransactionType.DEBIT
-        tx.type = tval
-        tx.amount = Decimal(data["amount"])
-        tx.description = data["description"]
-
-        # recompute balances if needed
-        if old_account_id != tx.account_id:
-            old_acct = self.session.get(Account, old_account_id)
-            if old_acct:
-                recompute_account_balance(self.session, old_acct)
-
-        new_acct = self.session.get(Account, tx.account_id)
-        if new_acct:
-            recompute_account_balance(self.session, new_acct)
-
-        self.session.commit()
+        def write(s: Session) -> None:
+            tx = s.get(Transaction, tx_id)
+            if not tx:
+                return
+            old_account_id = tx.account_id
+            tx.account_id = data["account_id"]
+            tx.category_id = data["category_id"]
+            tx.date = data["date"]
+            tx.type = data["type"]
+            tx.amount = data["amount"]
+            tx.description = data["description"]
+            recompute_on_commit(s, old_account_id, tx.account_id)
+
+        self.writes.submit(write, self.written.emit)
+
+    def _on_written(self, fut: Future) -> None:
+        exc = fut.exception()
+        if exc is not None:
+            QMessageBox.warning(self.view, "Save failed", str(exc))
+        else:
+            events.transactions_changed.emit()
+        self._reload_timer.start()
+
+    def _editable(self, tx_ids: list[str]) -> list[str]:
+        """tx_ids without the archived ones, telling the user about any that were dropped."""
+        with read_scope(self.session_factory) as s:
+            archived = archived_ids(s, tx_ids)
+        if archived:
+            n = len(archived)
+            QMessageBox.information(
+                self.view, "Archived transactions",
+                f"{n} archived transaction(s) are read-only and were left unchanged."
+                if n < len(tx_ids) else "Archived transactions are read-only.",
+            )
+        return [t for t in tx_ids if t not in archived]
+
+    # Bulk actions: one set-based statement in one unit of work for the whole selection, then one reload
+
+    def on_delete_requested(self, tx_ids: list[str]) -> None:
+        tx_ids = self._editable(tx_ids) if tx_ids else []
+        if not tx_ids:
+            return
+        with session_scope(self.session_factory) as s:
+            bulk_delete(s, tx_ids)
         self.reload()
+        events.transactions_changed.emit()
 
-    def on_delete_requested(self, tx_id: str) -> None:
-        if not tx_id:
+    def on_recategorize_requested(self, tx_ids: list[str]) -> None:
+        tx_ids = self._editable(tx_ids) if tx_ids else []
+        if not tx_ids:
             return
-        tx = self.session.get(Transaction, tx_id)
-        if not tx:
+        categories = [(None, "(Uncategorized)")] + self._choices()[1]
+        ok, category_id = choose(self.view, "Recategorize", f"Category for {len(tx_ids)} transaction(s):", categories)
+        if not ok:
             return
+        with session_scope(self.session_factory) as s:
+            bulk_recategorize(s, tx_ids, category_id)
+        self.reload()
+        events.transactions_changed.emit()
 
-        acct_id = tx.account_id
-        self.session.delete(tx)
-        self.session.flush()
-
-        acct = self.session.get(Account, acct_id)
-        if acct:
-            recompute_account_balance(self.session, acct)
-
-        self.session.commit()
+    def on_move_requested(self, tx_ids: list[str]) -> None:
+        tx_ids = self._editable(tx_ids) if tx_ids else []
+        if not tx_ids:
+            return
+        ok, account_id = choose(self.view, "Move", f"Account for {len(tx_ids)} transaction(s):", self._choices()[0])
+        if not ok or not account_id:
+            return
+        with session_scope(self.session_factory) as s:
+            bulk_move(s, tx_ids, account_id)
         self.reload()
+        events.transactions_changed.emit()
@@ -3,6 +3,9 @@ import sys
 
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMainWindow, QTabWidget
+from sqlalchemy.orm import sessionmaker
+
+from finance_tracker.services.write_queue import WriteQueue
 
 from finance_tracker.ui.core.events import events
 from finance_tracker.ui.views.accounts.accounts_panel import AccountsPanel
@@ -15,11 +18,14 @@ from finance_tracker.ui.controllers.transactions_controller import TransactionsC
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, session, parent=None):
+    def __init__(self, session_factory: sessionmaker, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Finance Tracker")
 
-        self.session = session
+        # Controllers open a short-lived session per read or unit of work from this factory
+        self.session_factory = session_factory
+        # Dialog saves are group-committed on the write queue's thread
+        self.writes = WriteQueue(session_factory)
 
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
@@ -30,9 +36,9 @@ class MainWindow(QMainWindow):
         self.transactions_view = TransactionsView()
 
         # Controllers
-        self.accounts_controller = AccountsController(session=self.session, view=self.accounts_view, parent=self)
-        self.dashboard_controller = DashboardController(session=self.session, view=self.dashboard_view, parent=self)
-        self.transactions_controller = TransactionsController(session=self.session, view=self.transactions_view, parent=self)
+        self.accounts_controller = AccountsController(self.session_factory, view=self.accounts_view, parent=self)
+        self.dashboard_controller = DashboardController(self.session_factory, view=self.dashboard_view, parent=self)
+        self.transactions_controller = TransactionsController(self.session_factory, view=self.transactions_view, parent=self, writes=self.writes)
 
         # Tabs
         self.tabs.addTab(self.dashboard_view, "Dashboard")
@@ -42,6 +48,10 @@ class MainWindow(QMainWindow):
         # Menu / toolbar actions
         self._build_menu()
 
+    def closeEvent(self, event) -> None:
+        self.writes.close()  # commit anything still queued before the window goes
+        super().closeEvent(event)
+
     def _build_menu(self) -> None:
         refresh_act = QAction("Refresh", self)
         refresh_act.setShortcut("F5")
@@ -12,3 +12,4 @@ class TransactionFilters:
     date_to: Optional[date] = None
     type: Optional[str] = None  # "CREDIT" | "DEBIT" | None
     txt: Optional[str] = None
+    user_id: Optional[str] = None  # restrict to one user's transactions
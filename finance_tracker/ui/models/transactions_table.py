@@ -3,7 +3,7 @@ from typing import Any, Mapping, Sequence, List
 from decimal import Decimal
 from datetime import date
 
-from PySide6 import QtCore
+from PySide6 import QtCore, QtGui
 
 
 class TransactionsTableModel(QtCore.QAbstractTableModel):
@@ -32,6 +32,16 @@ class TransactionsTableModel(QtCore.QAbstractTableModel):
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
         if not index.isValid():
             return None
+        if role == QtCore.Qt.ItemDataRole.UserRole:
+            row = self._rows[index.row()]
+            return (row.get("id") or row.get("_id")) if isinstance(row, Mapping) else None
+        if role in (QtCore.Qt.ItemDataRole.ForegroundRole, QtCore.Qt.ItemDataRole.ToolTipRole):
+            row = self._rows[index.row()]
+            if not (isinstance(row, Mapping) and row.get("archived")):
+                return None
+            if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+                return "Archived: read-only"
+            return QtGui.QBrush(QtCore.Qt.GlobalColor.gray)
         if role not in (QtCore.Qt.ItemDataRole.DisplayRole, QtCore.Qt.ItemDataRole.EditRole):
             return None
 
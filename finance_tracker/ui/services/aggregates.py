@@ -0,0 +1,169 @@
+from __future__ import annotations
+from datetime import date
+from decimal import Decimal
+from threading import Lock
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.money import cents_expr, from_cents, sum_cents, to_cents
+from finance_tracker.models import Category, Transaction, TransactionType
+from finance_tracker.services.archive import transaction_source
+
+# Month-level totals kept in memory for the dashboard: loaded with one grouped query,
+# then moved by deltas from the ORM events below as transactions are added, edited or
+# deleted. Deltas are staged per session and only applied on commit, so a rollback leaves
+# the store untouched. Set-based DML (bulk edits, categorize, duplicates) bypasses the
+# mapper events; it marks the store stale and the next read reloads it once.
+# Writes made by other processes are not seen until the next load.
+
+_PENDING = "_ft_aggregate_deltas"
+_STALE = "_ft_aggregate_stale"
+
+
+def _month(d: date) -> date:
+    return d.replace(day=1)
+
+
+class AggregateStore:
+    """Spend per (month, category) and net flow per (month, account), in integer cents."""
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._bind = None
+        self._spend: dict[tuple[date, Optional[str]], int] = {}
+        self._flow: dict[tuple[date, str], int] = {}
+        self._names: dict[str, str] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return self._bind is not None
+
+    def tracks(self, session: Session) -> bool:
+        return self._bind is not None and session.get_bind() is self._bind
+
+    def load(self, s: Session) -> None:
+        tx = transaction_source(s)
+        month = func.date(tx.date, "start of month")
+        spend, flow = {}, {}
+        rows = s.execute(
+            select(month, tx.category_id, tx.account_id, tx.type, sum_cents(cents_expr(tx.amount)))
+            .group_by(month, tx.category_id, tx.account_id, tx.type)
+        ).all()
+        for ym, category_id, account_id, tx_type, cents in rows:
+            m, cents = date.fromisoformat(ym), int(cents)
+            if tx_type == TransactionType.DEBIT:
+                spend[(m, category_id)] = spend.get((m, category_id), 0) + cents
+            flow[(m, account_id)] = flow.get((m, account_id), 0) + cents
+        names = dict(s.execute(select(Category.id, Category.name)).all())
+        with self._lock:
+            self._spend, self._flow, self._names = spend, flow, names
+            self._bind = s.get_bind()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._bind = None
+
+    def apply(self, deltas: List[tuple]) -> None:
+        """deltas: (month, category_id, account_id, type, cents) to add."""
+        with self._lock:
+            for m, category_id, account_id, tx_type, cents in deltas:
+                if tx_type == TransactionType.DEBIT:
+                    self._spend[(m, category_id)] = self._spend.get((m, category_id), 0) + cents
+                self._flow[(m, account_id)] = self._flow.get((m, account_id), 0) + cents
+
+    def set_name(self, category_id: str, name: str) -> None:
+        with self._lock:
+            self._names[category_id] = name
+
+    # Reads: no database access
+    def month_spend_by_category(self, today: date) -> List[Tuple[str, Decimal]]:
+        """Same shape as ledger.month_to_date_spend_by_category: [(category, abs spend)], largest first."""
+        m = _month(today)
+        with self._lock:
+            items = [
+                (self._names.get(cid, "(Uncategorized)") if cid else "(Uncategorized)", cents)
+                for (month, cid), cents in self._spend.items() if month == m and cents
+            ]
+        merged: dict[str, int] = {}
+        for name, cents in items:
+            merged[name] = merged.get(name, 0) + cents
+        return sorted(((k, abs(from_cents(v))) for k, v in merged.items()), key=lambda x: x[1], reverse=True)
+
+    def month_flow_by_account(self, today: date) -> dict[str, Decimal]:
+        m = _month(today)
+        with self._lock:
+            return {aid: from_cents(c) for (month, aid), c in self._flow.items() if month == m}
+
+
+aggregates = AggregateStore()
+
+
+# Delta capture
+def _stage(target: Transaction, deltas: List[tuple]) -> None:
+    session = inspect(target).session
+    if session is not None and aggregates.tracks(session):
+        session.info.setdefault(_PENDING, []).extend(deltas)
+
+
+def _row(target: Transaction, sign: int, **old) -> tuple:
+    get = lambda k: old[k] if k in old else getattr(target, k)
+    return (_month(get("date")), get("category_id"), get("account_id"), get("type"), sign * to_cents(get("amount")))
+
+
+@event.listens_for(Transaction, "after_insert")
+def _on_insert(mapper, connection, target: Transaction) -> None:
+    _stage(target, [_row(target, 1)])
+
+
+@event.listens_for(Transaction, "after_delete")
+def _on_delete(mapper, connection, target: Transaction) -> None:
+    _stage(target, [_row(target, -1)])
+
+
+# The columns a delta is keyed by; the model maps them with active_history=True, so the
+# replaced value is in the history even when the attribute was expired (e.g. after a commit)
+_KEYS = ("date", "category_id", "account_id", "type", "amount")
+
+
+@event.listens_for(Transaction, "after_update")
+def _on_update(mapper, connection, target: Transaction) -> None:
+    attrs = inspect(target).attrs
+    old = {k: attrs[k].history.deleted[0] for k in _KEYS if attrs[k].history.deleted}
+    if old:
+        _stage(target, [_row(target, -1, **old), _row(target, 1)])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_dml(state) -> None:
+    if (state.is_insert or state.is_update or state.is_delete) \
+            and getattr(getattr(state.statement, "table", None), "name", None) == Transaction.__tablename__ \
+            and aggregates.tracks(state.session):
+        state.session.info[_STALE] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_on_commit(session: Session) -> None:
+    deltas = session.info.pop(_PENDING, None)
+    if session.info.pop(_STALE, False):
+        aggregates.invalidate()
+    elif deltas:
+        aggregates.apply(deltas)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_on_rollback(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING, None)
+        session.info.pop(_STALE, None)
+    elif session.info.get(_PENDING):
+        # A rolled-back SAVEPOINT (e.g. one failed write in a WriteQueue batch): its deltas
+        # are mixed in with the ones that will commit, so reload rather than guess
+        session.info[_STALE] = True
+
+
+@event.listens_for(Category, "after_insert")
+@event.listens_for(Category, "after_update")
+def _on_category(mapper, connection, target: Category) -> None:
+    if aggregates.loaded:
+        aggregates.set_name(target.id, target.name)
@@ -4,6 +4,8 @@ from typing import Iterator, Optional
 
 from sqlalchemy.orm import Session, sessionmaker
 from finance_tracker.db.base import SessionLocal, engine
+from finance_tracker.db.money import check_money_storage
+from finance_tracker.db.sharding import require_main_database
 
 _session_factory: Optional[sessionmaker] = None
 
@@ -16,10 +18,9 @@ def make_session_factory() -> sessionmaker:
 
 
 @contextmanager
-def session_scope() -> Iterator[Session]:
-    """Context-managed session, commits on success, rollbacks on error."""
-    factory = make_session_factory()
-    session: Session = factory()
+def session_scope(factory: Optional[sessionmaker] = None) -> Iterator[Session]:
+    """Context-managed session (a unit of work): commits on success, rollbacks on error."""
+    session: Session = (factory or make_session_factory())()
     try:
         yield session
         session.commit()
@@ -30,13 +31,27 @@ def session_scope() -> Iterator[Session]:
         session.close()
 
 
+@contextmanager
+def read_scope(factory: Optional[sessionmaker] = None) -> Iterator[Session]:
+    """
+    Short-lived session for a read: closed (never committed) on exit, so nothing it loaded
+    stays in an identity map. Return plain rows from it, not ORM objects.
+    """
+    session: Session = (factory or make_session_factory())()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 def ensure_db() -> None:
     """
-    Light-weight sanity check that the DB is reachable.
-    Alembic handles migrations; this just opens a connection.
+    Light-weight sanity check that the DB is reachable and stores money the way
+    config.toml says. Alembic handles migrations; this only reads app_meta.
+    The app has no logged-in user to route by, so it refuses to run when sharded.
     """
-    with engine.connect():
-        pass
+    require_main_database("The desktop app")
+    check_money_storage(engine)
 
 
 @contextmanager
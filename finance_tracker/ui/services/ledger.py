@@ -1,43 +1,110 @@
 from __future__ import annotations
 from decimal import Decimal
 from datetime import date
-from typing import Dict, List, Tuple
+from typing import List, Literal, Optional, Tuple
 
+from sqlalchemy import event, func, select
 from sqlalchemy.orm import Session
-from finance_tracker.models import Account, Transaction, TransactionType
+from finance_tracker.db.money import cents_expr, from_cents, sum_cents
+from finance_tracker.models import Account, Category, Transaction, TransactionType
+from finance_tracker.services import reports
+from finance_tracker.services.archive import checkpoint_cents, transaction_source
+from finance_tracker.services.downsample import lttb, pick_granularity
 
 
 def recompute_account_balance(session: Session, account: Account) -> None:
     """
     Recompute: balance = starting_balance + sum(all transaction amounts).
     Note: your Transaction amounts are already signed (+credit / -debit).
+    The sum runs in SQL on integer cents; archived history counts via its checkpoint.
     """
-    total = (
-        session.query(Transaction.amount)
-        .filter(Transaction.account_id == account.id)
-        .all()
-    )
-    sum_amount = sum((row[0] or Decimal("0") for row in total), Decimal("0"))
-    account.balance = (account.starting_balance or Decimal("0")) + sum_amount
+    total_cents = session.execute(
+        select(sum_cents(cents_expr(Transaction.amount)))
+        .where(Transaction.account_id == account.id)
+    ).scalar_one() + checkpoint_cents(session).get(account.id, 0)
+    account.balance = (account.starting_balance or Decimal("0")) + from_cents(total_cents)
     session.add(account)
 
 
-def month_to_date_spend_by_category(session: Session, today: date) -> List[Tuple[str, Decimal]]:
+# Deferred recompute: writes name the accounts they touched and each one is recomputed once,
+# just before the session commits, however many writes in that unit of work named it
+_RECOMPUTE = "_ft_recompute_balances"
+
+
+def recompute_on_commit(session: Session, *account_ids: Optional[str]) -> None:
+    session.info.setdefault(_RECOMPUTE, set()).update(a for a in account_ids if a)
+
+
+@event.listens_for(Session, "before_commit")
+def _recompute_staged(session: Session) -> None:
+    if session.in_nested_transaction():  # a SAVEPOINT being released: wait for the real COMMIT
+        return
+    account_ids = session.info.pop(_RECOMPUTE, None)
+    if account_ids:
+        session.flush()
+        for account in session.scalars(select(Account).where(Account.id.in_(account_ids))):
+            recompute_account_balance(session, account)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_staged(session: Session, previous_transaction) -> None:
+    # A rolled-back SAVEPOINT keeps them: recomputing an untouched account is harmless
+    if previous_transaction.parent is None:
+        session.info.pop(_RECOMPUTE, None)
+
+
+def month_to_date_spend_by_category(
+        session: Session, today: date, user_id: Optional[str] = None
+) -> List[Tuple[str, Decimal]]:
     """
     Returns [(category_name, abs(total_debit_this_month)), ...] sorted desc.
     Debits are summed (negative amounts); we return positive magnitudes for display.
+    With user_id, only that user's transactions are read.
     """
     start = date(today.year, today.month, 1)
-    txs = (
-        session.query(Transaction)
-        .filter(Transaction.date >= start)
-        .all()
-    )
-    agg: Dict[str, Decimal] = {}
-    for t in txs:
-        if t.type == TransactionType.DEBIT:
-            name = t.category.name if t.category else "(Uncategorized)"
-            amt = t.amount or Decimal("0")
-            agg[name] = agg.get(name, Decimal("0")) + amt
-
-    return sorted(((k, abs(v)) for k, v in agg.items()), key=lambda x: x[1], reverse=True)
+    name = func.coalesce(Category.name, "(Uncategorized)")
+    rows = session.execute(
+        select(name, sum_cents(cents_expr(Transaction.amount)))
+        .join(Category, Category.id == Transaction.category_id, isouter=True)
+        .where(Transaction.date >= start, Transaction.type == TransactionType.DEBIT)
+        .where(*([Transaction.user_id == user_id] if user_id is not None else []))
+        .group_by(name)
+    ).all()
+    return sorted(((k, abs(from_cents(v))) for k, v in rows), key=lambda x: x[1], reverse=True)
+
+
+ChartMetric = Literal["balance", "spend"]
+CHART_METRICS: Tuple[str, ...] = ("balance", "spend")
+
+
+def ledger_date_range(session: Session, user_id: Optional[str] = None) -> Optional[Tuple[date, date]]:
+    """(first, last) transaction date, archive included, or None for an empty ledger."""
+    tx = transaction_source(session)
+    first, last = session.execute(
+        select(func.min(tx.date), func.max(tx.date))
+        .where(*([tx.user_id == user_id] if user_id is not None else []))
+    ).one()
+    return (first, last) if first is not None else None
+
+
+def chart_series(
+        session: Session, metric: ChartMetric, start: date, end: date, width: int,
+        user_id: Optional[str] = None,
+) -> Tuple[reports.Granularity, List[Tuple[date, Decimal]]]:
+    """
+    Points for a chart `width` pixels wide over [start, end]: the range is bucketed in SQL at
+    the finest granularity that fits the width, then LTTB-downsampled to one point per pixel.
+    "balance" is the closing total balance per bucket, "spend" the money out per bucket.
+    """
+    granularity = pick_granularity(start, end, width)
+    if metric == "balance":
+        totals: dict[date, Decimal] = {}
+        for series in reports.account_balance_series(session, start, end, granularity, user_id):
+            for p in series.points:
+                totals[p.period_start] = totals.get(p.period_start, Decimal("0")) + p.value
+        points = sorted(totals.items())
+    elif metric == "spend":
+        points = [(p.period_start, p.expenses) for p in reports.cashflow_series(session, start, end, granularity, user_id)]
+    else:
+        raise ValueError(f"Unknown chart metric {metric!r}; expected one of {CHART_METRICS}")
+    return granularity, lttb(points, max(width, 3))
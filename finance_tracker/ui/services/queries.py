@@ -1,10 +1,14 @@
 from __future__ import annotations
+from dataclasses import dataclass
+from decimal import Decimal
 from typing import Tuple, List, Dict, Optional, Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Query, Session, joinedload
 
-from finance_tracker.models import Account, Category, Transaction, TransactionType
+from finance_tracker.models import Account, Category
+from finance_tracker.services.archive import transaction_source
+from finance_tracker.services.transactions import apply_filters
 from finance_tracker.ui.models.filters import TransactionFilters
 
 
@@ -12,9 +16,14 @@ def list_categories(session: Session) -> List[Tuple[str, str]]:
     return [(c.id, c.name) for c in session.query(Category).order_by(Category.name.asc()).all()]
 
 
-def accounts_choices(session: Session) -> List[Dict[str, str]]:
+def _user_accounts(user_id: Optional[str]):
+    stmt = select(Account).order_by(Account.name)
+    return stmt.where(Account.user_id == user_id) if user_id is not None else stmt
+
+
+def accounts_choices(session: Session, user_id: Optional[str] = None) -> List[Dict[str, str]]:
     """Return [{'id': str, 'name': str}, ...] for account pickers."""
-    rows = session.execute(select(Account).order_by(Account.name)).scalars().all()
+    rows = session.execute(_user_accounts(user_id)).scalars().all()
     return [{"id": a.id, "name": a.name} for a in rows]
 
 
@@ -23,8 +32,45 @@ def categories_choices(session: Session) -> List[Dict[str, str]]:
     return [{"id": c.id, "name": c.name} for c in rows]
 
 
-def list_accounts(session: Session) -> List[Account]:
-    return session.execute(select(Account).order_by(Account.name)).scalars().all()
+def list_accounts(session: Session, user_id: Optional[str] = None) -> List[Account]:
+    return session.execute(_user_accounts(user_id)).scalars().all()
+
+
+@dataclass(frozen=True)
+class AccountRow:
+    id: str
+    name: str
+    balance: Decimal
+
+
+def account_rows(session: Session, user_id: Optional[str] = None) -> List[AccountRow]:
+    """Accounts with their stored balance, as plain rows (nothing stays attached to the session)."""
+    stmt = select(Account.id, Account.name, Account.balance).order_by(Account.name)
+    if user_id is not None:
+        stmt = stmt.where(Account.user_id == user_id)
+    return [AccountRow(*r) for r in session.execute(stmt).all()]
+
+
+def transactions_query(session: Session, flt: Optional[TransactionFilters] = None) -> Query:
+    """Filtered transactions, newest first, with account and category loaded (the transactions tab's query)."""
+    # Archived history is only unioned in when the date range reaches back into it
+    tx = transaction_source(session, flt.date_from if flt else None)
+    q = (
+        session.query(tx)
+        .options(joinedload(tx.account), joinedload(tx.category))
+    )
+    q = apply_filters(q, flt, tx)
+    return q.order_by(tx.date.desc(), tx.id.desc())
+
+
+def transaction_rows_query(session: Session, flt: Optional[TransactionFilters] = None) -> Select:
+    """
+    The transactions tab's rows as plain columns (id, date, account_id, category_id, type,
+    amount, description), newest first. Names come from the reference cache, so no joins.
+    """
+    tx = transaction_source(session, flt.date_from if flt else None)
+    stmt = select(tx.id, tx.date, tx.account_id, tx.category_id, tx.type, tx.amount, tx.description)
+    return apply_filters(stmt, flt, tx).order_by(tx.date.desc(), tx.id.desc())
 
 
 def transactions_as_rows(session: Session, flt: Optional[TransactionFilters] = None) -> List[Dict[str, Any]]:
@@ -32,33 +78,8 @@ def transactions_as_rows(session: Session, flt: Optional[TransactionFilters] = N
     Return rows for the TransactionsTableModel:
       keys: 'Date','Account','Category','Amount','Type','Memo'
     """
-    q = (
-        session.query(Transaction)
-        .options(joinedload(Transaction.account), joinedload(Transaction.category))
-    )
-
-    if flt:
-        if flt.date_from:
-            q = q.filter(Transaction.date >= flt.date_from)
-        if flt.date_to:
-            q = q.filter(Transaction.date <= flt.date_to)
-        if flt.account_id:
-            q = q.filter(Transaction.account_id == flt.account_id)
-        if flt.category_id:
-            q = q.filter(Transaction.category_id == flt.category_id)
-        if flt.txt:
-            like = f"%{flt.txt}%"
-            q = q.filter(Transaction.description.ilike(like))
-        if flt.type:
-            if flt.type.upper() == "CREDIT":
-                q = q.filter(Transaction.type == TransactionType.CREDIT)
-            elif flt.type.upper() == "DEBIT":
-                q = q.filter(Transaction.type == TransactionType.DEBIT)
-
-    q = q.order_by(Transaction.date.desc(), Transaction.id)
-
     rows: List[Dict[str, Any]] = []
-    for t in q.all():
+    for t in transactions_query(session, flt).all():
         rows.append({
             "Date": t.date,
             "Account": t.account.name if t.account else "",
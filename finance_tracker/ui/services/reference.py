@@ -0,0 +1,174 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from decimal import Decimal
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from finance_tracker.models import Account, AccountType, Budget, BudgetItem, Category, CategoryType
+from finance_tracker.ui.services.db import make_session_factory, read_scope
+
+# Id -> name/type maps for the reference tables (accounts, categories, budget items), shared by
+# dialogs, combo boxes and table rendering. Each kind carries a version that is bumped when a
+# commit changed that table in a way the maps show; a map is only re-read when its version moved
+# (or another database is asked for). Balance updates on accounts do not count as changes.
+# Edits made by other processes are not seen until one of this process's commits bumps the kind.
+
+_PENDING = "_ft_reference_changes"
+
+
+@dataclass(frozen=True)
+class AccountRef:
+    id: str
+    name: str
+    type: AccountType
+    user_id: str
+
+
+@dataclass(frozen=True)
+class CategoryRef:
+    id: str
+    name: str
+    type: CategoryType
+
+
+@dataclass(frozen=True)
+class BudgetItemRef:
+    id: str
+    budget_id: str
+    budget_name: str
+    category_id: str
+    monthly_limit: Decimal
+
+
+# Columns whose changes make a cached map stale, per mapped class, and the map they belong to
+_WATCHED = {
+    Account: ("accounts", ("name", "type", "user_id")),
+    Category: ("categories", ("name", "type")),
+    BudgetItem: ("budget_items", ("budget_id", "category_id", "monthly_limit")),
+    Budget: ("budget_items", ("name",)),
+}
+_KIND_BY_TABLE = {cls.__tablename__: kind for cls, (kind, _) in _WATCHED.items()}
+KINDS: Tuple[str, ...] = ("accounts", "categories", "budget_items")
+
+
+class ReferenceCache:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._versions: Dict[str, int] = dict.fromkeys(KINDS, 0)
+        self._maps: Dict[str, dict] = {}
+        self._loaded: Dict[str, Tuple[object, int]] = {}  # kind -> (bind, version) it was read at
+
+    def version(self, kind: str) -> int:
+        return self._versions[kind]
+
+    def invalidate(self, *kinds: str) -> None:
+        with self._lock:
+            for kind in kinds or KINDS:
+                self._versions[kind] += 1
+
+    def _get(self, kind: str, factory: Optional[sessionmaker]) -> dict:
+        factory = factory or make_session_factory()
+        bind = factory.kw.get("bind")
+        with self._lock:
+            version = self._versions[kind]
+            if self._loaded.get(kind) == (bind, version):
+                return self._maps[kind]
+        with read_scope(factory) as s:
+            fresh = _LOADERS[kind](s)
+        with self._lock:
+            self._maps[kind] = fresh
+            self._loaded[kind] = (bind, version)  # a change committed meanwhile bumped past it
+        return fresh
+
+    # Lookups
+    def accounts(self, factory: Optional[sessionmaker] = None) -> Dict[str, AccountRef]:
+        return self._get("accounts", factory)
+
+    def categories(self, factory: Optional[sessionmaker] = None) -> Dict[str, CategoryRef]:
+        return self._get("categories", factory)
+
+    def budget_items(self, factory: Optional[sessionmaker] = None) -> Dict[str, BudgetItemRef]:
+        return self._get("budget_items", factory)
+
+    def account_choices(self, factory: Optional[sessionmaker] = None, user_id: Optional[str] = None) -> List[Tuple[str, str]]:
+        """(id, name) pairs sorted by name, for pickers."""
+        refs = self.accounts(factory).values()
+        return [(a.id, a.name) for a in refs if user_id is None or a.user_id == user_id]
+
+    def category_choices(self, factory: Optional[sessionmaker] = None) -> List[Tuple[str, str]]:
+        return [(c.id, c.name) for c in self.categories(factory).values()]
+
+
+# Loaders: one query per map, already in display order
+def _load_accounts(s: Session) -> Dict[str, AccountRef]:
+    rows = s.execute(select(Account.id, Account.name, Account.type, Account.user_id).order_by(Account.name))
+    return {r[0]: AccountRef(*r) for r in rows}
+
+
+def _load_categories(s: Session) -> Dict[str, CategoryRef]:
+    rows = s.execute(select(Category.id, Category.name, Category.type).order_by(Category.name))
+    return {r[0]: CategoryRef(*r) for r in rows}
+
+
+def _load_budget_items(s: Session) -> Dict[str, BudgetItemRef]:
+    rows = s.execute(
+        select(BudgetItem.id, BudgetItem.budget_id, Budget.name, BudgetItem.category_id, BudgetItem.monthly_limit)
+        .join(Budget, Budget.id == BudgetItem.budget_id)
+        .order_by(Budget.name, BudgetItem.id)
+    )
+    return {r[0]: BudgetItemRef(*r) for r in rows}
+
+
+_LOADERS = {"accounts": _load_accounts, "categories": _load_categories, "budget_items": _load_budget_items}
+
+refs = ReferenceCache()
+
+
+# Invalidation: changes are noted per session and only bump versions once committed
+def _note(target, kind: str) -> None:
+    session = inspect(target).session
+    if session is not None:
+        session.info.setdefault(_PENDING, set()).add(kind)
+
+
+def _watch(cls, kind: str, columns: Tuple[str, ...]) -> None:
+    def on_write(mapper, connection, target) -> None:
+        _note(target, kind)
+
+    def on_update(mapper, connection, target) -> None:
+        attrs = inspect(target).attrs
+        if any(attrs[c].history.has_changes() for c in columns):
+            _note(target, kind)
+
+    event.listen(cls, "after_insert", on_write)
+    event.listen(cls, "after_delete", on_write)
+    event.listen(cls, "after_update", on_update)
+
+
+for _cls, (_kind, _columns) in _WATCHED.items():
+    _watch(_cls, _kind, _columns)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk_dml(state) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        kind = _KIND_BY_TABLE.get(getattr(getattr(state.statement, "table", None), "name", None))
+        if kind is not None:
+            state.session.info.setdefault(_PENDING, set()).add(kind)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session: Session) -> None:
+    kinds = session.info.pop(_PENDING, None)
+    if kinds:
+        refs.invalidate(*kinds)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_on_rollback(session: Session, previous_transaction) -> None:
+    # A rolled-back SAVEPOINT keeps the noted kinds: re-reading a map is harmless, a stale one is not
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING, None)
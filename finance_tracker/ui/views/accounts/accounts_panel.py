@@ -1,22 +1,24 @@
 from __future__ import annotations
 from typing import List
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QTreeWidget, QTreeWidgetItem, QLabel, QHBoxLayout
 )
 
-from finance_tracker.models import Account
+from finance_tracker.ui.services.queries import AccountRow
 
 
 class AccountsPanel(QWidget):
     """
-    Simple accounts list with a Refresh button.
+    Simple accounts list with Refresh and Recompute balances buttons.
     Exposes:
-      - set_accounts(accounts: List[Account])
+      - set_accounts(accounts: List[AccountRow])
       - refreshRequested: Signal
+      - recomputeRequested: Signal
     """
     refreshRequested = Signal()
+    recomputeRequested = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -27,8 +29,11 @@ class AccountsPanel(QWidget):
 
         header = QHBoxLayout()
         header.addWidget(QLabel("Accounts"))
+        self.recompute_btn = QPushButton("Recompute balances")
         self.refresh_btn = QPushButton("Refresh")
-        header.addWidget(self.refresh_btn, alignment=Qt.AlignRight)
+        header.addStretch()
+        header.addWidget(self.recompute_btn)
+        header.addWidget(self.refresh_btn)
         layout.addLayout(header)
 
         self.tree = QTreeWidget()
@@ -36,9 +41,10 @@ class AccountsPanel(QWidget):
         layout.addWidget(self.tree)
 
         self.refresh_btn.clicked.connect(self.refreshRequested.emit)
+        self.recompute_btn.clicked.connect(self.recomputeRequested.emit)
 
     # API called by controller
-    def set_accounts(self, accounts: List[Account]) -> None:
+    def set_accounts(self, accounts: List[AccountRow]) -> None:
         self.tree.clear()
         for a in accounts:
             bal = getattr(a, "balance", None)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from PySide6.QtCharts import QChart, QChartView, QDateTimeAxis, QLineSeries, QValueAxis
+from PySide6.QtCore import QDate, QDateTime, QPointF, QRectF, QTime, Qt, QTimer, Signal
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+
+
+def _to_qdatetime(d: date) -> QDateTime:
+    return QDateTime(QDate(d.year, d.month, d.day), QTime(0, 0))
+
+
+def _to_date(dt: QDateTime) -> date:
+    d = dt.date()
+    return date(d.year(), d.month(), d.day())
+
+
+class _PanZoomView(QChartView):
+    """Wheel zooms the time axis around the cursor; left-drag pans it."""
+    def __init__(self, chart: QChart, parent=None):
+        super().__init__(chart, parent)
+        self.setRenderHint(QPainter.Antialiasing)
+        self._drag_x: Optional[float] = None
+
+    def wheelEvent(self, event) -> None:
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        area = self.chart().plotArea()
+        x = self.chart().mapFromScene(self.mapToScene(event.position().toPoint())).x()
+        # Zoom keeps the point under the cursor in place
+        left = x - (x - area.left()) / factor
+        self.chart().zoomIn(QRectF(left, area.top(), area.width() / factor, area.height()))
+        event.accept()
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.LeftButton:
+            self._drag_x = event.position().x()
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event) -> None:
+        if self._drag_x is not None:
+            x = event.position().x()
+            self.chart().scroll(self._drag_x - x, 0)
+            self._drag_x = x
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event) -> None:
+        self._drag_x = None
+        super().mouseReleaseEvent(event)
+
+
+class TimeSeriesChart(QWidget):
+    """
+    Line chart over a date axis.
+    Exposes:
+      - set_points(points, granularity): [(date, amount), ...] for the range last requested
+      - set_extent(first, last): the full data range (Reset zooms back to it)
+      - rangeRequested: Signal(metric, start, end, width), emitted (debounced) after pan/zoom
+    """
+    rangeRequested = Signal(str, object, object, int)
+
+    def __init__(self, metrics: Tuple[str, ...] = ("balance", "spend"), parent=None):
+        super().__init__(parent)
+        self._extent: Optional[Tuple[date, date]] = None
+        self._applying = False
+        self._build_ui(metrics)
+
+    def _build_ui(self, metrics: Tuple[str, ...]) -> None:
+        layout = QVBoxLayout(self)
+
+        header = QHBoxLayout()
+        self.metric = QComboBox()
+        for m in metrics:
+            self.metric.addItem(m.title(), m)
+        header.addWidget(self.metric)
+        self.resolution = QLabel("")
+        header.addWidget(self.resolution)
+        header.addStretch(1)
+        self.reset_btn = QPushButton("Reset zoom")
+        header.addWidget(self.reset_btn)
+        layout.addLayout(header)
+
+        self.series = QLineSeries()
+        self.chart = QChart()
+        self.chart.legend().hide()
+        self.chart.addSeries(self.series)
+        self.x_axis = QDateTimeAxis()
+        self.x_axis.setFormat("yyyy-MM-dd")
+        self.y_axis = QValueAxis()
+        self.chart.addAxis(self.x_axis, Qt.AlignBottom)
+        self.chart.addAxis(self.y_axis, Qt.AlignLeft)
+        self.series.attachAxis(self.x_axis)
+        self.series.attachAxis(self.y_axis)
+        self.view = _PanZoomView(self.chart)
+        layout.addWidget(self.view)
+
+        # Pan/zoom fire rangeChanged continuously; fetch once the axis settles
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._emit_range)
+        self.x_axis.rangeChanged.connect(self._on_range_changed)
+        self.metric.currentIndexChanged.connect(lambda _: self._emit_range())
+        self.reset_btn.clicked.connect(self.reset_zoom)
+
+    # API
+    def current_metric(self) -> str:
+        return self.metric.currentData()
+
+    def plot_width(self) -> int:
+        return max(int(self.chart.plotArea().width()), self.view.width() - 80, 100)
+
+    def visible_range(self) -> Optional[Tuple[date, date]]:
+        if self._extent is None:
+            return None
+        start, end = _to_date(self.x_axis.min()), _to_date(self.x_axis.max())
+        first, last = self._extent
+        start, end = max(start, first), min(end, last)
+        return (start, end) if start <= end else None
+
+    def set_extent(self, first: date, last: date) -> None:
+        self._extent = (first, last)
+
+    def reset_zoom(self) -> None:
+        if self._extent is None:
+            return
+        self._applying = True
+        try:
+            self.x_axis.setRange(_to_qdatetime(self._extent[0]), _to_qdatetime(self._extent[1]))
+        finally:
+            self._applying = False
+        self._emit_range()
+
+    def reload(self) -> None:
+        """Ask for the visible range again (e.g. after the data changed)."""
+        self._emit_range()
+
+    def set_points(self, points: List[Tuple[date, Decimal]], granularity: str = "") -> None:
+        self._applying = True
+        try:
+            self.series.replace([QPointF(_to_qdatetime(d).toMSecsSinceEpoch(), float(v)) for d, v in points])
+            if points:
+                values = [float(v) for _, v in points]
+                lo, hi = min(values), max(values)
+                pad = (hi - lo) * 0.05 or 1.0
+                self.y_axis.setRange(lo - pad, hi + pad)
+        finally:
+            self._applying = False
+        self.resolution.setText(f"{len(points)} points, by {granularity}" if granularity else "")
+
+    # Internals
+    def _on_range_changed(self, *_):
+        if not self._applying:
+            self._debounce.start()
+
+    def _emit_range(self) -> None:
+        rng = self.visible_range()
+        if rng is not None:
+            self.rangeRequested.emit(self.current_metric(), rng[0], rng[1], self.plot_width())
+
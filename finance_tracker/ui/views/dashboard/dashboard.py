@@ -3,14 +3,17 @@ from typing import List, Tuple
 from decimal import Decimal
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QListWidget, QListWidgetItem
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QListWidget, QListWidgetItem, QSplitter
+
+from finance_tracker.ui.views.dashboard.charts import TimeSeriesChart
 
 
 class Dashboard(QWidget):
     """
-    Displays month-to-date spend by category (simple list for now).
+    Displays month-to-date spend by category and a balance/spend history chart.
     Exposes:
       - set_spend_data([(category, amount), ...])
+      - chart: TimeSeriesChart (its rangeRequested drives data loading)
       - refreshRequested: Signal
     """
     refreshRequested = Signal()
@@ -28,8 +31,13 @@ class Dashboard(QWidget):
         header.addWidget(self.refresh_btn, alignment=Qt.AlignRight)
         layout.addLayout(header)
 
+        splitter = QSplitter(Qt.Vertical)
         self.list = QListWidget()
-        layout.addWidget(self.list)
+        splitter.addWidget(self.list)
+        self.chart = TimeSeriesChart()
+        splitter.addWidget(self.chart)
+        splitter.setStretchFactor(1, 3)
+        layout.addWidget(splitter)
 
         self.refresh_btn.clicked.connect(self.refreshRequested.emit)
 
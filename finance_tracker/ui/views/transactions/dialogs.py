@@ -4,30 +4,31 @@ from datetime import date
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QDateEdit,
-    QLabel, QPushButton
+    QLabel, QPushButton, QInputDialog
 )
 from PySide6.QtCore import QDate
 
-from finance_tracker.models import Account, Category, TransactionType
+from finance_tracker.models import TransactionType
 
 
 class TransactionDialog(QDialog):
     """
     Manual-entry dialog used by the Transactions view/controller.
+    accounts/categories are (id, name) pairs.
     Use .get_data() for a one-call modal, or access the properties after exec().
     """
-    def __init__(self, accounts: list[Account], categories: list[Category], parent=None) -> None:
+    def __init__(self, accounts: list[tuple[str, str]], categories: list[tuple[str, str]], parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Add Transaction")
 
         self.account_cb = QComboBox()
-        for acc in sorted(accounts, key=lambda a: a.name.lower()):
-            self.account_cb.addItem(acc.name, acc.id)
+        for acc_id, name in sorted(accounts, key=lambda a: a[1].lower()):
+            self.account_cb.addItem(name, acc_id)
 
         self.category_cb = QComboBox()
         self.category_cb.addItem("(Uncategorized)", None)
-        for cat in sorted(categories, key=lambda c: c.name.lower()):
-            self.category_cb.addItem(cat.name, cat.id)
+        for cat_id, name in sorted(categories, key=lambda c: c[1].lower()):
+            self.category_cb.addItem(name, cat_id)
 
         self.type_cb = QComboBox()
         self.type_cb.addItem("Credit", TransactionType.CREDIT.value)
@@ -111,3 +112,15 @@ class TransactionDialog(QDialog):
     @property
     def qdate(self) -> QDate:
         return self.date_edit.date()
+
+
+def choose(parent, title: str, label: str, choices: list[tuple[str | None, str]]) -> tuple[bool, str | None]:
+    """
+    Modal pick of one (id, label) pair, for bulk recategorize/move.
+    Returns (accepted, id); id may be None when a None choice (e.g. "(Uncategorized)") is picked.
+    """
+    labels = [lbl for _, lbl in choices]
+    picked, ok = QInputDialog.getItem(parent, title, label, labels, 0, False)
+    if not ok or picked not in labels:
+        return False, None
+    return True, choices[labels.index(picked)][0]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Optional, Iterable, Tuple
+from typing import Optional, Iterable, List, Tuple
 
 from PySide6 import QtCore, QtWidgets
 
@@ -19,7 +19,9 @@ class _DateRange:
 class TransactionsView(QtWidgets.QWidget):
     addRequested = QtCore.Signal()
     editRequested = QtCore.Signal(str)
-    deleteRequested = QtCore.Signal(str)
+    deleteRequested = QtCore.Signal(list)
+    recategorizeRequested = QtCore.Signal(list)
+    moveRequested = QtCore.Signal(list)
     refreshRequested = QtCore.Signal()
     filtersChanged = QtCore.Signal(TransactionFilters)
 
@@ -76,16 +78,23 @@ class TransactionsView(QtWidgets.QWidget):
             self.type_cb.blockSignals(False)
 
     def selected_tx_id(self) -> Optional[str]:
-        """Return the selected transaction id via Qt.UserRole."""
+        """Return the first selected transaction id via Qt.UserRole."""
+        ids = self.selected_tx_ids()
+        return ids[0] if ids else None
+
+    def selected_tx_ids(self) -> List[str]:
+        """Return the ids of all selected rows, in view order."""
         if not self._model:
-            return None
+            return []
         sel = self.table.selectionModel()
         if not sel or not sel.hasSelection():
-            return None
-        row_index = sel.selectedRows(0)[0]
-        idx = self._model.index(row_index.row(), 0)
-        tx_id = self._model.data(idx, QtCore.Qt.ItemDataRole.UserRole)
-        return str(tx_id) if tx_id else None
+            return []
+        ids = []
+        for row_index in sorted(sel.selectedRows(0), key=lambda i: i.row()):
+            tx_id = self._model.data(self._model.index(row_index.row(), 0), QtCore.Qt.ItemDataRole.UserRole)
+            if tx_id:
+                ids.append(str(tx_id))
+        return ids
 
     def filters(self) -> TransactionFilters:
         """Build ONLY the fields that actually exist in TransactionFilters."""
@@ -144,22 +153,26 @@ class TransactionsView(QtWidgets.QWidget):
 
         layout.addLayout(filters_layout)
 
-        # -- toolbar row (Add/Edit/Delete/Refresh)
+        # -- toolbar row (Add/Edit/Delete/Recategorize/Move/Refresh)
         tb_layout = QtWidgets.QHBoxLayout()
         self.add_btn = QtWidgets.QPushButton("Add…")
         self.edit_btn = QtWidgets.QPushButton("Edit…")
         self.delete_btn = QtWidgets.QPushButton("Delete")
+        self.recategorize_btn = QtWidgets.QPushButton("Recategorize…")
+        self.move_btn = QtWidgets.QPushButton("Move…")
         self.refresh_btn = QtWidgets.QPushButton("Refresh")
         tb_layout.addWidget(self.add_btn)
         tb_layout.addWidget(self.edit_btn)
         tb_layout.addWidget(self.delete_btn)
+        tb_layout.addWidget(self.recategorize_btn)
+        tb_layout.addWidget(self.move_btn)
         tb_layout.addStretch(1)
         tb_layout.addWidget(self.refresh_btn)
         layout.addLayout(tb_layout)
 
         self.table = QtWidgets.QTableView()
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
         self.table.setSortingEnabled(True)
         self.table.setAlternatingRowColors(True)
         self.table.horizontalHeader().setStretchLastSection(True)
@@ -170,6 +183,8 @@ class TransactionsView(QtWidgets.QWidget):
         self.add_btn.clicked.connect(self.addRequested.emit)
         self.edit_btn.clicked.connect(self._emit_edit_for_selection)
         self.delete_btn.clicked.connect(self._emit_delete_for_selection)
+        self.recategorize_btn.clicked.connect(lambda: self._emit_for_selection(self.recategorizeRequested))
+        self.move_btn.clicked.connect(lambda: self._emit_for_selection(self.moveRequested))
         self.refresh_btn.clicked.connect(self.refreshRequested.emit)
 
         # Filters
@@ -186,9 +201,12 @@ class TransactionsView(QtWidgets.QWidget):
             self.editRequested.emit(tx_id)
 
     def _emit_delete_for_selection(self) -> None:
-        tx_id = self.selected_tx_id()
-        if tx_id:
-            self.deleteRequested.emit(tx_id)
+        self._emit_for_selection(self.deleteRequested)
+
+    def _emit_for_selection(self, signal: QtCore.SignalInstance) -> None:
+        ids = self.selected_tx_ids()
+        if ids:
+            signal.emit(ids)
 
     def _emit_filters_changed(self, *args) -> None:
         self.filtersChanged.emit(self.filters())
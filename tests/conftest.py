@@ -0,0 +1,74 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from finance_tracker.db.base import Base
+from finance_tracker.models import (
+    User, Account, AccountType, Category, CategoryType, Transaction, TransactionType,
+)
+
+
+@pytest.fixture
+def session():
+    """Fresh in-memory database with the full schema."""
+    eng = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(eng)
+    factory = sessionmaker(bind=eng, autoflush=False, future=True)
+    with factory() as s:
+        yield s
+    eng.dispose()
+
+
+@pytest.fixture
+def factory(tmp_path):
+    """
+    Session factory on a file database (so every thread and pooled connection sees the
+    same data) holding a user, account "acct" (Checking, 100.00 to start) and category "food".
+    """
+    eng = create_engine(f"sqlite:///{tmp_path / 'finance.db'}", future=True)
+    Base.metadata.create_all(eng)
+    factory = sessionmaker(bind=eng, autoflush=False, future=True)
+    with factory.begin() as s:
+        user = User(username="f", password_hash="x")
+        s.add(user)
+        s.flush()
+        s.add_all([
+            Account(id="acct", user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                    starting_balance=Decimal("100.00"), balance=Decimal("100.00")),
+            Category(id="food", name="Food", type=CategoryType.EXPENSE),
+        ])
+    yield factory
+    eng.dispose()
+
+
+@pytest.fixture
+def ledger(session):
+    """A user with one checking account and two expense categories."""
+    user = User(username="t", password_hash="x")
+    session.add(user)
+    session.flush()
+    acct = Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                   starting_balance=Decimal("100.00"), balance=Decimal("100.00"))
+    food = Category(name="Food", type=CategoryType.EXPENSE)
+    rent = Category(name="Rent", type=CategoryType.EXPENSE)
+    session.add_all([acct, food, rent])
+    session.flush()
+
+    def add_tx(amount: str, on: date, category=None, account=acct, description=""):
+        amt = Decimal(amount)
+        tx = Transaction(
+            account_id=account.id,
+            category_id=category.id if category else None,
+            date=on,
+            type=TransactionType.CREDIT if amt > 0 else TransactionType.DEBIT,
+            amount=amt,
+            description=description,
+        )
+        session.add(tx)
+        session.flush()
+        return tx
+
+    return {"user": user, "account": acct, "food": food, "rent": rent, "add_tx": add_tx}
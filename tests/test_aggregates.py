@@ -0,0 +1,68 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from finance_tracker.models import Transaction
+from finance_tracker.services.transactions import bulk_recategorize
+from finance_tracker.ui.services.aggregates import aggregates
+from finance_tracker.ui.services.ledger import month_to_date_spend_by_category
+
+MARCH = date(2024, 3, 15)
+
+
+@pytest.fixture
+def store(session):
+    yield aggregates
+    aggregates.invalidate()
+
+
+def test_store_follows_committed_writes_without_querying(session, ledger, store):
+    add, food, rent = ledger["add_tx"], ledger["food"], ledger["rent"]
+    add("-10.00", date(2024, 3, 2), food)
+    add("-5.00", date(2024, 2, 27), food)
+    session.commit()
+    store.load(session)
+
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", record)
+    try:
+        tx = add("-7.50", date(2024, 3, 4), rent)
+        add("-2.50", date(2024, 3, 5))
+        session.commit()
+        executed = len(statements)
+        assert store.month_spend_by_category(MARCH) == [
+            ("Food", Decimal("10.00")), ("Rent", Decimal("7.50")), ("(Uncategorized)", Decimal("2.50"))]
+
+        tx.category_id, tx.date = food.id, date(2024, 2, 1)
+        session.commit()
+        assert store.month_spend_by_category(MARCH) == [("Food", Decimal("10.00")), ("(Uncategorized)", Decimal("2.50"))]
+
+        session.delete(session.get(Transaction, tx.id))
+        session.flush()
+        session.rollback()  # rolled-back work never reaches the store
+        assert store.month_spend_by_category(date(2024, 2, 1)) == [("Food", Decimal("12.50"))]
+        assert len(statements) > executed  # the writes ran; the reads above did not
+        reads = len(statements)
+        store.month_spend_by_category(MARCH)
+        assert len(statements) == reads
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record)
+    assert store.month_spend_by_category(MARCH) == month_to_date_spend_by_category(session, MARCH)
+
+
+def test_bulk_dml_marks_store_for_reload(session, ledger, store):
+    tx = ledger["add_tx"]("-4.00", date(2024, 3, 1), ledger["food"])
+    session.commit()
+    store.load(session)
+    bulk_recategorize(session, [tx.id], ledger["rent"].id)
+    assert store.loaded
+    session.commit()
+    assert not store.loaded
+    store.load(session)
+    assert store.month_spend_by_category(MARCH) == [("Rent", Decimal("4.00"))]
@@ -0,0 +1,60 @@
+import json
+import threading
+from datetime import date
+from decimal import Decimal
+from http.client import HTTPConnection
+
+import pytest
+
+from finance_tracker.models import Transaction, TransactionType
+from finance_tracker.services.api import ApiServer
+
+
+@pytest.fixture
+def server(factory):
+    httpd = ApiServer(("127.0.0.1", 0), session_factory=factory)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd, factory
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(httpd, path, etag=None):
+    conn = HTTPConnection(*httpd.server_address[:2], timeout=5)
+    try:
+        conn.request("GET", path, headers={"If-None-Match": etag} if etag else {})
+        resp = conn.getresponse()
+        return resp.status, resp.getheader("ETag"), resp.read()
+    finally:
+        conn.close()
+
+
+def test_etag_revalidation_follows_writes(server):
+    httpd, factory = server
+    status, etag, body = _get(httpd, "/balances")
+    assert status == 200 and etag
+    assert [r["balance"] for r in json.loads(body)] == ["100.00"]
+
+    assert _get(httpd, "/balances", etag) == (304, etag, b"")
+
+    with factory() as s:
+        s.add(Transaction(account_id="acct", date=date(2026, 1, 5), amount=Decimal("-25.00"),
+                          type=TransactionType.DEBIT))
+        s.commit()
+
+    status, new_etag, body = _get(httpd, "/balances", etag)
+    assert status == 200 and new_etag != etag
+    assert [r["balance"] for r in json.loads(body)] == ["75.00"]
+
+
+def test_etags_do_not_carry_over_to_a_new_server(server):
+    httpd, factory = server
+    _, etag, _ = _get(httpd, "/balances")
+    restarted = ApiServer(("127.0.0.1", 0), session_factory=factory)
+    try:
+        threading.Thread(target=restarted.serve_forever, daemon=True).start()
+        status, other, _ = _get(restarted, "/balances", etag)
+        assert status == 200 and other != etag
+    finally:
+        restarted.shutdown()
+        restarted.server_close()
@@ -0,0 +1,72 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.archive import attach_archive
+from finance_tracker.db.base import Base
+from finance_tracker.models import Account, AccountType, Category, CategoryType, Transaction, TransactionType, User
+from finance_tracker.services import archive, reports
+from finance_tracker.services.transactions import bulk_delete, transactions_page
+from finance_tracker.ui.models.filters import TransactionFilters
+
+
+def test_archived_history_is_checkpointed_and_unioned_on_demand(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    attach_archive(eng, tmp_path / "cold.db")
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        user = User(username="u", password_hash="x")
+        s.add(user)
+        s.flush()
+        acct = Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                       starting_balance=Decimal("100.00"), balance=Decimal("100.00"))
+        food = Category(name="Food", type=CategoryType.EXPENSE)
+        s.add_all([acct, food])
+        s.flush()
+        for amount, on in (("-10.00", date(2021, 6, 1)), ("-5.00", date(2022, 2, 1)), ("-1.00", date(2023, 3, 1))):
+            s.add(Transaction(account_id=acct.id, category_id=food.id, date=on, amount=Decimal(amount),
+                              type=TransactionType.DEBIT))
+        s.commit()
+
+    assert archive.archive_before(eng, date(2023, 1, 1)) == 2
+    assert archive.archive_before(eng, date(2022, 1, 1)) == 0
+
+    with Session(eng) as s:
+        assert s.scalar(select(func.count()).select_from(Transaction)) == 1
+        assert archive.transaction_source(s, date(2023, 1, 1)) is Transaction
+        assert [b.balance for b in reports.account_balances(s)] == [Decimal("84.00")]
+        assert [b.balance for b in reports.account_balances(s, as_of=date(2021, 12, 31))] == [Decimal("90.00")]
+        assert [r.spend for r in reports.monthly_spend_by_category(s, 2022, 2)] == [Decimal("5.00")]
+        assert len(transactions_page(s).items) == 3
+        assert len(transactions_page(s, TransactionFilters(date_from=date(2023, 1, 1))).items) == 1
+    eng.dispose()
+
+
+def test_bulk_edits_skip_archived_rows(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    attach_archive(eng, tmp_path / "cold.db")
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        user = User(username="u", password_hash="x")
+        s.add(user)
+        s.flush()
+        acct = Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                       starting_balance=Decimal("0"), balance=Decimal("0"))
+        s.add(acct)
+        s.flush()
+        old = Transaction(account_id=acct.id, date=date(2022, 6, 1), amount=Decimal("-3.00"), type=TransactionType.DEBIT)
+        new = Transaction(account_id=acct.id, date=date(2023, 6, 1), amount=Decimal("-4.00"), type=TransactionType.DEBIT)
+        s.add_all([old, new])
+        s.commit()
+        ids, old_id = [old.id, new.id], old.id
+        assert archive.archived_ids(s, ids) == set()  # nothing archived yet
+
+    archive.archive_before(eng, date(2023, 1, 1))
+    with Session(eng) as s:
+        assert archive.archived_ids(s, ids) == {old_id}
+        assert bulk_delete(s, ids) == 1
+        s.commit()
+        assert [t.amount for t in transactions_page(s).items] == [Decimal("-3.00")]
+    eng.dispose()
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.base import Base
+from finance_tracker.models import (
+    Account, AccountType, Budget, BudgetItem, Category, CategoryType, Transaction, TransactionType, User,
+)
+from finance_tracker.services import async_reports, reports
+
+pytest.importorskip("aiosqlite")
+
+
+def _seed(path) -> str:
+    eng = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        user = User(username="u", password_hash="x")
+        s.add(user)
+        s.flush()
+        acct = Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                       starting_balance=Decimal("100.00"), balance=Decimal("100.00"))
+        food = Category(name="Food", type=CategoryType.EXPENSE)
+        pay = Category(name="Pay", type=CategoryType.INCOME)
+        s.add_all([acct, food, pay])
+        s.flush()
+        s.add(Budget(name="Monthly", items=[BudgetItem(category_id=food.id, monthly_limit=Decimal("50.00"))]))
+        for amount, on, cat in (("2000.00", date(2025, 3, 1), pay), ("-12.50", date(2025, 3, 4), food),
+                                ("-30.25", date(2025, 3, 20), food), ("-9.99", date(2025, 4, 2), food)):
+            s.add(Transaction(account_id=acct.id, category_id=cat.id, date=on, amount=Decimal(amount),
+                              type=TransactionType.CREDIT if amount[0] != "-" else TransactionType.DEBIT))
+        s.commit()
+        user_id = user.id
+    eng.dispose()
+    return user_id
+
+
+def test_month_summary_matches_sync_reports(tmp_path):
+    path = tmp_path / "async.db"
+    user_id = _seed(path)
+    aeng = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    factory = async_sessionmaker(bind=aeng, autoflush=False, expire_on_commit=False)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                async_reports.month_summary(2025, 3, factory=factory),
+                async_reports.month_summary(2025, 3, factory=factory, user_id=user_id),
+            )
+        finally:
+            await aeng.dispose()
+
+    everyone, scoped = asyncio.run(run())
+
+    eng = create_engine(f"sqlite:///{path}")
+    with Session(eng) as s:
+        start, end = reports.month_bounds(2025, 3)
+        for summary, uid in ((everyone, None), (scoped, user_id)):
+            assert summary.balances == reports.account_balances(s, None, uid)
+            assert summary.spend == reports.monthly_spend_by_category(s, 2025, 3, uid)
+            assert summary.cashflow == reports.cashflow(s, start, end, uid)
+            assert summary.budgets == reports.budget_utilization(s, 2025, 3, uid)
+    eng.dispose()
+
+    assert everyone.cashflow.net == Decimal("1957.25")
+    assert [b.spent for b in everyone.budgets] == [Decimal("42.75")]
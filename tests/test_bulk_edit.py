@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from finance_tracker.models import Account, AccountType, Transaction
+from finance_tracker.services import reports, snapshots
+from finance_tracker.services.transactions import bulk_delete, bulk_move, bulk_recategorize
+from finance_tracker.ui.services.ledger import recompute_account_balance
+
+
+def _balances(session):
+    return [(b.account_name, b.balance) for as_of in (date(2024, 1, 31), date(2024, 2, 29), None)
+            for b in reports.account_balances(session, as_of=as_of)]
+
+
+def test_bulk_edits_keep_balances_and_snapshots_consistent(session, ledger):
+    add, acct, food, rent = ledger["add_tx"], ledger["account"], ledger["food"], ledger["rent"]
+    savings = Account(user_id=ledger["user"].id, name="Savings", type=AccountType.SAVINGS,
+                      starting_balance=Decimal("0"), balance=Decimal("0"))
+    session.add(savings)
+    session.flush()
+    txs = [add("-10.00", date(2024, 1, 5), food), add("-20.00", date(2024, 1, 9), food),
+           add("-30.00", date(2024, 2, 3), food), add("40.00", date(2024, 2, 20))]
+    for a in (acct, savings):
+        recompute_account_balance(session, a)
+    snapshots.roll_forward(session, through=date(2024, 2, 29))
+
+    assert bulk_recategorize(session, [t.id for t in txs[:3]], rent.id) == 3
+    assert bulk_move(session, [txs[1].id, txs[2].id], savings.id) == 2
+    assert bulk_delete(session, [txs[0].id]) == 1
+    session.flush()
+    session.expire_all()
+
+    assert session.get(Account, acct.id).balance == Decimal("140.00")
+    assert session.get(Account, savings.id).balance == Decimal("-50.00")
+    moved = session.scalars(select(Transaction).where(Transaction.account_id == savings.id)).all()
+    assert {(t.category_id, t.user_id) for t in moved} == {(rent.id, ledger["user"].id)}
+
+    tracked = _balances(session)
+    snapshots.rebuild(session, through=date(2024, 2, 29))
+    assert _balances(session) == tracked
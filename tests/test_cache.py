@@ -0,0 +1,65 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from finance_tracker.db.base import Base
+from finance_tracker.models import Account, AccountType, User
+from finance_tracker.services.cache import ReportCache, cached_report
+from finance_tracker.services import reports
+
+
+def test_version_change_and_lru_eviction():
+    c = ReportCache(maxsize=2, ttl=60)
+    calls = []
+
+    def compute(v):
+        calls.append(v)
+        return v
+
+    assert c.get_or_compute("a", lambda: compute(1), version=1) == 1
+    assert c.get_or_compute("a", lambda: compute(2), version=1) == 1
+    assert c.get_or_compute("a", lambda: compute(3), version=2) == 3
+    c.get_or_compute("b", lambda: compute(4), version=2)
+    c.get_or_compute("c", lambda: compute(5), version=2)
+    assert c.get_or_compute("a", lambda: compute(6), version=2) == 6  # evicted as least recently used
+    assert calls == [1, 3, 4, 5, 6]
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    first = ReportCache(disk_dir=tmp_path)
+    first.get_or_compute("k", lambda: Decimal("1.50"), version=1, fingerprint=lambda: ("db", 1))
+    second = ReportCache(disk_dir=tmp_path)
+    assert second.get_or_compute("k", lambda: Decimal("0"), version=7, fingerprint=lambda: ("db", 1)) == Decimal("1.50")
+    assert second.get_or_compute("k", lambda: Decimal("0"), version=8, fingerprint=lambda: ("db", 2)) == Decimal("0")
+
+
+def test_cached_report_bypasses_uncommitted_writes(session, ledger):
+    balances = cached_report(reports.account_balances, cache=ReportCache())
+    assert balances(session)[0].balance == Decimal("100.00")
+    ledger["add_tx"]("-40.00", date(2025, 1, 2))
+    assert balances(session)[0].balance == Decimal("60.00")
+
+
+def test_in_memory_engines_do_not_share_entries():
+    balances = cached_report(reports.account_balances, cache=ReportCache())
+    engines = []
+    for opening in ("10.00", "20.00"):
+        eng = create_engine("sqlite://")
+        Base.metadata.create_all(eng)
+        with Session(eng) as s:
+            user = User(username="u", password_hash="x")
+            s.add(user)
+            s.flush()
+            s.add(Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                          starting_balance=Decimal(opening), balance=Decimal(opening)))
+            s.commit()
+        engines.append(eng)
+    # Same URL ("sqlite://") and same write count for both reads
+    seen = []
+    for eng in engines:
+        with Session(eng) as s:
+            seen.append(balances(s)[0].balance)
+        eng.dispose()
+    assert seen == [Decimal("10.00"), Decimal("20.00")]
@@ -0,0 +1,42 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from finance_tracker.models import CategoryRule, RuleKind, Transaction
+from finance_tracker.services.categorize import AhoCorasick, recategorize, suggest_category
+
+
+def test_automaton_reports_overlapping_patterns():
+    ac = AhoCorasick([("he", 0), ("she", 1), ("his", 2), ("hers", 3)])
+    assert ac.search("ushers") == {0, 1, 3}
+    assert ac.search("nothing") == set()
+
+
+def test_rules_recategorize_the_ledger_by_priority(session, ledger):
+    add, acct, food, rent = ledger["add_tx"], ledger["account"], ledger["food"], ledger["rent"]
+    session.add_all([
+        CategoryRule(category_id=food.id, pattern="coffee", priority=10),
+        CategoryRule(category_id=rent.id, kind=RuleKind.REGEX, pattern=r"^rent\b", priority=20),
+        # a big "coffee" charge is not food: the amount range narrows the lower-priority rule
+        CategoryRule(category_id=rent.id, pattern="coffee", max_amount=Decimal("-500.00"), priority=5),
+        CategoryRule(category_id=food.id, pattern="", account_id="elsewhere", priority=1),
+    ])
+    session.flush()
+    small = add("-4.50", date(2025, 1, 2), description="Blue Bottle COFFEE #12")
+    large = add("-900.00", date(2025, 1, 3), description="coffee machine lease")
+    rent_tx = add("-1200.00", date(2025, 1, 4), description="RENT January")
+    other = add("-3.00", date(2025, 1, 5), description="parking")
+    kept = add("-2.00", date(2025, 1, 6), rent, description="coffee")
+
+    assert recategorize(session, batch_size=2) == 3
+    session.expire_all()
+    got = dict(session.execute(select(Transaction.id, Transaction.category_id)).all())
+    assert got[small.id] == food.id
+    assert got[large.id] == rent.id
+    assert got[rent_tx.id] == rent.id
+    assert got[other.id] is None
+    assert got[kept.id] == rent.id
+
+    assert recategorize(session, overwrite=True) == 1
+    assert suggest_category(session, "coffee", Decimal("-1.00"), acct.id) == food.id
@@ -0,0 +1,78 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from finance_tracker.db.money import cents_expr, sum_cents, to_cents
+from finance_tracker.models import Account, AccountType, Transaction
+from finance_tracker.services import columnar, reports
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def cols(session, ledger):
+    savings = Account(user_id=ledger["user"].id, name="Savings", type=AccountType.SAVINGS,
+                      starting_balance=Decimal("0"), balance=Decimal("0"))
+    session.add(savings)
+    session.flush()
+    add = ledger["add_tx"]
+    add("1500.00", date(2025, 1, 1), description="pay")
+    add("-12.34", date(2025, 1, 3), ledger["food"])
+    add("-800.00", date(2025, 1, 31), ledger["rent"])
+    add("-0.10", date(2025, 2, 2), ledger["food"])
+    add("-0.20", date(2025, 2, 2))
+    add("250.00", date(2025, 2, 5), account=savings)
+    add("-7.77", date(2025, 3, 10), ledger["food"], account=savings)
+    # chunk_size below the row count: the cursor is read in several parts
+    return columnar.fetch_transactions(session, chunk_size=3)
+
+
+def test_fetch_matches_the_table(session, cols):
+    assert len(cols) == session.scalar(select(func.count()).select_from(Transaction))
+    assert cols.date.dtype == np.dtype("datetime64[D]")
+    assert int(cols.amount_cents.sum()) == session.scalar(select(sum_cents(cents_expr(Transaction.amount))))
+    orm = sorted(
+        ((t.date, t.account_id, t.category_id, to_cents(t.amount)) for t in session.scalars(select(Transaction))),
+        key=repr,
+    )
+    got = sorted((
+        (d.astype(object), cols.account_ids[a], cols.category_ids[c] if c >= 0 else None, int(cents))
+        for d, a, c, cents in zip(cols.date, cols.account, cols.category, cols.amount_cents)
+    ), key=repr)
+    assert got == orm
+
+
+def test_group_sums_match_sql(session, cols):
+    by_account = columnar.sum_by_account(cols)
+    for row in reports.account_balances(session):
+        start = session.get(Account, row.account_id).starting_balance
+        assert to_cents(row.balance - start) == by_account[row.account_id]
+
+    spend = columnar.sum_by_category(cols)
+    sql = dict(session.execute(
+        select(Transaction.category_id, sum_cents(-cents_expr(Transaction.amount)))
+        .where(Transaction.amount < 0).group_by(Transaction.category_id)
+    ).all())
+    assert spend == sql
+    jan = {r.category_id: to_cents(r.spend) for r in reports.monthly_spend_by_category(session, 2025, 1)}
+    jan_cols = columnar.sum_by_category(columnar.fetch_transactions(session, date(2025, 1, 1), date(2025, 1, 31)))
+    assert {k: v for k, v in jan_cols.items() if v} == jan
+
+
+def test_daily_monthly_and_rolling(session, cols):
+    days, totals = columnar.daily_totals(cols, date(2025, 1, 30), date(2025, 2, 2))
+    assert days.tolist() == [date(2025, 1, 30), date(2025, 1, 31), date(2025, 2, 1), date(2025, 2, 2)]
+    assert totals.tolist() == [0, -80000, 0, -30]
+
+    months, per_month = columnar.monthly_totals(cols)
+    flow = reports.cashflow_series(session, date(2025, 1, 1), date(2025, 3, 31), "month")
+    assert [str(m) for m in months] == ["2025-01", "2025-02", "2025-03"]
+    assert per_month.tolist() == [to_cents(p.net) for p in flow]
+
+    assert columnar.rolling_sum(np.array([1, 2, 3, 4]), 2).tolist() == [1, 3, 5, 7]
+    assert columnar.rolling_mean(np.array([2, 4, 6]), 2).tolist() == [2.0, 3.0, 5.0]
+    assert columnar.percentiles(np.array([1, 2, 3]), (50,)) == {50: 2.0}
+    with pytest.raises(ValueError):
+        columnar.rolling_sum(np.array([1]), 0)
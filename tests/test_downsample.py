@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from finance_tracker.services.downsample import lttb, lttb_indices, pick_granularity
+from finance_tracker.ui.services.ledger import chart_series, ledger_date_range
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    xs = list(range(1000))
+    ys = [0.0] * 1000
+    ys[123], ys[777] = 50.0, -40.0
+    picked = lttb_indices(xs, ys, 50)
+    assert len(picked) == 50 and picked == sorted(picked)
+    assert picked[0] == 0 and picked[-1] == 999
+    assert {123, 777} <= set(picked)
+
+    points = [(date(2020, 1, 1) + timedelta(days=i), Decimal(i)) for i in range(10)]
+    assert lttb(points, 20) == points
+
+
+def test_granularity_fits_the_width():
+    ten_years = (date(2015, 1, 1), date(2024, 12, 31))
+    assert pick_granularity(*ten_years, width=2000) == "day"
+    assert pick_granularity(*ten_years, width=800) == "week"
+    assert pick_granularity(*ten_years, width=60) == "month"
+    assert pick_granularity(*ten_years, width=40) == "quarter"
+    assert pick_granularity(date(2024, 1, 1), date(2024, 3, 31), width=100) == "day"
+
+
+def test_chart_series_buckets_visible_range(session, ledger):
+    add, food = ledger["add_tx"], ledger["food"]
+    for i in range(120):
+        add("-1.00", date(2024, 1, 1) + timedelta(days=i), food)
+    add("50.00", date(2024, 2, 10))
+    session.flush()
+
+    assert ledger_date_range(session) == (date(2024, 1, 1), date(2024, 4, 29))
+    granularity, points = chart_series(session, "spend", date(2024, 1, 1), date(2024, 4, 29), width=3)
+    assert granularity == "month"
+    assert points == [(date(2024, 1, 1), Decimal("31.00")), (date(2024, 2, 1), Decimal("29.00")),
+                      (date(2024, 4, 1), Decimal("29.00"))]
+
+    granularity, points = chart_series(session, "balance", date(2024, 2, 1), date(2024, 2, 29), width=100)
+    assert granularity == "day" and len(points) == 29
+    assert points[0] == (date(2024, 2, 1), Decimal("100.00") - 32)  # opening 100, Jan spend 31, Feb 1st
+    assert points[-1][1] == Decimal("100.00") - 31 - 29 + 50
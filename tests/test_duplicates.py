@@ -0,0 +1,32 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from finance_tracker.models import Account, Transaction
+from finance_tracker.services.duplicates import find_duplicates, merge_duplicates
+from finance_tracker.ui.services.ledger import recompute_account_balance
+
+
+def test_near_duplicates_are_grouped_and_merged(session, ledger):
+    add, acct, food = ledger["add_tx"], ledger["account"], ledger["food"]
+    first = add("-42.10", date(2025, 3, 1), description="AMAZON MKTPLACE PMTS 0301")
+    second = add("-42.10", date(2025, 3, 2), food, description="Amazon Mktplace pmts")
+    add("-42.10", date(2025, 3, 9), description="AMAZON MKTPLACE PMTS")       # outside the window
+    add("-42.11", date(2025, 3, 1), description="AMAZON MKTPLACE PMTS")       # different amount
+    add("-42.10", date(2025, 3, 2), description="Shell gas station")          # different description
+    third = add("-42.10", date(2025, 3, 3), description="amazon mktplace")    # chains via the second
+    recompute_account_balance(session, acct)
+    session.flush()
+
+    groups = find_duplicates(session)
+    assert len(groups) == 1
+    assert groups[0].keep_id == second.id  # the categorized row survives
+    assert set(groups[0].duplicate_ids) == {first.id, third.id}
+
+    assert merge_duplicates(session, groups) == 2
+    session.flush()
+    session.expire_all()
+    assert session.get(Account, acct.id).balance == Decimal("100.00") - Decimal("42.10") * 2 - Decimal("42.11") - Decimal("42.10")
+    assert session.scalar(select(Transaction.category_id).where(Transaction.id == second.id)) == food.id
+    assert find_duplicates(session) == []
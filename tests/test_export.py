@@ -0,0 +1,74 @@
+import csv
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_tracker.models import TransactionType
+from finance_tracker.services import export, reports
+
+
+@pytest.fixture
+def rows(session, ledger):
+    """Seven transactions, so a chunk size of 3 gives chunks of 3, 3 and 1."""
+    for day in range(1, 8):
+        ledger["add_tx"](f"-{day}.10", date(2025, 3, day), ledger["food"] if day % 2 else None, description=f"tx {day}")
+    ledger["add_tx"]("-99.00", date(2025, 4, 1), ledger["rent"])  # outside the exported range
+    session.flush()
+    return [(date(2025, 3, day), Decimal(f"-{day}.10"), "Food" if day % 2 else None) for day in range(1, 8)]
+
+
+def _export(session, path, fmt=None):
+    return export.export_transactions(session, path, fmt, end=date(2025, 3, 31), chunk_size=3)
+
+
+def test_transaction_chunks_stream_in_chunk_size_parts(session, rows):
+    chunks = list(export.transaction_chunks(session, end=date(2025, 3, 31), chunk_size=3))
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    flat = [r for c in chunks for r in c]
+    assert [(r[1], r[5], r[3]) for r in flat] == rows
+    assert {r[2] for r in flat} == {"Checking"}
+
+
+def test_csv_round_trip(session, rows, tmp_path):
+    path = tmp_path / "tx.csv"
+    assert _export(session, path) == 7
+    with open(path, newline="", encoding="utf-8") as fp:
+        got = list(csv.DictReader(fp))
+    assert list(got[0]) == list(export.TRANSACTION_COLUMNS)
+    assert [(date.fromisoformat(r["date"]), Decimal(r["amount"]), r["category"] or None) for r in got] == rows
+    assert [r["type"] for r in got] == [TransactionType.DEBIT.value] * 7
+
+
+def test_jsonl_round_trip(session, rows, tmp_path):
+    path = tmp_path / "tx.ndjson"
+    assert _export(session, path) == 7
+    got = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [(date.fromisoformat(r["date"]), Decimal(r["amount"]), r["category"]) for r in got] == rows
+    assert got[0]["description"] == "tx 1"
+
+
+def test_parquet_writes_a_row_group_per_chunk(session, rows, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "tx.parquet"
+    assert _export(session, path) == 7
+    f = pq.ParquetFile(path)
+    assert f.metadata.num_row_groups == 3
+    table = f.read()
+    assert table.column_names == list(export.TRANSACTION_COLUMNS)
+    got = list(zip(table.column("date").to_pylist(), table.column("amount").to_pylist(),
+                   table.column("category").to_pylist()))
+    assert got == rows
+    assert table.column("type").to_pylist() == [TransactionType.DEBIT.value] * 7
+
+
+def test_report_export_and_format_inference(session, rows, tmp_path):
+    path = tmp_path / "spend.jsonl"
+    assert export.export_report(reports.monthly_spend_by_category(session, 2025, 3), path) == 1
+    (row,) = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert row["category_name"] == "Food" and Decimal(row["spend"]) == Decimal("16.40")
+
+    assert export.format_for("out.pq") == "parquet"
+    with pytest.raises(ValueError):
+        export.format_for("out.xlsx")
@@ -0,0 +1,60 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from finance_tracker.models import Goal
+from finance_tracker.services.goals import goal_progress, goal_progress_cache
+
+
+def test_goal_progress_and_required_monthly(session, ledger):
+    acct = ledger["account"]
+    acct.balance = Decimal("400.00")
+    session.add(Goal(name="Trip", account_id=acct.id, target_amount=Decimal("1000.00"),
+                     target_date=date(2025, 7, 1), created_at=datetime(2025, 1, 1)))
+    session.flush()
+
+    (row,) = goal_progress(session, today=date(2025, 4, 1))
+    assert row.current == Decimal("400.00")
+    assert row.remaining == Decimal("600.00")
+    assert row.progress == Decimal("0.4")
+    assert row.required_monthly == Decimal("200.00")
+    assert row.on_track is False
+
+
+def test_cache_refreshes_only_after_balance_change(session, ledger):
+    acct = ledger["account"]
+    session.add(Goal(name="Cushion", account_id=acct.id, target_amount=Decimal("500.00")))
+    session.flush()
+    cache = goal_progress_cache
+    cache.invalidate()
+
+    first = cache.get(session, today=date(2025, 1, 1))
+    assert first[0].current == Decimal("100.00")
+    assert cache.get(session, today=date(2025, 1, 1)) == first
+
+    acct.balance = Decimal("500.00")
+    session.flush()
+    assert cache.get(session, today=date(2025, 1, 1)) == first  # not committed yet
+    session.commit()
+    (row,) = cache.get(session, today=date(2025, 1, 1))
+    assert row.on_track is True and row.remaining == Decimal("0")
+
+
+def test_rolled_back_changes_leave_the_cache_alone(session, ledger):
+    acct = ledger["account"]
+    goal = Goal(name="Cushion", account_id=acct.id, target_amount=Decimal("500.00"))
+    session.add(goal)
+    session.commit()
+    cache = goal_progress_cache
+    cache.invalidate()
+    first = cache.get(session, today=date(2025, 1, 1))
+
+    acct.balance = Decimal("500.00")
+    goal.name = "Renamed"
+    session.flush()
+    session.rollback()
+    assert cache._stale_accounts == set() and cache._stale_goals == set()
+    assert cache.get(session, today=date(2025, 1, 1)) == first
+
+    session.delete(goal)
+    session.commit()
+    assert cache.get(session, today=date(2025, 1, 1)) == []
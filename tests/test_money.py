@@ -0,0 +1,85 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from finance_tracker.controllers import migrate_money
+from finance_tracker.db.archive import attach_archive
+from finance_tracker.db.base import Base
+from finance_tracker.db.money import Cents, cents_expr, check_money_storage, from_cents, sum_cents, to_cents
+from finance_tracker.models import Account, AccountType, Category, CategoryType, Transaction, TransactionType, User
+from finance_tracker.models.rule import CategoryRule
+from finance_tracker.services import archive, snapshots
+
+
+def test_cents_round_trip():
+    assert to_cents(Decimal("12.345")) == 1235
+    assert to_cents("-0.10") == -10
+    assert from_cents(-8643) == Decimal("-86.43")
+    assert from_cents(None) == Decimal("0.00")
+
+
+def test_cents_column_sums_exactly():
+    md = MetaData()
+    t = Table("t", md, Column("id", Integer, primary_key=True), Column("amount", Cents()))
+    eng = create_engine("sqlite://")
+    md.create_all(eng)
+    with eng.begin() as c:
+        c.execute(insert(t), [{"amount": Decimal("0.10")}] * 10 + [{"amount": Decimal("-0.30")}])
+        assert c.execute(select(t.c.amount).limit(1)).scalar() == Decimal("0.10")
+        total = c.execute(select(sum_cents(cents_expr(t.c.amount)))).scalar()
+        assert total == 70 and from_cents(total) == Decimal("0.70")
+        assert c.execute(select(func.count()).where(t.c.amount < 0)).scalar() == 1
+
+
+def test_startup_check_refuses_unconverted_storage(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'm.db'}")
+    check_money_storage(eng)  # no app_meta yet: numeric, as configured
+    Base.metadata.create_all(eng)
+    migrate_money.migrate(eng, "cents")
+    with pytest.raises(RuntimeError, match="stores money as 'cents'"):
+        check_money_storage(eng)
+    migrate_money.migrate(eng, "numeric")
+    check_money_storage(eng)
+    eng.dispose()
+
+
+def test_migration_converts_every_money_column(tmp_path):
+    eng = create_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    attach_archive(eng, tmp_path / "cold.db")
+    Base.metadata.create_all(eng)
+    with Session(eng) as s:
+        user = User(username="u", password_hash="x")
+        food = Category(name="Food", type=CategoryType.EXPENSE)
+        s.add_all([user, food])
+        s.flush()
+        acct = Account(user_id=user.id, name="Checking", type=AccountType.CHECKING,
+                       starting_balance=Decimal("0"), balance=Decimal("0"))
+        s.add(acct)
+        s.add(CategoryRule(category=food, min_amount=Decimal("-500.25"), max_amount=Decimal("-0.05")))
+        s.flush()
+        for amount, on in (("-10.15", date(2022, 6, 1)), ("-5.35", date(2024, 2, 1))):
+            s.add(Transaction(account_id=acct.id, date=on, amount=Decimal(amount), type=TransactionType.DEBIT))
+        s.flush()
+        snapshots.roll_forward(s, date(2024, 3, 31))
+        s.commit()
+    archive.archive_before(eng, date(2023, 1, 1))
+
+    def stored():
+        with eng.connect() as c:
+            return {
+                (schema, table, column): c.execute(text(
+                    f"SELECT {column} FROM {schema + '.' if schema else ''}{table} ORDER BY 1"
+                )).scalars().all()
+                for schema, table, column in migrate_money.MONEY_COLUMNS
+            }
+
+    before = stored()
+    assert all(before.values())  # every column has a row to convert
+    migrate_money.migrate(eng, "cents")
+    assert stored() == {k: [to_cents(v) for v in vs] for k, vs in before.items()}
+    migrate_money.migrate(eng, "numeric")
+    assert stored() == before
+    eng.dispose()
@@ -0,0 +1,112 @@
+"""
+EXPLAIN QUERY PLAN regression tests for the hot read paths.
+
+Every SELECT a case issues is captured and explained; the plan is compared with
+tests/query_plans/<case>.txt. After an intentional index or query change, regenerate
+the expectations with UPDATE_QUERY_PLANS=1 and review the diff like any other code.
+"""
+import os
+import re
+from datetime import date
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+from finance_tracker.models import Budget, BudgetItem
+from finance_tracker.services import reports
+from finance_tracker.ui.models.filters import TransactionFilters
+from finance_tracker.ui.services import ledger, queries
+
+PLANS = Path(__file__).parent / "query_plans"
+
+# A transactions access that is neither an index SEARCH nor an index-ordered SCAN
+FULL_SCAN = re.compile(r"\bSCAN transactions\w*(?! USING (COVERING )?INDEX)\b")
+
+START, END = date(2025, 1, 1), date(2025, 3, 31)
+
+CASES = {
+    "account_balances": lambda s, lg: reports.account_balances(s),
+    "account_balances_as_of": lambda s, lg: reports.account_balances(s, as_of=date(2025, 2, 15)),
+    "account_balances_user": lambda s, lg: reports.account_balances(s, user_id=lg["user"].id),
+    "monthly_spend_by_category": lambda s, lg: reports.monthly_spend_by_category(s, 2025, 2),
+    "monthly_spend_by_category_user": lambda s, lg: reports.monthly_spend_by_category(s, 2025, 2, user_id=lg["user"].id),
+    "cashflow": lambda s, lg: reports.cashflow(s, START, END),
+    "budget_utilization": lambda s, lg: reports.budget_utilization(s, 2025, 2),
+    "spend_by_category_series": lambda s, lg: reports.spend_by_category_series(s, START, END),
+    "account_flow_series": lambda s, lg: reports.account_flow_series(s, START, END),
+    "account_balance_series": lambda s, lg: reports.account_balance_series(s, START, END),
+    "cashflow_series": lambda s, lg: reports.cashflow_series(s, START, END, "week"),
+    "accounts_choices": lambda s, lg: queries.accounts_choices(s, lg["user"].id),
+    "categories_choices": lambda s, lg: queries.categories_choices(s),
+    "transactions_all": lambda s, lg: queries.transactions_query(s, TransactionFilters()).all(),
+    "transactions_by_account": lambda s, lg: queries.transactions_query(
+        s, TransactionFilters(account_id=lg["account"].id, date_from=START, date_to=END)).all(),
+    "transactions_by_category": lambda s, lg: queries.transactions_query(
+        s, TransactionFilters(category_id=lg["food"].id, date_from=START)).all(),
+    "transactions_by_date": lambda s, lg: queries.transactions_query(
+        s, TransactionFilters(date_from=START, date_to=END, txt="coffee")).all(),
+    "transactions_by_user": lambda s, lg: queries.transactions_query(
+        s, TransactionFilters(user_id=lg["user"].id, date_from=START)).all(),
+    "transaction_rows_by_account": lambda s, lg: s.execute(queries.transaction_rows_query(
+        s, TransactionFilters(account_id=lg["account"].id, date_from=START, date_to=END))).all(),
+    "recompute_account_balance": lambda s, lg: ledger.recompute_account_balance(s, lg["account"]),
+    "month_to_date_spend_by_category": lambda s, lg: ledger.month_to_date_spend_by_category(s, date(2025, 3, 20)),
+}
+
+
+@pytest.fixture
+def populated(session, ledger):
+    add_tx, food, rent = ledger["add_tx"], ledger["food"], ledger["rent"]
+    for month in (1, 2, 3):
+        add_tx("-4.50", date(2025, month, 3), food, description="coffee")
+        add_tx("-900.00", date(2025, month, 1), rent)
+        add_tx("2500.00", date(2025, month, 25))
+    budget = Budget(name="Monthly")
+    session.add(budget)
+    session.flush()
+    session.add(BudgetItem(budget_id=budget.id, category_id=food.id, monthly_limit=200))
+    session.flush()
+    return session, ledger
+
+
+def _explain(session, run) -> list[str]:
+    """Run the case and return its normalised plans, one block per SELECT issued."""
+    conn = session.connection()
+    issued = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            issued.append((statement, parameters))
+
+    event.listen(conn, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(conn, "before_cursor_execute", capture)
+
+    blocks = []
+    for n, (statement, parameters) in enumerate(issued, 1):
+        depth, lines = {0: -1}, [f"-- query {n}"]
+        for node, parent, _, detail in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters):
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node] + detail)
+        blocks.append("\n".join(lines))
+    return blocks
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_query_plan(name, populated):
+    session, lg = populated
+    session.flush()
+    plan = "\n\n".join(_explain(session, lambda: CASES[name](session, lg))) + "\n"
+
+    scans = [line.strip() for line in plan.splitlines() if FULL_SCAN.search(line)]
+    assert not scans, f"{name} scans transactions without an index: {scans}"
+
+    expected = PLANS / f"{name}.txt"
+    if os.environ.get("UPDATE_QUERY_PLANS"):
+        PLANS.mkdir(exist_ok=True)
+        expected.write_text(plan)
+    assert expected.exists(), f"no expected plan for {name}; run with UPDATE_QUERY_PLANS=1"
+    assert plan == expected.read_text(), f"query plan for {name} changed; review and regenerate"
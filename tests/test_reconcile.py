@@ -0,0 +1,42 @@
+import io
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from finance_tracker.models import Transaction
+from finance_tracker.services.reconcile import read_statement_csv, reconcile
+
+STATEMENT = """date,amount,description
+2025-04-01,-12.00,COFFEE
+2025-04-03,-12.00,COFFEE
+2025-04-05,-60.00,GROCER
+2025-04-20,1500.00,PAYROLL
+2025-04-28,-9.99,STREAMING
+"""
+
+
+def test_statement_is_merge_matched_within_tolerance(session, ledger):
+    add = ledger["add_tx"]
+    a = add("-12.00", date(2025, 3, 30))   # two days early: still the first coffee
+    b = add("-12.00", date(2025, 4, 3))
+    c = add("-60.00", date(2025, 4, 9))    # four days late: outside the default window
+    d = add("1500.00", date(2025, 4, 20))
+    e = add("-45.00", date(2025, 4, 22))   # not on the statement
+    lines = read_statement_csv(io.StringIO(STATEMENT))
+
+    result = reconcile(session, ledger["account"].id, lines)
+    assert [(l.date, item.id) for l, item in result.matched] == [
+        (date(2025, 4, 1), a.id), (date(2025, 4, 3), b.id), (date(2025, 4, 20), d.id),
+    ]
+    assert [l.description for l in result.unmatched_statement] == ["GROCER", "STREAMING"]
+    assert [item.id for item in result.unmatched_ledger] == [c.id, e.id]
+
+    session.expire_all()
+    cleared = set(session.scalars(select(Transaction.id).where(Transaction.cleared.is_(True))))
+    assert cleared == {a.id, b.id, d.id}
+
+    # cleared rows are not offered again; the widened window picks up the late grocery row
+    again = reconcile(session, ledger["account"].id, lines, tolerance_days=5)
+    assert [item.id for _, item in again.matched] == [c.id]
+    assert again.unmatched_ledger[0].amount == Decimal("-45.00")
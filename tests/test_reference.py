@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+from sqlalchemy import event, update
+
+from finance_tracker.models import Account, Category
+from finance_tracker.ui.services.reference import refs
+
+
+def test_maps_reload_only_after_committed_reference_changes(factory):
+    selects = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append(statement)
+
+    event.listen(factory.kw["bind"], "before_cursor_execute", record)
+
+    assert refs.account_choices(factory) == [("acct", "Checking")]
+    assert refs.categories(factory)["food"].name == "Food"
+    loaded = len(selects)
+    refs.accounts(factory), refs.category_choices(factory)
+    assert len(selects) == loaded
+
+    with factory.begin() as s:
+        s.get(Account, "acct").balance = Decimal("12.00")  # not reference data
+    with factory() as s:
+        s.get(Category, "food").name = "Groceries"
+        s.flush()
+        s.rollback()
+    version = refs.version("accounts")
+    selects.clear()
+    assert refs.accounts(factory)["acct"].name == "Checking"
+    assert refs.categories(factory)["food"].name == "Food"
+    assert selects == []
+
+    with factory.begin() as s:
+        s.get(Category, "food").name = "Groceries"
+    with factory.begin() as s:
+        s.execute(update(Account).where(Account.id == "acct").values(name="Main"))
+    assert refs.version("accounts") == version + 1
+    selects.clear()
+    assert refs.categories(factory)["food"].name == "Groceries"
+    assert refs.accounts(factory)["acct"].name == "Main"
+    assert len(selects) == 2
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from finance_tracker.models import Budget, BudgetItem, Transaction, TransactionType
+from finance_tracker.services import report_batch, reports
+from finance_tracker.services.export import report_records
+
+
+@pytest.fixture
+def year_of_spend(factory):
+    """One Food debit on the 10th of every month of 2024 (1.00 in January ... 12.00 in December)."""
+    with factory.begin() as s:
+        for month in range(1, 13):
+            s.add(Transaction(account_id="acct", category_id="food", date=date(2024, month, 10),
+                              type=TransactionType.DEBIT, amount=Decimal(f"-{month}.00")))
+
+
+def test_months_and_ranges():
+    assert report_batch.parse_month("2024-03") == (2024, 3)
+    with pytest.raises(ValueError):
+        report_batch.parse_month("2024-13")
+    assert report_batch.month_range((2023, 11), (2024, 2)) == [(2023, 11), (2023, 12), (2024, 1), (2024, 2)]
+    jobs = report_batch.jobs_for(["spend", "cashflow", "spend"], [(2024, 1), (2024, 2), (2024, 1)])
+    assert [(j.report, j.period) for j in jobs] == [
+        ("spend", "2024-01"), ("spend", "2024-02"), ("cashflow", "2024-01"), ("cashflow", "2024-02")]
+
+
+def test_grouped_run_matches_per_month_reports(factory, year_of_spend):
+    with factory.begin() as s:
+        s.add(Budget(name="Monthly", items=[BudgetItem(category_id="food", monthly_limit=Decimal("5.00"))]))
+    months = report_batch.month_range((2023, 12), (2024, 4)) + [(2024, 7), (2024, 9), (2024, 10)]
+    assert report_batch.month_runs(months) == [
+        (date(2023, 12, 1), date(2024, 4, 30)), (date(2024, 7, 1), date(2024, 7, 31)),
+        (date(2024, 9, 1), date(2024, 10, 31))]
+    jobs = report_batch.jobs_for(report_batch.REPORTS, months)
+    grouped = report_batch.run_reports(jobs, cached=False, session_factory=factory)
+    assert [r.job for r in grouped] == jobs
+    with factory() as s:
+        for r in grouped:
+            start, end = reports.month_bounds(r.job.year, r.job.month)
+            expected = {
+                "balances": lambda: reports.account_balances(s, end),
+                "spend": lambda: reports.monthly_spend_by_category(s, r.job.year, r.job.month),
+                "cashflow": lambda: reports.cashflow(s, start, end),
+                "budgets": lambda: reports.budget_utilization(s, r.job.year, r.job.month),
+            }[r.job.report]()
+            assert (r.columns, r.rows) == report_records(expected), r.job
+    assert report_batch.run_reports(jobs, session_factory=factory) == grouped  # through the cache
+
+    out = io.StringIO()
+    report_batch.write_json(grouped, out)
+    doc = json.loads(out.getvalue())
+    march = next(d for d in doc if d["report"] == "balances" and d["month"] == "2024-03")
+    assert march["rows"][0]["balance"] == "94.00"
+
+    out = io.StringIO()
+    report_batch.write_csv(grouped, out)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    spend = [r for r in rows if r["report"] == "spend"]
+    assert [(r["month"], r["spend"]) for r in spend][:2] == [("2024-01", "1.00"), ("2024-02", "2.00")]
+    assert all(r["balance"] == "" for r in spend)
@@ -0,0 +1,65 @@
+from datetime import date
+from decimal import Decimal
+
+from finance_tracker.models import Account, AccountType, Budget, BudgetItem, User
+from finance_tracker.services import reports
+
+
+def test_budget_utilization_counts_only_the_month(session, ledger):
+    add_tx, food, rent = ledger["add_tx"], ledger["food"], ledger["rent"]
+    budget = Budget(name="Monthly")
+    session.add(budget)
+    session.flush()
+    session.add_all([
+        BudgetItem(budget_id=budget.id, category_id=food.id, monthly_limit=Decimal("200.00")),
+        BudgetItem(budget_id=budget.id, category_id=rent.id, monthly_limit=Decimal("1000.00")),
+    ])
+    add_tx("-50.00", date(2025, 3, 4), food)
+    add_tx("-25.00", date(2025, 3, 30), food)
+    add_tx("-900.00", date(2025, 2, 1), rent)  # outside the month: rent must still be listed
+    session.flush()
+
+    rows = {r.category_name: r for r in reports.budget_utilization(session, 2025, 3)}
+    assert rows["Food"].spent == Decimal("75.00")
+    assert rows["Food"].utilization == Decimal("0.375")
+    assert rows["Rent"].spent == Decimal("0")
+    assert rows["Rent"].utilization == Decimal("0")
+
+
+def test_series_are_dense_and_bucketed(session, ledger):
+    add_tx, food = ledger["add_tx"], ledger["food"]
+    add_tx("-10.00", date(2025, 1, 15), food)
+    add_tx("-5.00", date(2025, 3, 31), food)
+    add_tx("200.00", date(2025, 3, 1))
+
+    (food_series,) = reports.spend_by_category_series(session, date(2025, 1, 1), date(2025, 4, 30), "month")
+    assert [p.value for p in food_series.points] == [Decimal("10.00"), 0, Decimal("5.00"), 0]
+
+    quarters = reports.cashflow_series(session, date(2025, 1, 1), date(2025, 6, 30), "quarter")
+    assert [(q.period_start, q.income, q.expenses) for q in quarters] == [
+        (date(2025, 1, 1), Decimal("200.00"), Decimal("15.00")),
+        (date(2025, 4, 1), 0, 0),
+    ]
+
+    (balances,) = reports.account_balance_series(session, date(2025, 2, 1), date(2025, 3, 31), "month")
+    assert [p.value for p in balances.points] == [Decimal("90.00"), Decimal("285.00")]
+
+
+def test_reports_scope_to_one_user(session, ledger):
+    other = User(username="o", password_hash="x")
+    session.add(other)
+    session.flush()
+    other_acct = Account(user_id=other.id, name="Other", type=AccountType.CHECKING,
+                         starting_balance=Decimal("0"), balance=Decimal("0"))
+    session.add(other_acct)
+    session.flush()
+
+    mine = ledger["add_tx"]("-10.00", date(2024, 3, 5), ledger["food"])
+    theirs = ledger["add_tx"]("-99.00", date(2024, 3, 6), ledger["food"], account=other_acct)
+    assert (mine.user_id, theirs.user_id) == (ledger["user"].id, other.id)
+
+    spend = reports.monthly_spend_by_category(session, 2024, 3, user_id=ledger["user"].id)
+    assert [r.spend for r in spend] == [Decimal("10.00")]
+    balances = reports.account_balances(session, user_id=other.id)
+    assert [(b.account_name, b.balance) for b in balances] == [("Other", Decimal("-99.00"))]
+    assert reports.cashflow(session, date(2024, 3, 1), date(2024, 3, 31)).expenses == Decimal("109.00")
@@ -0,0 +1,86 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from sqlalchemy import create_engine, func, inspect, select
+from sqlalchemy.orm import Session
+
+from finance_tracker.controllers import shards
+from finance_tracker.db.archive import attach_archive
+from finance_tracker.db.base import Base
+from finance_tracker.db.sharding import ShardRouter
+from finance_tracker.models import (
+    Account, AccountType, BalanceSnapshot, Category, CategoryType, Transaction, TransactionType, User,
+)
+from finance_tracker.models.rule import CategoryRule
+from finance_tracker.services import archive, reports, snapshots
+
+
+def _seed(eng) -> list[str]:
+    with Session(eng) as s:
+        food = Category(name="Food", type=CategoryType.EXPENSE)
+        s.add(food)
+        s.add(CategoryRule(category=food, pattern="grocer"))  # applies to every user
+        users = []
+        for name, opening in (("ann", "100.00"), ("bob", "50.00")):
+            user = User(username=name, password_hash="x")
+            s.add(user)
+            s.flush()
+            s.add(CategoryRule(user_id=user.id, category=food, pattern=name))
+            for acct_name in ("Checking", "Savings"):
+                acct = Account(user_id=user.id, name=f"{name} {acct_name}", type=AccountType.CHECKING,
+                               starting_balance=Decimal(opening), balance=Decimal(opening))
+                s.add(acct)
+                s.flush()
+                for i, on in enumerate((date(2024, 3, 5), date(2024, 11, 20), date(2025, 2, 1), date(2025, 4, 9))):
+                    s.add(Transaction(account_id=acct.id, category_id=food.id, date=on,
+                                      amount=Decimal(f"-{i + 1}.25"), type=TransactionType.DEBIT))
+            users.append(user.id)
+        s.flush()
+        snapshots.roll_forward(s, date(2025, 3, 31))
+        s.commit()
+    return users
+
+
+def test_split_keeps_every_users_balances(tmp_path):
+    source = create_engine(f"sqlite:///{tmp_path / 'main.db'}")
+    attach_archive(source, tmp_path / "cold.db")
+    Base.metadata.create_all(source)
+    users = _seed(source)
+    assert archive.archive_before(source, date(2025, 1, 1)) == 8
+
+    router = ShardRouter(tmp_path / "shards")
+    shards.split(source, router)
+    assert shards.split(source, router)  # idempotent: a second run replaces the same rows
+
+    assert len(router.shard_keys()) == 2
+    for uid in users:
+        with Session(source) as src, router.session_for(uid) as dst:
+            for as_of in (None, date(2024, 12, 31), date(2025, 3, 31)):
+                assert reports.account_balances(dst, as_of) == reports.account_balances(src, as_of, uid)
+            # archived rows are back in the shard's hot table, next to the copied snapshots
+            assert dst.scalar(select(func.count()).select_from(Transaction)) == 8
+            assert dst.scalar(select(func.count()).select_from(BalanceSnapshot)) == src.scalar(
+                select(func.count()).select_from(BalanceSnapshot)
+                .join(Account, Account.id == BalanceSnapshot.account_id).where(Account.user_id == uid)
+            )
+            assert sorted(r.user_id is None for r in dst.scalars(select(CategoryRule))) == [False, True]
+            assert dst.scalar(select(func.count()).select_from(User)) == 1
+        assert "alembic_version" in inspect(router.engine_for(uid)).get_table_names()
+
+    totals = shards.total_balances(router)
+    with Session(source) as src:
+        assert sum(totals.values(), Decimal("0")) == sum(b.balance for b in reports.account_balances(src))
+    router.dispose()
+    source.dispose()
+
+
+def test_unrouted_writers_refuse_a_sharded_setup(tmp_path, monkeypatch):
+    from finance_tracker.db import sharding
+    from finance_tracker.services.write_queue import WriteQueue
+
+    sharding.require_main_database("test")  # sharding is off in the test config
+    monkeypatch.setattr(sharding, "router", lambda: ShardRouter(tmp_path / "shards"))
+    with pytest.raises(RuntimeError, match=r"\[sharding\] is enabled"):
+        WriteQueue()
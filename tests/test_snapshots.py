@@ -0,0 +1,35 @@
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import select
+
+from finance_tracker.models import BalanceSnapshot
+from finance_tracker.services import reports, snapshots
+
+
+def _balances(session, as_of):
+    return [b.balance for b in reports.account_balances(session, as_of=as_of)]
+
+
+def test_snapshots_track_writes_and_match_a_rebuild(session, ledger):
+    add = ledger["add_tx"]
+    add("-10.00", date(2024, 1, 15))
+    moved = add("-20.00", date(2024, 2, 10))
+    add("50.00", date(2024, 3, 5))
+    assert snapshots.roll_forward(session, through=date(2024, 3, 31)) == 3
+
+    add("-1.00", date(2024, 1, 20))
+    moved.amount, moved.date = Decimal("-25.00"), date(2024, 3, 1)
+    session.flush()
+
+    cumulative = session.execute(select(BalanceSnapshot.month_end, BalanceSnapshot.cumulative)
+                                 .order_by(BalanceSnapshot.month_end)).all()
+    assert [c for _, c in cumulative] == [Decimal("-11.00"), Decimal("-11.00"), Decimal("14.00")]
+    assert _balances(session, date(2024, 2, 29)) == [Decimal("89.00")]
+    assert _balances(session, date(2024, 3, 2)) == [Decimal("64.00")]
+    assert _balances(session, None) == [Decimal("114.00")]
+
+    snapshots.rebuild(session, through=date(2024, 3, 31))
+    rebuilt = session.execute(select(BalanceSnapshot.month_end, BalanceSnapshot.cumulative)
+                              .order_by(BalanceSnapshot.month_end)).all()
+    assert rebuilt == cumulative
@@ -0,0 +1,68 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, func, select
+
+from finance_tracker.models import Account, Transaction, TransactionType
+from finance_tracker.services.write_queue import WriteQueue
+from finance_tracker.ui.services import ledger
+
+
+def _add(amount: str, account_id: str = "acct"):
+    def write(s):
+        tx = Transaction(account_id=account_id, date=date(2024, 5, 1), type=TransactionType.DEBIT,
+                         amount=Decimal(amount), description="q")
+        s.add(tx)
+        s.flush()
+        ledger.recompute_on_commit(s, account_id)
+        return tx.id
+    return write
+
+
+@pytest.fixture
+def counted(factory, monkeypatch):
+    """Counts COMMITs on the engine and balance recomputes per account."""
+    commits, recomputes = [], []
+    event.listen(factory.kw["bind"], "commit", lambda conn: commits.append(1))
+    original = ledger.recompute_account_balance
+    monkeypatch.setattr(ledger, "recompute_account_balance",
+                        lambda s, acct: (recomputes.append(acct.id), original(s, acct)))
+    return commits, recomputes
+
+
+def _balance(factory) -> Decimal:
+    with factory() as s:
+        return s.get(Account, "acct").balance
+
+
+def test_batch_commits_once_and_recomputes_each_account_once(factory, counted):
+    commits, recomputes = counted
+    # a long window and max_batch = the number of writes: all 50 land in one batch
+    with WriteQueue(factory, window=5, max_batch=50) as writes:
+        futures = [writes.submit(_add(f"-{i}.00")) for i in range(1, 51)]
+        ids = [f.result(10) for f in futures]
+
+    assert len(set(ids)) == 50
+    assert len(commits) == 1
+    assert recomputes == ["acct"]
+    assert _balance(factory) == Decimal("-1175.00")
+
+
+def test_failed_write_is_isolated_within_its_batch(factory, counted):
+    commits, recomputes = counted
+    with WriteQueue(factory, window=5, max_batch=11) as writes:
+        futures = [writes.submit(_add(f"-{i}.00")) for i in range(1, 11)]
+        boom = writes.submit(lambda s: (_add("-999.00")(s), 1 / 0))  # its row must not survive
+        ids = [f.result(10) for f in futures]
+        with pytest.raises(ZeroDivisionError):
+            boom.result(10)
+
+    assert len(set(ids)) == 10
+    # the optimistic pass rolls back; the SAVEPOINT replay is the batch's only COMMIT
+    assert len(commits) == 1
+    assert recomputes == ["acct"]
+    assert _balance(factory) == Decimal("45.00")
+    with factory() as s:
+        total = s.scalar(select(func.sum(Transaction.amount)).where(Transaction.account_id == "acct"))
+        assert total == Decimal("-55.00")